@@ -84,6 +84,13 @@ class NetboxZabbixConfig(PluginConfig):
             
         },
         "FERNET_KEY_PATH": "fernet.key",
+        "zabbix_client_max_age": 300,
+        "sync_hosts_workers": 4,
+        "sync_hosts_shards": 1,
+        "diff_host_updates": True,
+        "update_debounce_seconds": 5,
+        "interface_status_cache_ttl": 30,
+        "problems_cache_ttl": 60,
     }
 
     def ready(self):
@@ -94,33 +101,30 @@ class NetboxZabbixConfig(PluginConfig):
         property to Device and VirtualMachine models. The property allows each object
         to access its corresponding HostConfig instance, if one exists.
         
-        The property `host_config` is dynamically added via `add_to_class`.
+        The property `host_config` is dynamically added via `add_to_class`. Its value
+        is cached on the instance, see `netbox_zabbix.netbox.host_config`.
         """
 
         super().ready()
 
-        from django.contrib.contenttypes.models import ContentType
         from dcim.models import Device
         from virtualization.models import VirtualMachine
-        from netbox_zabbix.models import HostConfig
+        from netbox_zabbix.netbox.host_config import (
+            get_host_config,
+            set_cached_host_config,
+            invalidate_host_config,
+        )
 
         # Import and register signals
         from .signals import signals
 
 
-        def get_hostconfig(self):
-            """
-            Retrieve the HostConfig instance associated with this object.
-            
-            Returns:
-                HostConfig or None: The HostConfig instance for the current Device
-                or VirtualMachine, or None if not found.
-            """
-            ct = ContentType.objects.get_for_model( self )
-            return HostConfig.objects.filter( content_type=ct, object_id=self.id ).first()
-
-        Device.add_to_class( "host_config", property( get_hostconfig ) )
-        VirtualMachine.add_to_class( "host_config", property(get_hostconfig) )
+        # The HostConfig is cached per instance. Assigning to the property
+        # sets the cache and `del obj.host_config` invalidates it.
+        host_config = property( get_host_config, set_cached_host_config, invalidate_host_config )
+
+        Device.add_to_class( "host_config", host_config )
+        VirtualMachine.add_to_class( "host_config", host_config )
         
 
 
@@ -113,6 +113,8 @@ class SettingForm(NetBoxModelForm):
         FieldSet( 'zabbix_import_interval',
                   'host_config_sync_interval',
                   'cutoff_host_config_sync',
+                  'drift_detection_interval',
+                  'problems_refresh_interval',
                   'maintenance_cleanup_interval',
                   name="System Jobs" ),
         FieldSet( 'api_endpoint',
@@ -171,6 +173,8 @@ class SettingForm(NetBoxModelForm):
             'zabbix_import_interval',
             'host_config_sync_interval',
             'cutoff_host_config_sync',
+            'drift_detection_interval',
+            'problems_refresh_interval',
             'maintenance_cleanup_interval',
             'api_endpoint',
             'web_address',
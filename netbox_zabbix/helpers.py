@@ -6,6 +6,7 @@ Provides a collection of helper functions.
 
 # Django imports
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 
 # NetBox imports
 from ipam.models import IPAddress
@@ -81,3 +82,32 @@ def lookup_ip_address(address:str):
     return IPAddress.objects.filter( address__startswith=address ).first()
 
 
+class QueryCounter:
+    """
+    Context manager that counts the database queries executed on the
+    current connection.
+
+    Example:
+        with QueryCounter() as queries:
+            build_something()
+        logger.debug( f"Built with {queries.count} queries" )
+    """
+
+    def __init__(self):
+        self.count    = 0
+        self._wrapper = None
+
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute( sql, params, many, context )
+
+
+    def __enter__(self):
+        self._wrapper = connection.execute_wrapper( self )
+        self._wrapper.__enter__()
+        return self
+
+
+    def __exit__(self, *exc_info):
+        return self._wrapper.__exit__( *exc_info )
@@ -15,8 +15,12 @@ These functions are primarily used by background RQ jobs that synchronize
 Zabbix data with NetBox, ensuring consistent host and interface mappings.
 """
 
+# Standard library imports
+from concurrent.futures import ThreadPoolExecutor
+
 # Django imports
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
 
 # NetBox imports
 from ipam.models import IPAddress
@@ -28,11 +32,17 @@ from netbox_zabbix import models
 from netbox_zabbix.importing.context import ImportHostContext
 from netbox_zabbix.helpers import lookup_ip_address
 from netbox_zabbix.zabbix.api import (
+    get_templates,
+    get_item_types,
+    get_proxies,
+    get_proxy_groups,
+    get_host_groups,
     import_templates,
     import_proxies,
     import_proxy_groups,
     import_host_groups
 )
+from netbox_zabbix.zabbix.templates import get_templates_dependencies
 from netbox_zabbix.zabbix.validation import validate_zabbix_host
 from netbox_zabbix.netbox.changelog import log_creation_event
 from netbox_zabbix.netbox.jobs import associate_instance_with_job
@@ -40,11 +50,78 @@ from netbox_zabbix.zabbix.interfaces import normalize_interface
 from netbox_zabbix.logger import logger
 
 
+def _in_thread(func, *args):
+    """
+    Call `func` in a worker thread and close the thread's database
+    connection afterwards.
+    """
+    try:
+        return func( *args )
+    finally:
+        connection.close()
+
+
+def _fetch_templates():
+    """
+    Fetch templates, the item types of all templates and the template
+    dependencies from Zabbix.
+    
+    Returns:
+        tuple: (templates, item_types, dependencies). dependencies is None
+               if they could not be fetched.
+    """
+    templates    = get_templates()
+    template_ids = [ t["templateid"] for t in templates ]
+    item_types   = get_item_types( template_ids )
+
+    try:
+        dependencies = get_templates_dependencies( template_ids )
+    except Exception as e:
+        logger.error( f"Failed to fetch template dependencies: {e}" )
+        dependencies = None
+
+    return templates, item_types, dependencies
+
+
+def fetch_zabbix_settings():
+    """
+    Fetch all Zabbix configuration objects concurrently.
+    
+    The remote reads are independent of each other, so they are issued in
+    parallel and the fetch phase takes about as long as the slowest read.
+    
+    Returns:
+        dict: Remote templates, item types, template dependencies, proxies,
+              proxy groups and host groups.
+    
+    Raises:
+        Exception: If any remote read fails.
+    """
+    with ThreadPoolExecutor( max_workers=4 ) as executor:
+        templates    = executor.submit( _in_thread, _fetch_templates )
+        proxies      = executor.submit( _in_thread, get_proxies )
+        proxy_groups = executor.submit( _in_thread, get_proxy_groups )
+        host_groups  = executor.submit( _in_thread, get_host_groups )
+
+        remote_templates, item_types, dependencies = templates.result()
+        return {
+            "templates":    remote_templates,
+            "item_types":   item_types,
+            "dependencies": dependencies,
+            "proxies":      proxies.result(),
+            "proxy_groups": proxy_groups.result(),
+            "host_groups":  host_groups.result(),
+        }
+
+
 def import_zabbix_settings():
     """
     Imports Zabbix configuration objects into NetBox.
     
     Imports templates, proxies, proxy groups, and host groups from Zabbix.
+    All remote reads are done concurrently up front, see
+    `fetch_zabbix_settings()`, after which the database is updated in a
+    single transaction.
     
     Returns:
         dict: Message confirming import and details of added/deleted objects.
@@ -53,10 +130,15 @@ def import_zabbix_settings():
         Exception: If any import step fails.
     """
     try:
-        added_templates, deleted_templates       = import_templates()
-        added_proxies, deleted_proxies           = import_proxies()
-        added_proxy_groups, deleted_proxy_groups = import_proxy_groups()
-        added_host_groups, deleted_host_groups   = import_host_groups()
+        remote = fetch_zabbix_settings()
+
+        with transaction.atomic():
+            added_templates, deleted_templates       = import_templates( templates=remote["templates"],
+                                                                         item_types=remote["item_types"],
+                                                                         dependencies=remote["dependencies"] )
+            added_proxies, deleted_proxies           = import_proxies( proxies=remote["proxies"] )
+            added_proxy_groups, deleted_proxy_groups = import_proxy_groups( proxy_groups=remote["proxy_groups"] )
+            added_host_groups, deleted_host_groups   = import_host_groups( host_groups=remote["host_groups"] )
 
         return { 
             "message": "imported zabbix configuration", 
@@ -93,7 +175,7 @@ def import_zabbix_host(ctx: ImportHostContext):
         raise Exception( f"Host config for '{ctx.obj_instance.name}' already exists" )
 
     # Create config instance
-    config              = models.HostConfig( name=f"z-{ctx.obj_instance.name}", content_type=ctx.content_type, object_id=ctx.obj_instance.pk )
+    config              = models.HostConfig( name=f"z-{ctx.obj_instance.name}", assigned_object=ctx.obj_instance )
     config.hostid       = int( ctx.zabbix_host["hostid"] )
     config.status       = models.StatusChoices.DISABLED if int( ctx.zabbix_host.get( "status", 0 ) ) else models.StatusChoices.ENABLED
     config.monitored_by = int( ctx.zabbix_host.get( "monitored_by" ) )
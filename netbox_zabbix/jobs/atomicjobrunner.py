@@ -14,6 +14,7 @@ failure visibility.
 """
 
 # Standard library imports
+from contextlib import nullcontext
 from datetime import timedelta
 
 # Django imports
@@ -47,9 +48,11 @@ class AtomicJobRunner(JobRunner):
         making it suitable for retry mechanisms, task chaining, and tests.
     
     Transaction Behavior:
-        - The job execution (`run()`) occurs inside a `transaction.atomic()` block.
+        - By default the job execution (`run()`) occurs inside a `transaction.atomic()` block.
         - If any part of the job fails, the database changes are rolled back.
         - This guarantees consistency between the job's result and its side effects.
+        - With `atomic = False` there is no outer block. Changes committed
+          before a failure are kept and the failed job's message says so.
     
     Additional Features:
         - Stores structured `job.data` on both success and failure to preserve context.
@@ -58,8 +61,27 @@ class AtomicJobRunner(JobRunner):
     Usage:
         Subclass this instead of JobRunner when external failure visibility and
         transactional integrity are required.
+
+        Jobs that manage their own, shorter transactions (for example one per
+        host) can set `atomic = False` to run without the outer
+        `transaction.atomic()` block.
     """
 
+    # Wrap `run()` in a single transaction.atomic() block
+    atomic = True
+
+
+    @classmethod
+    def _transaction(cls):
+        """
+        Return the transaction context `run()` is executed in.
+        
+        Returns:
+            ContextManager: `transaction.atomic()` if `cls.atomic` is set, otherwise a no-op context.
+        """
+        return transaction.atomic() if cls.atomic else nullcontext()
+
+
     @classmethod
     def handle(cls, job, *args, **kwargs):
         """
@@ -72,9 +94,9 @@ class AtomicJobRunner(JobRunner):
         
         Behavior:
             - Calls `job.start()`.
-            - Executes `cls(job).run(*args, **kwargs)` within a `transaction.atomic()` block.
+            - Executes `cls(job).run(*args, **kwargs)` within a `transaction.atomic()` block unless `cls.atomic` is False.
             - Updates `job.data` and terminates the job with success or failure status.
-            - Logs the event via `_log_event()`.
+            - Logs the event via `_log_event()`. Successful runs are not logged if `eventlog=False` is passed.
             - Reschedules the job if `job.interval` is set.
         
         Raises:
@@ -86,7 +108,7 @@ class AtomicJobRunner(JobRunner):
         
         try:
             job.start()
-            with transaction.atomic():
+            with cls._transaction():
                 result = cls(job).run( *args, **kwargs ) or {}
                 job.data = { 
                     "status":     "success", 
@@ -97,7 +119,8 @@ class AtomicJobRunner(JobRunner):
                     "post_data":  result.get( "post_data" ),
                 }
                 job.terminate( status=JobStatusChoices.STATUS_COMPLETED )
-            cls._log_event( name=job.name, job=job, result=result, signal_id=signal_id )
+            if kwargs.get( "eventlog", True ):
+                cls._log_event( name=job.name, job=job, result=result, signal_id=signal_id )
 
         except Exception as e:
             error_msg = str( e )
@@ -108,7 +131,7 @@ class AtomicJobRunner(JobRunner):
             job.data = {
                 "status":     "failed",
                 "error":      error_msg,
-                "message":    "Database changes have been reverted automatically.",
+                "message":    "Database changes have been reverted automatically." if cls.atomic else "Changes made before the failure were kept.",
                 "signal_id":  signal_id,
                 "data":       data,
                 "pre_data":   pre_data,
@@ -161,7 +184,7 @@ class AtomicJobRunner(JobRunner):
         exception = None
 
         try:
-            with transaction.atomic():
+            with cls._transaction():
                 result = cls.run( *args, **kwargs ) or {}
         except Exception as e:
             exception = str( e )
@@ -16,6 +16,16 @@ These jobs handle payload preparation, host validation, and error handling,
 ensuring safe interaction between NetBox and Zabbix.
 """
 
+# Standard library imports
+from datetime import timedelta
+
+# Django imports
+from django.conf import settings as plugin_settings
+from django.core.cache import cache
+from django.utils import timezone
+
+# NetBox imports
+from core.models import Job
 
 # NetBox Zabbix Imports
 from netbox_zabbix.jobs.atomicjobrunner import AtomicJobRunner
@@ -42,6 +52,83 @@ from netbox_zabbix.exceptions import ExceptionWithData
 from netbox_zabbix.logger import logger
 
 
+# Default when PLUGINS_CONFIG does not set 'update_debounce_seconds'
+DEFAULT_UPDATE_DEBOUNCE_SECONDS = 5
+
+# Seconds a pending-update marker outlives its debounce window, so a lost
+# job does not block updates of the host forever
+UPDATE_PENDING_GRACE = 300
+
+# Cache keys of the coalescing layer, formatted with the HostConfig pk
+UPDATE_PENDING_KEY = "netbox_zabbix_update_pending_{}"
+UPDATE_MERGED_KEY  = "netbox_zabbix_update_merged_{}"
+
+
+def get_update_debounce_seconds():
+    """
+    Return the debounce window of signal-triggered host updates.
+
+    Returns:
+        int: Value of 'update_debounce_seconds' in the plugin configuration.
+    """
+    config = plugin_settings.PLUGINS_CONFIG.get( "netbox_zabbix", {} )
+    return max( 0, int( config.get( "update_debounce_seconds", DEFAULT_UPDATE_DEBOUNCE_SECONDS ) ) )
+
+
+def claim_pending_update(host_config_id, timeout):
+    """
+    Claim the pending-update marker of a HostConfig.
+
+    `cache.add()` is atomic, so only one caller wins the marker.
+
+    Args:
+        host_config_id (int): Primary key of the HostConfig.
+        timeout (int): Seconds until the marker expires.
+
+    Returns:
+        bool: True if the marker was claimed, False if an update is already pending.
+    """
+    return cache.add( UPDATE_PENDING_KEY.format( host_config_id ), 0, timeout )
+
+
+def merge_pending_update(host_config_id, timeout):
+    """
+    Count a request as merged into the pending update of a HostConfig.
+
+    Args:
+        host_config_id (int): Primary key of the HostConfig.
+        timeout (int): Seconds until the counter expires.
+
+    Returns:
+        tuple[int | None, int]: Pk of the pending job (if known) and the merged count.
+    """
+    merged_key = UPDATE_MERGED_KEY.format( host_config_id )
+    cache.add( merged_key, 0, timeout )
+    try:
+        merged = cache.incr( merged_key )
+    except ValueError:
+        # The counter expired between add() and incr()
+        cache.set( merged_key, 1, timeout )
+        merged = 1
+    return cache.get( UPDATE_PENDING_KEY.format( host_config_id ) ) or None, merged
+
+
+def release_pending_update(host_config_id):
+    """
+    Clear the pending-update marker of a HostConfig and return its merged count.
+
+    Args:
+        host_config_id (int): Primary key of the HostConfig.
+
+    Returns:
+        int: Number of requests merged into the pending update.
+    """
+    merged_key = UPDATE_MERGED_KEY.format( host_config_id )
+    merged     = cache.get( merged_key, 0 )
+    cache.delete_many( [ UPDATE_PENDING_KEY.format( host_config_id ), merged_key ] )
+    return merged
+
+
 class CreateZabbixHost( AtomicJobRunner ):
     """
     Job to create a new Zabbix host from a HostConfig.
@@ -147,15 +234,30 @@ class UpdateZabbixHost( AtomicJobRunner ):
         user              = kwargs.get( "user" )
         request_id        = kwargs.get( "request_id" )
         
+        force             = kwargs.get( "force", False )
+
+        # Release the pending marker before loading the host, so changes
+        # made from now on schedule a new job instead of merging into this one.
+        merged = 0
+        if kwargs.get( "coalesced", False ):
+            merged = release_pending_update( host_config_id )
+
         host_config = models.HostConfig.objects.get( id=host_config_id )
-        return update_zabbix_host( host_config, user, request_id )
+        result = update_zabbix_host( host_config, user, request_id, force=force )
+        if merged:
+            logger.info( "update of %s ran once for %s merged requests", host_config.name, merged + 1 )
+        return { **result, "merged": merged }
 
 
     @classmethod
-    def run_job(cls, host_config, request, user=None, schedule_at=None, interval=None, immediate=False, name=None, signal_id=None):
+    def run_job(cls, host_config, request, user=None, schedule_at=None, interval=None, immediate=False, name=None, signal_id=None, coalesced=False):
         """
         Enqueues an UpdateZabbixHost job.
         
+        Args:
+            coalesced (bool, optional): The job was scheduled by
+                `run_job_debounced` and releases the pending marker when it runs.
+        
         Returns:
             Job: Enqueued job instance.
         """
@@ -176,6 +278,9 @@ class UpdateZabbixHost( AtomicJobRunner ):
             "signal_id":       signal_id,
             "host_config_id":  host_config.id,
         }
+
+        if coalesced:
+            job_args["coalesced"] = True
         
         if request:
             job_args["user"]       = request.user
@@ -192,11 +297,70 @@ class UpdateZabbixHost( AtomicJobRunner ):
         return netbox_job
 
 
+    @classmethod
+    def run_job_debounced(cls, host_config, request, user=None, name=None, signal_id=None):
+        """
+        Enqueues an UpdateZabbixHost job, coalescing duplicate requests per HostConfig.
+        
+        The first request schedules a job 'update_debounce_seconds' into the
+        future. Requests for the same HostConfig that arrive while that job is
+        pending are merged into it and only counted. The job loads the
+        HostConfig when it runs, so it always pushes the latest state, and
+        reports the number of merged requests as `merged` in its result.
+        
+        A debounce window of 0 enqueues every request immediately.
+        
+        Args:
+            host_config (HostConfig): Host to update.
+            request (HttpRequest): Triggering request.
+            user (User, optional): User initiating the update.
+            name (str, optional): Job name.
+            signal_id (str, optional): Signal identifier for event correlation.
+        
+        Returns:
+            Job | None: The scheduled job, or the pending job the request was
+                        merged into (None if it can no longer be found).
+        """
+        if not isinstance( host_config, models.HostConfig ):
+            raise ValueError( "host_config must be an instance of HostConfig" )
+
+        debounce = get_update_debounce_seconds()
+        if debounce == 0:
+            return cls.run_job( host_config=host_config, request=request, user=user, name=name, signal_id=signal_id )
+
+        timeout = debounce + UPDATE_PENDING_GRACE
+
+        if not claim_pending_update( host_config.pk, timeout ):
+            job_pk, merged = merge_pending_update( host_config.pk, timeout )
+            logger.debug( "[%s] merged update of %s into pending job (%s merged)", signal_id, host_config.name, merged )
+            return Job.objects.filter( pk=job_pk ).first() if job_pk else None
+
+        try:
+            netbox_job = cls.run_job(
+                host_config=host_config,
+                request=request,
+                user=user,
+                schedule_at=timezone.now() + timedelta( seconds=debounce ),
+                name=name,
+                signal_id=signal_id,
+                coalesced=True,
+            )
+        except Exception:
+            release_pending_update( host_config.pk )
+            raise
+
+        cache.set( UPDATE_PENDING_KEY.format( host_config.pk ), netbox_job.pk, timeout )
+        return netbox_job
+
+
     @classmethod
     def run_job_now(cls, host_config, request, name=None):
         """
         Immediately updates a Zabbix host.
         
+        The host is always pushed, even if its payload fingerprint is
+        unchanged, since it may have been edited directly in Zabbix.
+        
         Args:
             host_config (HostConfig): Host to update.
             request (HttpRequest): Triggering request.
@@ -214,7 +378,8 @@ class UpdateZabbixHost( AtomicJobRunner ):
             host_config_id=host_config.id,
             user=request.user,
             request_id=request.id,
-            name=name
+            name=name,
+            force=True
         )
 
 
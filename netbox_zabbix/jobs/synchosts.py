@@ -1,69 +1,277 @@
-
 """
 NetBox Zabbix Plugin - Immediate Host Sync Job
 
-This module defines the `SyncHostsNow` job, which can be executed to 
+This module defines the `SyncHostsNow` job, which can be executed to
 synchronize all NetBox `HostConfig` objects with their corresponding
 hosts in Zabbix immediately.
 
-Unlike recurring jobs, this job runs on demand and iterates over all 
-host configurations, calling `update_zabbix_host` for each.
+Unlike recurring jobs, this job runs on demand and iterates over all
+host configurations, calling `update_zabbix_host` for each. Hosts can
+be synchronized by a bounded pool of worker threads, each host in its
+own short transaction.
 
 Any errors encountered during the sync of individual hosts are logged
-and raised to ensure visibility of failures.
+and collected in the job result to ensure visibility of failures.
+
+`UpdateZabbixHosts` reuses the same machinery to update the batch of
+hosts touched by one committed transaction.
 """
 
+# Standard library imports
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+# Django imports
+from django.conf import settings as plugin_settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
+
+# NetBox imports
+from core.choices import JobStatusChoices
+from core.models import Job
 
 # NetBox Zabbix Imports
 from netbox_zabbix.jobs.atomicjobrunner import AtomicJobRunner
+from netbox_zabbix.jobs.base import require_kwargs
+from netbox_zabbix.jobs.host import (
+    UPDATE_PENDING_GRACE,
+    UPDATE_PENDING_KEY,
+    get_update_debounce_seconds,
+    claim_pending_update,
+    merge_pending_update,
+    release_pending_update,
+)
 from netbox_zabbix.models import HostConfig
 from netbox_zabbix.zabbix.hosts import update_zabbix_host
+from netbox_zabbix.zabbix.api import get_hosts_by_ids
+from netbox_zabbix.zabbix.builders import build_payloads, prefetch_host_configs
 from netbox_zabbix.logger import logger
 
 
+# Default number of worker threads when PLUGINS_CONFIG does not set 'sync_hosts_workers'
+DEFAULT_SYNC_HOSTS_WORKERS = 4
+
+# Default number of shard jobs when PLUGINS_CONFIG does not set 'sync_hosts_shards'
+DEFAULT_SYNC_HOSTS_SHARDS = 1
+
+# Number of slowest hosts whose timings are kept in the job data
+SLOWEST_HOSTS = 20
+
+
+def get_sync_hosts_workers():
+    """
+    Return the number of worker threads used by SyncHostsNow.
+
+    Returns:
+        int: Value of 'sync_hosts_workers' in the plugin configuration.
+    """
+    config = plugin_settings.PLUGINS_CONFIG.get( "netbox_zabbix", {} )
+    return max( 1, int( config.get( "sync_hosts_workers", DEFAULT_SYNC_HOSTS_WORKERS ) ) )
+
+
+def get_sync_hosts_shards():
+    """
+    Return the number of shard jobs a fan-out sync is split into.
+
+    Returns:
+        int: Value of 'sync_hosts_shards' in the plugin configuration.
+    """
+    config = plugin_settings.PLUGINS_CONFIG.get( "netbox_zabbix", {} )
+    return max( 1, int( config.get( "sync_hosts_shards", DEFAULT_SYNC_HOSTS_SHARDS ) ) )
+
+
+def shard_pk_ranges(pks, shards):
+    """
+    Split a sorted list of primary keys into contiguous, evenly sized ranges.
+
+    Args:
+        pks (list[int]): Sorted primary keys.
+        shards (int): Number of ranges to create.
+
+    Returns:
+        list[tuple[int, int]]: Inclusive (pk_min, pk_max) pairs. Empty ranges are omitted.
+    """
+    shards = max( 1, min( int( shards ), len( pks ) ) )
+    size, rest = divmod( len( pks ), shards )
+    ranges = []
+    start = 0
+    for i in range( shards ):
+        end = start + size + ( 1 if i < rest else 0 )
+        if end > start:
+            ranges.append( ( pks[start], pks[end - 1] ) )
+        start = end
+    return ranges
+
+
 class SyncHostsNow(AtomicJobRunner):
     """
     Job to synchronize all NetBox hosts to Zabbix.
-    
+
     This job loops over all HostConfig objects and updates each one
-    in Zabbix. Execution occurs inside a transactional context, so
-    any failures will roll back database changes.
+    in Zabbix. The job does not run inside one long transaction;
+    instead every host is updated in its own transaction, so a failure
+    only rolls back the database changes of that host.
     """
 
+    # Every host gets its own transaction, see sync_host()
+    atomic = False
+
+
+    @classmethod
+    def sync_host(cls, host_config, user, request_id, pre_data=None, payload=None, force=True):
+        """
+        Update a single host in Zabbix and refresh its sync status.
+
+        Args:
+            host_config (HostConfig): The host to synchronize.
+            user (User): The triggering user.
+            request_id (str): Request identifier for logging.
+            pre_data (dict, optional): Prefetched Zabbix host.
+            payload (dict, optional): Prebuilt update payload.
+            force (bool, optional): Update the host even if its payload
+                fingerprint has not changed.
+
+        Returns:
+            dict: Host pk, name, duration in seconds and error (None on success).
+        """
+        started = time.monotonic()
+        error = None
+        try:
+            with transaction.atomic():
+                update_zabbix_host( host_config, user, request_id, pre_data=pre_data, payload=payload, force=force )
+                host_config.update_sync_status()
+        except Exception as e:
+            error = str( e )
+
+        return {
+            "pk":       host_config.pk,
+            "name":     host_config.name,
+            "duration": round( time.monotonic() - started, 3 ),
+            "error":    error,
+        }
+
+
+    @classmethod
+    def _worker(cls, work, results, user, request_id, force=True):
+        """
+        Drain the work queue in a worker thread.
+
+        Each thread uses its own database connection, which is closed
+        when the queue is empty.
+        """
+        try:
+            while True:
+                try:
+                    host_config, pre_data, payload = work.get_nowait()
+                except queue.Empty:
+                    return
+                results.append( cls.sync_host( host_config, user, request_id, pre_data, payload, force ) )
+        finally:
+            connection.close()
+
+
     @classmethod
     def run(cls, *args, **kwargs):
         """
         Execute the host synchronization.
-        
+
         Args:
             user (User, optional): The triggering user.
             request_id (str, optional): Request identifier for logging.
-        
+            workers (int, optional): Number of worker threads. Defaults to
+                'sync_hosts_workers' in the plugin configuration. 1 runs serially.
+            pk_min (int, optional): Only sync HostConfigs with pk >= pk_min.
+            pk_max (int, optional): Only sync HostConfigs with pk <= pk_max.
+            pks (list[int], optional): Only sync these HostConfigs.
+            force (bool, optional): Update hosts even if their payload
+                fingerprint has not changed. Defaults to True.
+
         Returns:
-            dict: Summary of host sync results.
+            dict: Summary of host sync results, with the timings of the
+                  SLOWEST_HOSTS slowest hosts and all failures in 'data'.
         """
         user = kwargs.get( "user" )
         request_id = kwargs.get( "request_id" )
+        workers = max( 1, int( kwargs.get( "workers" ) or get_sync_hosts_workers() ) )
 
-        total = HostConfig.objects.count()
-        updated = 0
-        failed = 0
+        pk_min = kwargs.get( "pk_min" )
+        pk_max = kwargs.get( "pk_max" )
+        pks    = kwargs.get( "pks" )
+        force  = kwargs.get( "force", True )
 
-        for idx, host_config in enumerate( HostConfig.objects.all(), start=1 ):
-            try:
-                update_zabbix_host( host_config, user, request_id )
-                host_config.update_sync_status()
-                updated += 1
-            except Exception as e:
-                failed += 1
-                msg = f"[{idx}/{total}] Failed to update host {host_config.name} (pk={host_config.pk}): {e}"
-                logger.error( msg )
+        host_configs = HostConfig.objects.all()
+        if pk_min is not None:
+            host_configs = host_configs.filter( pk__gte=pk_min )
+        if pk_max is not None:
+            host_configs = host_configs.filter( pk__lte=pk_max )
+        if pks is not None:
+            host_configs = host_configs.filter( pk__in=pks )
+
+        # Load all related NetBox data up front
+        host_configs = prefetch_host_configs( host_configs )
+        total = len( host_configs )
+
+        # Fetch the current state of all hosts from Zabbix up front
+        try:
+            zabbix_hosts = get_hosts_by_ids( hc.hostid for hc in host_configs )
+        except Exception as e:
+            logger.warning( f"Bulk fetch of Zabbix hosts failed, falling back to per host lookups: {e}" )
+            zabbix_hosts = {}
+
+        payloads = build_payloads( host_configs, for_update=True, pre_data=zabbix_hosts )
+
+        work = [ ( hc, zabbix_hosts.get( str( hc.hostid ) ) if hc.hostid else None, payloads.get( hc.pk ) ) for hc in host_configs ]
+
+        started = time.monotonic()
+        if workers == 1 or total <= 1:
+            results = [ cls.sync_host( hc, user, request_id, pre_data, payload, force ) for hc, pre_data, payload in work ]
+        else:
+            work_queue = queue.Queue()
+            for item in work:
+                work_queue.put( item )
+
+            results = []
+            with ThreadPoolExecutor( max_workers=min( workers, total ) ) as executor:
+                futures = [ executor.submit( cls._worker, work_queue, results, user, request_id, force ) for _ in range( min( workers, total ) ) ]
+
+            worker_errors = []
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error( f"Sync worker failed: {e}" )
+                    worker_errors.append( str( e ) )
+
+            # Hosts without a result were lost by a failed worker
+            if worker_errors:
+                done = { r["pk"] for r in results }
+                results.extend(
+                    { "pk": hc.pk, "name": hc.name, "duration": 0, "error": f"Sync worker failed: {worker_errors[0]}" }
+                    for hc in host_configs if hc.pk not in done
+                )
+        duration = time.monotonic() - started
+
+        failures = [ r for r in results if r["error"] ]
+        for idx, failure in enumerate( failures, start=1 ):
+            logger.error( f"[{idx}/{len( failures )}] Failed to update host {failure['name']} (pk={failure['pk']}): {failure['error']}" )
+
+        failed = len( failures )
+        updated = len( results ) - failed
 
         return {
             "total": total,
             "updated": updated,
             "failed": failed,
-            "message": f"Sync complete: {updated}/{total} hosts updated, {failed} failed."
+            "workers": workers,
+            "duration": round( duration, 2 ),
+            "message": f"Sync complete: {updated}/{total} hosts updated, {failed} failed.",
+            "data": {
+                "failures": failures,
+                "timings":  sorted( results, key=lambda r: r["duration"], reverse=True )[:SLOWEST_HOSTS],
+            },
         }
 
     @classmethod
@@ -78,4 +286,283 @@ class SyncHostsNow(AtomicJobRunner):
             dict: Job execution summary.
         """
         # Call `run` directly, bypassing the single-instance expectations of `run_now`
-        return cls.run(user=request.user, request_id=request.id)
\ No newline at end of file
+        return cls.run(user=request.user, request_id=request.id)
+
+
+
+class UpdateZabbixHosts(SyncHostsNow):
+    """
+    Job to update a batch of Zabbix hosts.
+
+    Enqueued once per committed transaction by the signal handlers with all
+    HostConfigs touched by the transaction. The hosts are updated like in
+    `SyncHostsNow`, but hosts whose payload fingerprint has not changed are
+    skipped.
+    """
+
+    class Meta:
+        name = "Update hosts in Zabbix"
+
+
+    @classmethod
+    def run(cls, *args, **kwargs):
+        """
+        Update the hosts in Zabbix.
+
+        Args:
+            pks (list[int]): Primary keys of the HostConfigs to update.
+
+        Returns:
+            dict: Summary of host update results, see `SyncHostsNow.run`,
+                  with the number of merged update requests in 'merged'.
+        """
+        pks = require_kwargs( kwargs, "pks" )
+
+        # Release the pending markers before loading the hosts, see UpdateZabbixHost.run()
+        merged = 0
+        if kwargs.get( "coalesced", False ):
+            merged = sum( release_pending_update( pk ) for pk in pks )
+
+        result = super().run( *args, **{ **kwargs, "pks": pks, "force": False } )
+        result["merged"] = merged
+        return result
+
+
+    @classmethod
+    def run_job(cls, host_configs, request=None, user=None, signal_id=None):
+        """
+        Enqueue a batched update of the given hosts.
+
+        Hosts that already have an update pending (see
+        `UpdateZabbixHost.run_job_debounced`) are merged into that update and
+        left out of the batch. The job is scheduled 'update_debounce_seconds'
+        into the future.
+
+        Args:
+            host_configs (Iterable[HostConfig]): Hosts to update.
+            request (HttpRequest, optional): The triggering request.
+            user (User, optional): The triggering user, if there is no request.
+            signal_id (str, optional): Signal identifier for event correlation.
+
+        Returns:
+            Job | None: Enqueued job instance, or None if every host already
+                        had an update pending.
+        """
+        debounce = get_update_debounce_seconds()
+        timeout  = debounce + UPDATE_PENDING_GRACE
+        pks      = sorted( { hc.pk for hc in host_configs } )
+
+        if debounce:
+            claimed = [ pk for pk in pks if claim_pending_update( pk, timeout ) ]
+            for pk in set( pks ) - set( claimed ):
+                merge_pending_update( pk, timeout )
+            if len( claimed ) < len( pks ):
+                logger.debug( "[%s] merged %s host updates into pending jobs", signal_id, len( pks ) - len( claimed ) )
+            pks = claimed
+
+        if not pks:
+            return None
+
+        job_args = {
+            "name":        f"{cls.Meta.name} ({len( pks )} hosts)",
+            "schedule_at": timezone.now() + timedelta( seconds=debounce ) if debounce else None,
+            "signal_id":   signal_id,
+            "pks":         pks,
+            "coalesced":   bool( debounce ),
+        }
+        if request:
+            job_args["user"]       = request.user
+            job_args["request_id"] = request.id
+        elif user:
+            job_args["user"] = user
+
+        try:
+            netbox_job = cls.enqueue( **job_args )
+        except Exception:
+            if debounce:
+                for pk in pks:
+                    release_pending_update( pk )
+            raise
+
+        if debounce:
+            cache.set_many( { UPDATE_PENDING_KEY.format( pk ): netbox_job.pk for pk in pks }, timeout )
+        return netbox_job
+
+
+class SyncHostsFanOut(AtomicJobRunner):
+    """
+    Job that splits a full host sync into shard jobs.
+
+    The HostConfig pk space is split into contiguous ranges and one
+    `SyncHostsNow` job is enqueued per range, so the sync is spread over
+    all available RQ workers. A `CollectSyncHostsShards` job waits for the
+    shard jobs and writes one aggregated EventLog entry.
+    """
+
+    class Meta:
+        name = "Sync all hosts (fan-out)"
+
+
+    @classmethod
+    def run(cls, *args, **kwargs):
+        """
+        Enqueue one shard job per pk range and the collector job.
+
+        Args:
+            shards (int, optional): Number of shard jobs. Defaults to
+                'sync_hosts_shards' in the plugin configuration.
+            workers (int, optional): Worker threads per shard job.
+            user (User, optional): The triggering user.
+            request_id (str, optional): Request identifier for logging.
+            poll_interval (int, optional): Seconds between collector checks.
+
+        Returns:
+            dict: Message and the ids of the enqueued shard jobs.
+        """
+        user          = kwargs.get( "user" )
+        request_id    = kwargs.get( "request_id" )
+        workers       = kwargs.get( "workers" )
+        shards        = int( kwargs.get( "shards" ) or get_sync_hosts_shards() )
+        poll_interval = int( kwargs.get( "poll_interval" ) or CollectSyncHostsShards.POLL_INTERVAL )
+
+        pks    = list( HostConfig.objects.order_by( "pk" ).values_list( "pk", flat=True ) )
+        ranges = shard_pk_ranges( pks, shards )
+
+        child_ids = []
+        for idx, ( pk_min, pk_max ) in enumerate( ranges, start=1 ):
+            child = SyncHostsNow.enqueue(
+                name=f"Sync hosts shard {idx}/{len( ranges )}",
+                user=user,
+                request_id=request_id,
+                workers=workers,
+                pk_min=pk_min,
+                pk_max=pk_max,
+                eventlog=False,
+            )
+            child_ids.append( child.pk )
+
+        CollectSyncHostsShards.enqueue(
+            name=f"{cls.Meta.name} collect",
+            user=user,
+            schedule_at=timezone.now() + timedelta( seconds=poll_interval ),
+            child_job_ids=child_ids,
+            total=len( pks ),
+            started=timezone.now().isoformat(),
+            poll_interval=poll_interval,
+            eventlog=False,
+        )
+
+        return {
+            "message": f"Queued {len( child_ids )} shard jobs to sync {len( pks )} hosts.",
+            "data": { "jobs": child_ids },
+        }
+
+
+    @classmethod
+    def run_job(cls, request=None, shards=None, workers=None):
+        """
+        Enqueue a fan-out sync of all hosts.
+
+        Args:
+            request (HttpRequest, optional): The triggering request.
+            shards (int, optional): Number of shard jobs.
+            workers (int, optional): Worker threads per shard job.
+
+        Returns:
+            Job: Enqueued job instance.
+        """
+        job_args = {
+            "name":     cls.Meta.name,
+            "shards":   shards,
+            "workers":  workers,
+            "eventlog": False,
+        }
+        if request:
+            job_args["user"]       = request.user
+            job_args["request_id"] = request.id
+
+        return cls.enqueue( **job_args )
+
+
+class CollectSyncHostsShards(AtomicJobRunner):
+    """
+    Job that waits for the shard jobs of a fan-out sync and logs one
+    aggregated EventLog entry.
+
+    The job does not block an RQ worker while waiting; if shard jobs are
+    still running it re-enqueues itself `poll_interval` seconds later.
+    """
+
+    # Seconds between checks for finished shard jobs
+    POLL_INTERVAL = 15
+
+    # Give up waiting for shard jobs after this many minutes
+    MAX_WAIT = 240
+
+
+    @classmethod
+    def run(cls, *args, **kwargs):
+        """
+        Aggregate the shard results once all shard jobs have finished.
+
+        Args:
+            child_job_ids (list[int]): Ids of the shard jobs.
+            total (int): Number of HostConfigs in the fan-out.
+            started (str): ISO timestamp of the fan-out start.
+            poll_interval (int): Seconds between checks.
+
+        Returns:
+            dict: Aggregated summary, or a waiting message.
+        """
+        child_ids     = require_kwargs( kwargs, "child_job_ids" )
+        started       = datetime.fromisoformat( kwargs.get( "started" ) )
+        poll_interval = int( kwargs.get( "poll_interval" ) or cls.POLL_INTERVAL )
+        now           = timezone.now()
+
+        jobs     = list( Job.objects.filter( pk__in=child_ids ) )
+        finished = [ j for j in jobs if j.status in JobStatusChoices.TERMINAL_STATE_CHOICES ]
+        timed_out = now - started > timedelta( minutes=cls.MAX_WAIT )
+
+        if len( finished ) < len( child_ids ) and not timed_out:
+            cls.enqueue(
+                name=cls.job.name,
+                user=cls.job.user,
+                schedule_at=now + timedelta( seconds=poll_interval ),
+                **kwargs,
+            )
+            return { "message": f"Waiting for {len( child_ids ) - len( finished )}/{len( child_ids )} shard jobs." }
+
+        updated  = 0
+        failed   = 0
+        failures = []
+        errored  = []
+        for job in finished:
+            data   = job.data or {}
+            result = data.get( "result" ) or {}
+            if data.get( "status" ) != "success":
+                errored.append( { "job": job.pk, "error": data.get( "error", job.error ) } )
+                continue
+            updated  += result.get( "updated", 0 )
+            failed   += result.get( "failed", 0 )
+            failures += ( result.get( "data" ) or {} ).get( "failures", [] )
+
+        unfinished = [ j.pk for j in jobs if j not in finished ]
+        total      = kwargs.get( "total", updated + failed )
+        duration   = ( now - started ).total_seconds()
+
+        result = {
+            "message": f"Sync complete: {updated}/{total} hosts updated, {failed} failed, "
+                       f"{len( child_ids )} shards ({len( errored )} errored, {len( unfinished )} unfinished).",
+            "data": {
+                "total":      total,
+                "updated":    updated,
+                "failed":     failed,
+                "shards":     child_ids,
+                "duration":   round( duration, 2 ),
+                "failures":   failures,
+                "errored":    errored,
+                "unfinished": unfinished,
+            },
+        }
+        cls._log_event( name=SyncHostsFanOut.Meta.name, job=cls.job, result=result )
+        return result
@@ -9,6 +9,12 @@ up to date in NetBox without manual intervention.
 Classes:
     - ImportZabbixSystemJob: Periodically imports Zabbix settings into NetBox
       on a configurable recurring interval.
+    - SystemJobMaintenanceCleanup: Deletes expired maintenances and refreshes
+      the maintenance membership index.
+    - SystemJobDetectDrift: Reads the Zabbix audit log and refreshes the sync
+      status of the hosts that were changed in Zabbix.
+    - SystemJobRefreshProblems: Caches the active Zabbix problems of all
+      hosts for the problem badges and tabs.
 
 These jobs are typically scheduled automatically and managed by NetBox’s
 background task system using the RQ job queue.
@@ -16,6 +22,7 @@ background task system using the RQ job queue.
 
 # Standard library imports
 from datetime import timedelta
+import time
 
 # Django imports
 from django.utils import timezone
@@ -28,7 +35,10 @@ from core.models import Job
 # NetBox Zabbix plugin imports
 from netbox_zabbix.jobs.atomicjobrunner import AtomicJobRunner
 from netbox_zabbix.importing import import_zabbix_settings
-from netbox_zabbix.models import HostConfig, Maintenance
+from netbox_zabbix.models import HostConfig, Maintenance, refresh_maintenance_memberships
+from netbox_zabbix.zabbix.api import get_hosts_by_ids, get_audit_log, get_api_userid, DEFAULT_AUDIT_LOG_LIMIT
+from netbox_zabbix.zabbix.builders import build_payloads, prefetch_host_configs
+from netbox_zabbix.netbox.problems import refresh_all_problems
 from netbox_zabbix import settings
 from netbox_zabbix.logger import logger
 
@@ -130,11 +140,71 @@ class SystemJobHostConfigSyncRefresh( AtomicJobRunner ):
     class Meta:
         name = "System Job HostConfig Sync Refresh"
 
+    # Number of HostConfigs processed per slice
+    BATCH_SIZE = 500
+
+    @classmethod
+    def refresh_slice(cls, pks, now):
+        """
+        Refresh the sync status of one slice of HostConfigs.
+        
+        The payloads of the slice are built with `build_payloads`, the
+        matching Zabbix hosts are fetched in bulk, every host is compared in
+        memory and the result is written back with a single bulk update.
+        
+        Args:
+            pks (list[int]): Primary keys of the HostConfigs in the slice.
+            now (datetime): Timestamp stored in `last_sync_update`.
+        
+        Returns:
+            tuple[int, int]: Number of updated and failed HostConfigs.
+        """
+        from netbox_zabbix.netbox.compare import compare_host_configuration
+
+        host_configs = prefetch_host_configs( HostConfig.objects.filter( pk__in=pks ) )
+        payloads     = build_payloads( host_configs, for_update=True )
+
+        try:
+            zabbix_hosts = get_hosts_by_ids( hc.hostid for hc in host_configs )
+        except Exception as e:
+            logger.warning( f"Bulk fetch of Zabbix hosts failed, falling back to per host lookups: {e}" )
+            zabbix_hosts = None
+
+        changed = []
+        failed  = 0
+        for host in host_configs:
+            zabbix_host = None
+            if zabbix_hosts is not None:
+                zabbix_host = zabbix_hosts.get( str( host.hostid ), {} ) if host.hostid else {}
+            try:
+                result = compare_host_configuration( host, zabbix_host=zabbix_host, payload=payloads.get( host.pk ) )
+            except Exception as e:
+                failed += 1
+                logger.warning( f"Failed to update sync for HostConfig {host.pk}: {e}" )
+                continue
+
+            host.in_sync          = not result.get( "differ", False )
+            host.last_sync_update = now
+            host.sync_dirty       = False
+            if not host.in_sync:
+                # Zabbix no longer matches the last payload pushed
+                host.payload_fingerprint = None
+            changed.append( host )
+
+        # bulk_update does not send any signals
+        HostConfig.objects.bulk_update( changed, [ "in_sync", "last_sync_update", "payload_fingerprint", "sync_dirty" ] )
+        return len( changed ), failed
+
+
     @classmethod
     def run(cls, *args, **kwargs):
         """
         Update HostConfig objects that haven't been checked recently.
         
+        Stale and dirty HostConfigs are processed in slices of `batch_size`,
+        see `refresh_slice`. With `dirty_only=True` only HostConfigs marked
+        dirty by drift detection are processed.
+        
         Returns:
             dict: Summary of updated hosts.
         
@@ -147,6 +217,7 @@ class SystemJobHostConfigSyncRefresh( AtomicJobRunner ):
 
 
         cutoff = kwargs.get( "cutoff", None )
+        batch_size = max( 1, int( kwargs.get( "batch_size" ) or cls.BATCH_SIZE ) )
         now = timezone.now()
 
         if isinstance( cutoff, int ):
@@ -155,19 +226,24 @@ class SystemJobHostConfigSyncRefresh( AtomicJobRunner ):
         if cutoff is None:
             cutoff = now - timedelta( minutes=settings.get_cutoff_host_config_sync() )
 
-        host_configs = HostConfig.objects.filter(  Q( last_sync_update__lt=cutoff ) 
-                                                 | Q( last_sync_update__isnull=True ) )
+        if kwargs.get( "dirty_only", False ):
+            host_configs = HostConfig.objects.filter( sync_dirty=True )
+        else:
+            host_configs = HostConfig.objects.filter(  Q( last_sync_update__lt=cutoff ) 
+                                                     | Q( last_sync_update__isnull=True )
+                                                     | Q( sync_dirty=True ) )
         cutoff_in_minutes = int( ( now - cutoff).total_seconds() / 60 )
 
-        total = host_configs.count()
+        pks = list( host_configs.order_by( "pk" ).values_list( "pk", flat=True ) )
+        total = len( pks )
 
-        for i, host in enumerate( host_configs, start=1 ):
-            try:
-                host.update_sync_status()
-                updated += 1
-            except Exception as e:
-                failed += 1
-                logger.warning( f"[{i}/{total}] Failed to update {host.name}: {e}" )
+        started = time.monotonic()
+        for start in range( 0, total, batch_size ):
+            slice_updated, slice_failed = cls.refresh_slice( pks[start:start + batch_size], now )
+            updated += slice_updated
+            failed  += slice_failed
+            logger.debug( f"[{min( start + batch_size, total )}/{total}] HostConfig sync status refreshed" )
+        duration = time.monotonic() - started
 
         return {
             "total":             total,
@@ -175,6 +251,8 @@ class SystemJobHostConfigSyncRefresh( AtomicJobRunner ):
             "failed":            failed,
             "cutoff_in_minutes": cutoff_in_minutes,
             "cutoff":            cutoff.strftime("%Y-%m-%d %H:%M"),
+            "duration":          round( duration, 2 ),
+            "hosts_per_second":  round( total / duration, 2 ) if duration > 0 else total,
         }
 
     @classmethod
@@ -217,11 +295,257 @@ class SystemJobHostConfigSyncRefresh( AtomicJobRunner ):
 
 
 
+@register_system_job(settings.get_drift_detection_interval)
+class SystemJobDetectDrift( AtomicJobRunner ):
+    """
+    System job that detects hosts changed directly in Zabbix.
+    
+    The Zabbix audit log is read from a persisted watermark. Hosts with new
+    entries (host, interface and template linkage changes) are marked dirty
+    and only those are compared, so the cost follows the number of changes
+    instead of the size of the fleet.
+    """
+
+    class Meta:
+        name = "System Job Detect Drift"
+
+    # Chunk size for marking HostConfigs dirty
+    MARK_CHUNK_SIZE = 1000
+
+    # Maximum number of audit log pages read per run
+    MAX_AUDIT_LOG_PAGES = 10
+
+    @classmethod
+    def read_audit_log(cls, watermark, limit=DEFAULT_AUDIT_LOG_LIMIT):
+        """
+        Read the audit log from the watermark, page by page.
+        
+        Pages continue from the clock of their last entry. Entries at that
+        clock are read again and skipped by their auditid. If a full page
+        holds a single second, all entries of that second are read in one
+        call and the next page starts after it, so the watermark always
+        moves on.
+        
+        Args:
+            watermark (int): Unix timestamp to read from.
+            limit (int, optional): Number of entries per page.
+        
+        Returns:
+            tuple[list[dict], int, bool]: The entries, the new watermark and
+                whether the page limit was reached before the end of the log.
+        """
+        entries = []
+        seen    = set()
+
+        for _ in range( cls.MAX_AUDIT_LOG_PAGES ):
+            page = get_audit_log( watermark, limit=limit )
+            entries.extend( entry for entry in page if entry["auditid"] not in seen )
+            seen.update( entry["auditid"] for entry in page )
+
+            if len( page ) < limit:
+                if page:
+                    watermark = max( int( entry["clock"] ) for entry in page )
+                return entries, watermark, False
+
+            last = max( int( entry["clock"] ) for entry in page )
+            if last == watermark:
+                second = get_audit_log( watermark, limit=None, time_till=watermark )
+                entries.extend( entry for entry in second if entry["auditid"] not in seen )
+                seen.update( entry["auditid"] for entry in second )
+                last = watermark + 1
+            watermark = last
+
+        return entries, watermark, True
+
+    @classmethod
+    def mark_dirty(cls, hostids):
+        """
+        Mark the HostConfigs of the given Zabbix hosts as needing a compare.
+        
+        The payload fingerprint is cleared as well, since the host in Zabbix
+        no longer matches the last payload pushed.
+        
+        Args:
+            hostids (Iterable[str]): Zabbix host IDs.
+        
+        Returns:
+            int: Number of HostConfigs marked dirty.
+        """
+        ids = sorted( { int( hostid ) for hostid in hostids } )
+        marked = 0
+        for start in range( 0, len( ids ), cls.MARK_CHUNK_SIZE ):
+            # update() does not send any signals
+            marked += HostConfig.objects.filter( hostid__in=ids[start:start + cls.MARK_CHUNK_SIZE] ).update( sync_dirty=True, payload_fingerprint=None )
+        return marked
+
+
+    @classmethod
+    def run(cls, *args, **kwargs):
+        """
+        Read new audit log entries, mark the affected HostConfigs dirty and
+        refresh their sync status.
+        
+        The first run only records the current time as watermark. Entries
+        made by the plugin's own API user are ignored, since they record
+        updates pushed from NetBox.
+        
+        Returns:
+            dict: Summary of the drift detection.
+        """
+        watermark = settings.get_audit_log_watermark()
+        now = int( time.time() )
+
+        if watermark is None:
+            settings.set_audit_log_watermark( now )
+            return { "message": "Drift detection initialized", "watermark": now }
+
+        entries, new_watermark, truncated = cls.read_audit_log( watermark )
+
+        try:
+            own_userid = get_api_userid()
+        except Exception as e:
+            logger.warning( f"Failed to look up the Zabbix API user, audit log entries of the plugin are not ignored: {e}" )
+            own_userid = None
+
+        changes = [ entry for entry in entries if own_userid is None or str( entry.get( "userid" ) ) != own_userid ]
+        hostids = { entry["resourceid"] for entry in changes if entry.get( "resourceid" ) }
+        marked = cls.mark_dirty( hostids )
+
+        # Continue from the last entry seen. Entries at that second are read
+        # again next time, which only marks the same hosts once more.
+        if new_watermark != watermark:
+            watermark = new_watermark
+            settings.set_audit_log_watermark( watermark )
+
+        refresh = SystemJobHostConfigSyncRefresh.run( dirty_only=True ) if marked else {}
+
+        return {
+            "message":   f"{len( entries )} audit log entries, {len( changes )} made outside the plugin, {marked} hosts marked dirty",
+            "entries":   len( entries ),
+            "changes":   len( changes ),
+            "hosts":     len( hostids ),
+            "marked":    marked,
+            "truncated": truncated,
+            "watermark": watermark,
+            "refresh":   refresh,
+        }
+
+
+    @classmethod
+    def schedule(cls, interval=None):
+        """
+        Schedule this system job at a recurring interval.
+        
+        Args:
+            interval (int): Interval in minutes.
+        
+        Returns:
+            Job: Scheduled job instance.
+        """
+
+        if interval is None:
+            logger.error( "Drift Detection requires an interval" )
+            return None
+
+        name = cls.Meta.name
+        jobs = Job.objects.filter( name=name, status__in=["scheduled", "pending", "running"] )
+        existing_job = jobs[0] if jobs.exists() else None
+
+        if existing_job:
+            if existing_job.interval == interval:
+                logger.error( f"No need to update interval for system job {name}" )
+                return existing_job
+            logger.error( f"Deleting old job instance for '{name}'" )
+            existing_job.delete()
+
+        job_args = {
+            "name":        name,
+            "interval":    interval,
+            "schedule_at": timezone.now() + timedelta( minutes=interval ),
+        }
+
+        job = cls.enqueue_once( **job_args )
+        logger.error( f"Scheduled new system job '{name}' with interval {interval}" )
+        return job
+
+
+
+
+@register_system_job(settings.get_problems_refresh_interval)
+class SystemJobRefreshProblems( AtomicJobRunner ):
+    """
+    System job that caches the active Zabbix problems of all hosts.
+    
+    The problems are fetched in bulk and stored in the Django cache indexed
+    by hostid, where the problem badges and tabs read them.
+    """
+
+    class Meta:
+        name = "System Job Refresh Problems"
+
+    @classmethod
+    def run(cls, *args, **kwargs):
+        """
+        Fetch the problems of all HostConfigs with a Zabbix hostid and cache them.
+        
+        Returns:
+            dict: Number of hosts refreshed and number of active problems.
+        """
+        result = refresh_all_problems()
+        return {
+            "message": f"Cached {result['problems']} problems of {result['hosts']} hosts",
+            **result,
+        }
+
+
+    @classmethod
+    def schedule(cls, interval=None):
+        """
+        Schedule this system job at a recurring interval.
+        
+        Args:
+            interval (int): Interval in minutes.
+        
+        Returns:
+            Job: Scheduled job instance.
+        """
+
+        if interval is None:
+            logger.error( "Problems Refresh requires an interval" )
+            return None
+
+        name = cls.Meta.name
+        jobs = Job.objects.filter( name=name, status__in=["scheduled", "pending", "running"] )
+        existing_job = jobs[0] if jobs.exists() else None
+
+        if existing_job:
+            if existing_job.interval == interval:
+                logger.error( f"No need to update interval for system job {name}" )
+                return existing_job
+            logger.error( f"Deleting old job instance for '{name}'" )
+            existing_job.delete()
+
+        job_args = {
+            "name":        name,
+            "interval":    interval,
+            "schedule_at": timezone.now() + timedelta( minutes=interval ),
+        }
+
+        job = cls.enqueue_once( **job_args )
+        logger.error( f"Scheduled new system job '{name}' with interval {interval}" )
+        return job
+
+
+
+
 @register_system_job(settings.get_maintenance_cleanup_interval)
 class SystemJobMaintenanceCleanup( AtomicJobRunner ):
     """
     System job to clean up Zabbix Maintenance windows
     from both NetBox and Zabbix.
+
+    The job also rebuilds the maintenance membership index, so changes to
+    the sites, host groups, proxies or clusters of hosts are picked up.
     """
 
     class Meta:
@@ -230,7 +554,8 @@ class SystemJobMaintenanceCleanup( AtomicJobRunner ):
     @classmethod
     def run(cls, *args, **kwargs):
         """
-        Delete all expired maintenances whose end_time <= now.
+        Delete all expired maintenances whose end_time <= now and refresh
+        the membership of the remaining maintenances.
         """
 
         now = timezone.now()
@@ -244,9 +569,12 @@ class SystemJobMaintenanceCleanup( AtomicJobRunner ):
                 logger.info( f"Deleted expired maintenance: {m.name}" )
             except Exception as e:
                 logger.warning( f"Failed to delete maintenance {m.name}: {e}" )
+
+        refreshed = refresh_maintenance_memberships()
         
         return {
             "deleted": deleted,
+            "refreshed": refreshed,
             "checked": expired_maintenances.count(),
             "timestamp": now.strftime( "%Y-%m-%d %H:%M:%S" )
         }
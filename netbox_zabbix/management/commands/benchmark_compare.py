@@ -0,0 +1,59 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from netbox_zabbix.netbox.compare import _list_difference, _list_difference_pairwise
+
+
+def make_lists(size):
+    """
+    Return two lists of interface-like dicts of `size` items that overlap by half.
+    """
+    items = [ { "type": "1", "ip": f"10.{i // 65536}.{i // 256 % 256}.{i % 256}", "port": "10050" } for i in range( size + size // 2 ) ]
+    return items[:size], items[size // 2:]
+
+
+def best_of(func, obj_a, obj_b, repeat):
+    """
+    Return the best timing of `repeat` runs and the result of the last run.
+    """
+    timings = []
+    result = None
+    for _ in range( repeat ):
+        started = time.perf_counter()
+        result = func( obj_a, obj_b )
+        timings.append( time.perf_counter() - started )
+    return min( timings ), result
+
+
+class Command(BaseCommand):
+    help = "Benchmark the set based list diff of the host comparison against the pairwise diff"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[10, 100, 1000, 5000],
+            help="List lengths to benchmark."
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Runs per size and implementation. The best run is reported."
+        )
+
+    def handle(self, *args, **options):
+        repeat = max( 1, options["repeat"] )
+
+        for size in options["sizes"]:
+            obj_a, obj_b = make_lists( size )
+
+            pairwise, expected = best_of( _list_difference_pairwise, obj_a, obj_b, repeat )
+            set_based, actual  = best_of( _list_difference, obj_a, obj_b, repeat )
+            if actual != expected:
+                raise CommandError( f"Set based list diff differs from pairwise diff for size {size}" )
+
+            speedup = f"{pairwise / set_based:.1f}x" if set_based else "-"
+            self.stdout.write( f"{size:>7} items: pairwise {pairwise:.6f}s, set based {set_based:.6f}s, speedup {speedup}" )
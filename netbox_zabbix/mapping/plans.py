@@ -0,0 +1,380 @@
+"""
+NetBox Zabbix Plugin — Compiled Mapping Plans
+
+This module compiles the tag and inventory mappings into accessor plans
+that are reused for every Device or VirtualMachine.
+
+A plan holds:
+
+- A precomputed getter for every enabled field path
+- The mapping tags as a set of primary keys
+- The `select_related` and `prefetch_related` lookups implied by all enabled
+  paths, so callers can load the objects with everything the plan touches
+
+Plans are cached per process and shared between threads. A version stamp
+stored in the Django cache is bumped by `invalidate_mapping_plans()` when a
+mapping is saved or deleted and the transaction commits, which makes every
+process recompile its plans.
+"""
+
+# Standard library imports
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+
+# Django imports
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db import transaction
+
+# NetBox imports
+from dcim.models import Device
+from virtualization.models import VirtualMachine
+
+# NetBox Zabbix Imports
+from netbox_zabbix import models
+from netbox_zabbix.zabbix.inventory_properties import inventory_properties
+from netbox_zabbix.logger import logger
+
+
+# Cache key holding the current version of the mapping plans
+MAPPING_PLANS_VERSION_KEY = "netbox_zabbix_mapping_plans_version"
+
+# Seconds between checks of the version stamp in the Django cache
+MAPPING_PLANS_VERSION_CHECK_INTERVAL = 5
+
+# Models that mappings can be defined for
+MAPPING_OBJECT_MODELS = {
+    "device":         Device,
+    "virtualmachine": VirtualMachine,
+}
+
+
+# ------------------------------------------------------------------------------
+# Path Compilation
+# ------------------------------------------------------------------------------
+
+
+def compile_path(path):
+    """
+    Compile a dotted attribute path into a getter.
+
+    The getter behaves like `helpers.resolve_attribute_path` but splits the
+    path only once.
+
+    Args:
+        path (str): Dotted attribute path, e.g. "site.name" or "tags".
+
+    Returns:
+        callable: Function taking an object and returning the resolved value,
+            a list if the value has `all()`, or None if missing.
+    """
+    parts = tuple( path.split( "." ) )
+
+    def getter(obj):
+        try:
+            for part in parts:
+                obj = getattr( obj, part )
+                if obj is None:
+                    return None
+
+            if hasattr( obj, "all" ) and callable( obj.all ):
+                return list( obj.all() )
+            return obj
+        except AttributeError:
+            return None
+
+    return getter
+
+
+def path_lookups(model, path):
+    """
+    Return the related lookups needed to resolve a path without lazy loads.
+
+    Forward foreign keys are followed with `select_related`. The first
+    many-valued relation (e.g. tags) and everything below it is prefetched.
+
+    Args:
+        model (Model): Model class the path starts from.
+        path (str): Dotted attribute path.
+
+    Returns:
+        tuple[str | None, str | None]: The select_related and prefetch_related lookups.
+    """
+    lookup = []
+    for part in path.split( "." ):
+        try:
+            field = model._meta.get_field( part )
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation or field.related_model is None:
+            break
+
+        lookup.append( part )
+        if not ( field.many_to_one or field.one_to_one ):
+            return ( "__".join( lookup[:-1] ) or None, "__".join( lookup ) )
+        model = field.related_model
+
+    return ( "__".join( lookup ) or None, None )
+
+
+# ------------------------------------------------------------------------------
+# Plans
+# ------------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class TagPlan:
+    """
+    Compiled TagMapping.
+
+    Attributes:
+        object_type (str): 'device' or 'virtualmachine'.
+        tag_ids (frozenset[int]): Primary keys of the mapping tags.
+        fields (tuple): (name, getter) pairs of the enabled fields.
+        select_related (frozenset[str]): Lookups to select for the mapped objects.
+        prefetch_related (frozenset[str]): Lookups to prefetch for the mapped objects.
+    """
+    object_type:      str
+    tag_ids:          frozenset
+    fields:           tuple
+    select_related:   frozenset
+    prefetch_related: frozenset
+
+
+@dataclass(frozen=True)
+class InventoryPlan:
+    """
+    Compiled InventoryMapping.
+
+    Attributes:
+        object_type (str): 'device' or 'virtualmachine'.
+        fields (tuple): (invkey, getters) pairs of the enabled fields. The
+            first getter that returns a value wins.
+        select_related (frozenset[str]): Lookups to select for the mapped objects.
+        prefetch_related (frozenset[str]): Lookups to prefetch for the mapped objects.
+    """
+    object_type:      str
+    fields:           tuple
+    select_related:   frozenset
+    prefetch_related: frozenset
+
+
+def _collect_lookups(model, paths):
+    """
+    Collect the select_related and prefetch_related lookups of many paths.
+
+    Args:
+        model (Model): Model class the paths start from.
+        paths (Iterable[str]): Dotted attribute paths.
+
+    Returns:
+        tuple[frozenset, frozenset]: The select_related and prefetch_related lookups.
+    """
+    select, prefetch = set(), set()
+    for path in paths:
+        if not path:
+            continue
+        select_lookup, prefetch_lookup = path_lookups( model, path )
+        if select_lookup:
+            select.add( select_lookup )
+        if prefetch_lookup:
+            prefetch.add( prefetch_lookup )
+    return frozenset( select ), frozenset( prefetch )
+
+
+def compile_tag_mapping(mapping):
+    """
+    Compile a TagMapping into a TagPlan.
+
+    Enabled fields without a path are left out of the plan.
+
+    Args:
+        mapping (TagMapping): The mapping to compile.
+
+    Returns:
+        TagPlan: The compiled plan.
+    """
+    model  = MAPPING_OBJECT_MODELS[mapping.object_type]
+    fields = [ ( field.get( "name" ), field.get( "value" ) ) for field in mapping.selection if field.get( "enabled" ) and field.get( "value" ) ]
+    select, prefetch = _collect_lookups( model, [ path for _, path in fields ] )
+
+    return TagPlan(
+        object_type=mapping.object_type,
+        tag_ids=frozenset( tag.pk for tag in mapping.tags.all() ),
+        fields=tuple( ( name, compile_path( path ) ) for name, path in fields ),
+        select_related=select,
+        prefetch_related=prefetch | { "tags" },
+    )
+
+
+def compile_inventory_mapping(mapping):
+    """
+    Compile an InventoryMapping into an InventoryPlan.
+
+    Illegal inventory properties are logged and left out of the plan, as are
+    empty paths.
+
+    Args:
+        mapping (InventoryMapping): The mapping to compile.
+
+    Returns:
+        InventoryPlan: The compiled plan.
+    """
+    model  = MAPPING_OBJECT_MODELS[mapping.object_type]
+    fields = []
+    paths  = []
+    for field in mapping.selection:
+        if not field.get( "enabled" ):
+            continue
+
+        invkey = str( field.get( "invkey" ) )
+        if invkey not in inventory_properties:
+            logger.error( f"{invkey} is not a legal inventory property" )
+            continue
+
+        field_paths = [ path for path in field.get( "paths" ) or [] if path ]
+        fields.append( ( invkey, tuple( compile_path( path ) for path in field_paths ) ) )
+        paths.extend( field_paths )
+
+    select, prefetch = _collect_lookups( model, paths )
+
+    return InventoryPlan(
+        object_type=mapping.object_type,
+        fields=tuple( fields ),
+        select_related=select,
+        prefetch_related=prefetch,
+    )
+
+
+def compile_mapping_plans():
+    """
+    Compile all tag and inventory mappings in two queries.
+
+    Returns:
+        dict: {"tags": {object_type: TagPlan}, "inventory": {object_type: InventoryPlan}}
+    """
+    return {
+        "tags":      { m.object_type: compile_tag_mapping( m ) for m in models.TagMapping.objects.prefetch_related( "tags" ) },
+        "inventory": { m.object_type: compile_inventory_mapping( m ) for m in models.InventoryMapping.objects.all() },
+    }
+
+
+# ------------------------------------------------------------------------------
+# Process-wide Cache
+# ------------------------------------------------------------------------------
+
+
+_lock    = threading.Lock()
+_plans   = None
+_version = None
+_checked = 0.0
+
+
+def get_mapping_plans():
+    """
+    Return the cached mapping plans, recompiling them if they have been invalidated.
+
+    The version stamp in the Django cache is checked at most every
+    MAPPING_PLANS_VERSION_CHECK_INTERVAL seconds.
+
+    Returns:
+        dict: {"tags": {object_type: TagPlan}, "inventory": {object_type: InventoryPlan}}
+    """
+    global _plans, _version, _checked
+
+    now = time.monotonic()
+    with _lock:
+        if _plans is not None and now - _checked < MAPPING_PLANS_VERSION_CHECK_INTERVAL:
+            return _plans
+
+    version = cache.get( MAPPING_PLANS_VERSION_KEY )
+    with _lock:
+        if _plans is not None and version == _version:
+            _checked = now
+            return _plans
+
+    plans = compile_mapping_plans()
+
+    with _lock:
+        _plans   = plans
+        _version = version
+        _checked = now
+    return plans
+
+
+def get_tag_plan(object_type):
+    """
+    Return the compiled TagMapping of an object type.
+
+    Args:
+        object_type (str): 'device' or 'virtualmachine'.
+
+    Returns:
+        TagPlan | None: The plan, or None if there is no mapping.
+    """
+    return get_mapping_plans()["tags"].get( object_type )
+
+
+def get_inventory_plan(object_type):
+    """
+    Return the compiled InventoryMapping of an object type.
+
+    Args:
+        object_type (str): 'device' or 'virtualmachine'.
+
+    Returns:
+        InventoryPlan | None: The plan, or None if there is no mapping.
+    """
+    return get_mapping_plans()["inventory"].get( object_type )
+
+
+def get_object_lookups(object_type, plans=None):
+    """
+    Return the lookups needed to build tags and inventory for an object type.
+
+    Args:
+        object_type (str): 'device' or 'virtualmachine'.
+        plans (dict, optional): Mapping plans, see `get_mapping_plans`.
+
+    Returns:
+        tuple[set[str], set[str]]: The select_related and prefetch_related lookups.
+    """
+    plans    = plans or get_mapping_plans()
+    select   = set()
+    prefetch = { "tags" }
+    for plan in ( plans["tags"].get( object_type ), plans["inventory"].get( object_type ) ):
+        if plan is not None:
+            select   |= plan.select_related
+            prefetch |= plan.prefetch_related
+    return select, prefetch
+
+
+def _reset_mapping_plans():
+    """
+    Drop the mapping plans of this process.
+    """
+    global _plans
+
+    with _lock:
+        _plans = None
+
+
+def invalidate_mapping_plans():
+    """
+    Invalidate the mapping plans in all processes.
+    
+    The plans of this process are dropped immediately. The shared version
+    stamp is bumped when the current transaction commits, so other processes
+    do not recompile their plans from uncommitted rows.
+    """
+    def bump():
+        cache.set( MAPPING_PLANS_VERSION_KEY, uuid.uuid4().hex, None )
+        _reset_mapping_plans()
+
+    _reset_mapping_plans()
+    transaction.on_commit( bump )
+
+
+# end
@@ -14,6 +14,8 @@ content type framework where needed.
 from cryptography.fernet import Fernet
 from pathlib import Path
 import os
+import threading
+import time
 
 # Django imports
 from django.core.exceptions import ValidationError
@@ -23,7 +25,8 @@ from django.urls import reverse
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import Q, Exists, OuterRef
+from django.db.models.functions import Now
 from django.conf import settings as plugin_settings
 
 
@@ -342,6 +345,120 @@ class ZabbixAdminPermission(NetBoxModel):
     pass
 
 
+# ------------------------------------------------------------------------------
+# Fernet Key Cache
+# ------------------------------------------------------------------------------
+
+
+# Seconds between checks of the Fernet key file modification time
+FERNET_KEY_CHECK_INTERVAL = 5
+
+_fernet_lock    = threading.Lock()
+_fernet_cache   = { "path": None, "mtime": None, "checked": 0.0, "fernet": None }
+_token_cache    = {}
+
+
+def _resolve_fernet_key_file():
+    """
+    Resolve the Fernet key file from the FERNET_KEY_PATH plugin setting.
+    A path that is not an existing file is treated as relative to the plugin directory.
+
+    Returns:
+        Path | None: The key file, or None if FERNET_KEY_PATH is not configured.
+    """
+    fernet_path_setting = PLUGIN_SETTINGS.get( "FERNET_KEY_PATH", None )
+    if not fernet_path_setting:
+        return None
+
+    key_file = Path( fernet_path_setting )
+    if not key_file.is_file():
+        # Not an existing file treat as relative to plugin dir
+        key_file = Path( os.path.dirname( os.path.realpath( __file__ ) ) ) / key_file
+    return key_file
+
+
+def get_cached_fernet():
+    """
+    Return a cached Fernet instance for the configured key file.
+
+    The key file is stat'ed at most every FERNET_KEY_CHECK_INTERVAL seconds and
+    only re-read when its modification time changes. Decrypted tokens are
+    dropped whenever the key changes.
+
+    Returns:
+        Fernet | None: The Fernet instance, or None if no key is available.
+    """
+    now = time.monotonic()
+    with _fernet_lock:
+        if _fernet_cache["path"] is not None and now - _fernet_cache["checked"] < FERNET_KEY_CHECK_INTERVAL:
+            return _fernet_cache["fernet"]
+
+        key_file = _resolve_fernet_key_file()
+        if key_file is None:
+            logger.warning( "FERNET_KEY_PATH not configured in plugin settings" )
+            return None
+
+        try:
+            mtime = key_file.stat().st_mtime
+        except OSError:
+            mtime = None
+
+        _fernet_cache["checked"] = now
+        if key_file == _fernet_cache["path"] and mtime == _fernet_cache["mtime"]:
+            return _fernet_cache["fernet"]
+
+        fernet = None
+        if mtime is None:
+            logger.warning( f"No Fernet key found at {key_file}" )
+        else:
+            key    = key_file.read_text().strip()
+            fernet = Fernet( key.encode() )
+
+        _fernet_cache.update( path=key_file, mtime=mtime, fernet=fernet )
+        _token_cache.clear()
+        return fernet
+
+
+def decrypt_token(fernet, encrypted_token):
+    """
+    Decrypt an encrypted token, caching the result per encrypted value.
+
+    Args:
+        fernet (Fernet): The Fernet instance returned by get_cached_fernet().
+        encrypted_token (str): The encrypted token.
+
+    Returns:
+        str | None: The decrypted token, or None if decryption fails.
+    """
+    with _fernet_lock:
+        if encrypted_token in _token_cache:
+            return _token_cache[encrypted_token]
+
+    try:
+        token = fernet.decrypt( encrypted_token.encode() ).decode()
+    except Exception:
+        token = None
+
+    with _fernet_lock:
+        if fernet is _fernet_cache["fernet"]:
+            _token_cache[encrypted_token] = token
+    return token
+
+
+def invalidate_token_cache(encrypted_token=None):
+    """
+    Drop a cached decrypted token, or all of them if no token is given.
+
+    Args:
+        encrypted_token (str, optional): The encrypted token to drop.
+    """
+    with _fernet_lock:
+        if encrypted_token is None:
+            _token_cache.clear()
+        else:
+            _token_cache.pop( encrypted_token, None )
+
+
 # ------------------------------------------------------------------------------
 # Setting
 # ------------------------------------------------------------------------------
@@ -402,6 +519,19 @@ class Setting(NetBoxModel):
                                                                blank=True, 
                                                                default=60, 
                                                                help_text="Number of minutes to look back when determining which HostConfigs need syncing with Zabbix. Includes never-synced or outdated objects." )
+    drift_detection_interval = models.PositiveIntegerField( verbose_name="Drift Detection Interval", 
+                                                               null=True, 
+                                                               blank=True, 
+                                                               choices=SystemJobIntervalChoices, 
+                                                               default=SystemJobIntervalChoices.INTERVAL_EVERY_15_MINUTES, 
+                                                               help_text="Interval in minutes between checks of the Zabbix audit log for host changes made in Zabbix. Must be at least 1 minute." )
+    problems_refresh_interval = models.PositiveIntegerField( verbose_name="Problems Refresh Interval", 
+                                                               null=True, 
+                                                               blank=True, 
+                                                               choices=SystemJobIntervalChoices, 
+                                                               default=SystemJobIntervalChoices.INTERVAL_EVERY_5_MINUTES, 
+                                                               help_text="Interval in minutes between each refresh of the cached Zabbix problems of all hosts. Must be at least 1 minute." )
+    audit_log_watermark = models.PositiveBigIntegerField( verbose_name="Audit Log Watermark", null=True, blank=True, editable=False, help_text="Zabbix clock of the last audit log entry processed by drift detection." )
     maintenance_cleanup_interval = models.PositiveIntegerField( verbose_name="Maintenance cleanup Interval", 
                                                                null=True, 
                                                                blank=True, 
@@ -563,31 +693,9 @@ class Setting(NetBoxModel):
     def get_fernet(self):
         """
         Return a Fernet instance if the key exists.
+        The instance is cached per process, see get_cached_fernet().
         """
-
-
-        dir_path = os.path.dirname( os.path.realpath( __file__ ) )
-        fernet_path_setting = PLUGIN_SETTINGS.get( "FERNET_KEY_PATH", None )
-
-        if not fernet_path_setting:
-            logger.warning( "FERNET_KEY_PATH not configured in plugin settings" )
-            return None
-        
-        key_file = Path( fernet_path_setting )
-        if not key_file.is_file():
-            # Not an existing file treat as relative to plugin dir
-            key_file = Path( dir_path ) / key_file
-        
-        if not key_file.exists():
-            logger.warning( f"No Fernet key found at {key_file}" )
-            return None
-    
-        if not key_file.exists():
-            logger.warning( f"No Fernet key found at {key_file}" )
-            return None
-    
-        key = key_file.read_text().strip()
-        return Fernet( key.encode() )
+        return get_cached_fernet()
 
 
 
@@ -596,15 +704,13 @@ class Setting(NetBoxModel):
         fernet = self.get_fernet()
         if not self._encrypted_token or not fernet:
             return None
-        try:
-            return fernet.decrypt( self._encrypted_token.encode() ).decode()
-        except Exception:
-            return None
+        return decrypt_token( fernet, self._encrypted_token )
 
 
     @token.setter
     def token(self, value):
         fernet = self.get_fernet()
+        invalidate_token_cache( self._encrypted_token )
         
         if value is None or not fernet:
             self._encrypted_token = None
@@ -634,11 +740,27 @@ class Setting(NetBoxModel):
 
         super().save( *args, **kwargs )
 
+        # Settings have changed, bump the settings snapshot version
+        from netbox_zabbix.settings import invalidate_settings_snapshot
+        invalidate_settings_snapshot()
+
         # Schedule system jobs
         from netbox_zabbix.jobs.system import schedule_system_jobs
         schedule_system_jobs()
 
 
+    def delete(self, *args, **kwargs):
+        """
+        Delete the Setting instance and invalidate the settings snapshot.
+        """
+        result = super().delete( *args, **kwargs )
+
+        # Prevent circular imports
+        from netbox_zabbix.settings import invalidate_settings_snapshot
+        invalidate_settings_snapshot()
+        return result
+
+
 # ------------------------------------------------------------------------------
 # Template
 # ------------------------------------------------------------------------------
@@ -1842,6 +1964,8 @@ class HostConfig(NetBoxModel, JobsMixin):
     status           = models.IntegerField( choices=StatusChoices.choices, default=StatusChoices.ENABLED, help_text="Host monitoring status." )
     in_sync          = models.BooleanField( default=False, help_text="True if host configuration is in sync with Zabbix." )
     last_sync_update = models.DateTimeField( null=True, blank=True, help_text="Timestamp when sync status was last updated." )
+    payload_fingerprint = models.CharField( max_length=64, null=True, blank=True, editable=False, help_text="Hash of the last payload pushed to Zabbix." )
+    sync_dirty       = models.BooleanField( default=False, editable=False, help_text="True if the host has changed in Zabbix and needs to be compared." )
     host_groups      = models.ManyToManyField( HostGroup, help_text="Assigned Host Groups." )
     templates        = models.ManyToManyField( Template,  help_text="Assigned Tempalates.", blank=True )
     monitored_by     = models.IntegerField( choices=MonitoredByChoices, default=MonitoredByChoices.ZabbixServer, help_text="Monitoring source for the host." )
@@ -1852,6 +1976,9 @@ class HostConfig(NetBoxModel, JobsMixin):
     object_id        = models.PositiveIntegerField()
     assigned_object  = GenericForeignKey( "content_type", "object_id" )
 
+    # Fields that decide which maintenances, besides host groups, include the host
+    MAINTENANCE_SCOPE_FIELDS = ( "monitored_by", "proxy_id", "proxy_group_id", "content_type_id", "object_id" )
+
 
     def __str__(self):
         """
@@ -1864,6 +1991,35 @@ class HostConfig(NetBoxModel, JobsMixin):
         return f"{self.name}"
 
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Load an instance and remember its maintenance scope, see
+        `maintenance_scope_changed()`.
+        """
+        instance = super().from_db( db, field_names, values )
+        instance._loaded_maintenance_scope = instance.get_maintenance_scope()
+        return instance
+
+
+    def get_maintenance_scope(self):
+        """
+        Return the values of MAINTENANCE_SCOPE_FIELDS, None if any is deferred.
+        """
+        if any( field not in self.__dict__ for field in self.MAINTENANCE_SCOPE_FIELDS ):
+            return None
+        return tuple( self.__dict__[field] for field in self.MAINTENANCE_SCOPE_FIELDS )
+
+
+    def maintenance_scope_changed(self):
+        """
+        Return True if the maintenance scope differs from the one loaded from
+        the database, or if it is unknown.
+        """
+        loaded = getattr( self, "_loaded_maintenance_scope", None )
+        return loaded is None or loaded != self.get_maintenance_scope()
+
+
     @property
     def has_agent_interface(self):
         """Return True if this host has at least one AgentInterface assigned."""
@@ -1888,41 +2044,42 @@ class HostConfig(NetBoxModel, JobsMixin):
         """
         Return all active Maintenance objects that include this HostConfig
         (either directly or indirectly through sites, host groups, proxy groups, or clusters).
+
+        Membership is evaluated live, not read from the MaintenanceMembership
+        index, since it guards editing and deleting the host.
         """
-        from netbox_zabbix.models import Maintenance  # avoid circular import
-        now = timezone.now()
-    
-        # Start with active maintenance windows
-        maintenances = Maintenance.objects.filter(
-            start_time__lte=now,
-            end_time__gte=now
-        )
-    
-        # Filter to those that include this host
-        result = []
-        for m in maintenances:
-            if self in m.get_matching_host_configs():
-                result.append( m )
-        return result
+        maintenances = Maintenance.objects.filter( start_time__lte=Now(), end_time__gte=Now() )
+        return [ m for m in maintenances if m.get_matching_host_configs().filter( pk=self.pk ).exists() ]
 
 
     @property
     def in_maintenance(self):
-        """Return True if this host is currently under any maintenance window."""
+        """
+        Return True if this host is currently under any maintenance window.
+
+        Uses the `maintenance_active` annotation (see `in_maintenance_exists()`)
+        if present, as done for lists. Otherwise membership is evaluated live.
+        """
+        if "maintenance_active" in self.__dict__:
+            return self.maintenance_active
         return bool( self.active_maintenances )
 
 
-    def get_in_sync_status(self):
+    def get_in_sync_status(self, use_fingerprint=False):
         """
         Check if the host is in sync with Zabbix.
         
+        Args:
+            use_fingerprint (bool, optional): Skip the Zabbix lookup if the host
+                was in sync and its payload fingerprint has not changed.
+        
         Returns:
             bool: False if host differs from Zabbix configuration, False otherwise.
         """
-        # Do not use the cached 'in_sync' here!
+        # Do not use the cached 'in_sync' here, unless backed by the fingerprint!
         from netbox_zabbix.netbox.compare import compare_host_configuration
         try:
-            result = compare_host_configuration( self )
+            result = compare_host_configuration( self, use_fingerprint=use_fingerprint )
             return result.get( "differ", False )
         except:
             return False
@@ -1932,7 +2089,7 @@ class HostConfig(NetBoxModel, JobsMixin):
           """
           Returns a checkmark or cross to indicate if the Host Config is in Sync with the Zabbix host.
           """
-          return mark_safe( '<span style="color:red;">✘</span>' ) if self.get_in_sync_status() else mark_safe( '<span style="color:green;">✔</span>' )
+          return mark_safe( '<span style="color:red;">✘</span>' ) if self.get_in_sync_status( use_fingerprint=True ) else mark_safe( '<span style="color:green;">✔</span>' )
 
 
     def get_sync_diff(self):
@@ -1949,18 +2106,27 @@ class HostConfig(NetBoxModel, JobsMixin):
             return {}
 
 
-    def update_sync_status(self):
+    def update_sync_status(self, zabbix_host=None, payload=None):
         """
         Check if the host is in sync with Zabbix and update the database
         without triggering any signal handlers.
+
+        Args:
+            zabbix_host (dict, optional): Prefetched Zabbix host to compare against.
+            payload (dict, optional): Prebuilt update payload of this host.
         """
         from netbox_zabbix.netbox.compare import compare_host_configuration
     
         try:
-            result = compare_host_configuration( self )
+            result = compare_host_configuration( self, zabbix_host=zabbix_host, payload=payload )
             self.in_sync = not result.get( "differ", False ) # invert the differ flag
             self.last_sync_update = timezone.now()
-            save_without_signals( self, update_fields=["in_sync", "last_sync_update"] )
+            update_fields = ["in_sync", "last_sync_update"]
+            if not self.in_sync and self.payload_fingerprint:
+                # Zabbix no longer matches the last payload pushed
+                self.payload_fingerprint = None
+                update_fields.append( "payload_fingerprint" )
+            save_without_signals( self, update_fields=update_fields )
         except Exception as e:
             # Optional: log failure but do not block other updates
             logger.warning( f"Failed to update sync for HostConfig {self.pk}: {e}" )
@@ -1981,6 +2147,7 @@ class HostConfig(NetBoxModel, JobsMixin):
         if not self.name and self.assigned_object:
             self.name = f"z-{self.assigned_object.name}"
         super().save( *args, **kwargs )
+        self._update_cached_host_config( self )
 
 
     def delete(self, request=None, *args, **kwargs):
@@ -1995,7 +2162,25 @@ class HostConfig(NetBoxModel, JobsMixin):
             else:
                 raise Exception( warning_msg )
     
-        return super().delete( *args, **kwargs )
+        result = super().delete( *args, **kwargs )
+        self._update_cached_host_config( None )
+        return result
+
+
+    def _update_cached_host_config(self, host_config):
+        """
+        Update the cached `host_config` of the assigned object, if it is loaded.
+        
+        Args:
+            host_config (HostConfig | None): Value to cache.
+        """
+        if not HostConfig._meta.get_field( "assigned_object" ).is_cached( self ):
+            return
+
+        # Prevent circular imports
+        from netbox_zabbix.netbox.host_config import set_cached_host_config
+        if self.assigned_object is not None:
+            set_cached_host_config( self.assigned_object, host_config )
 
 
 # ------------------------------------------------------------------------------
@@ -2058,9 +2243,11 @@ class BaseInterface(NetBoxModel):
         Returns:
             str or None
         """
-        setting = Setting.objects.first()
+        # Prevent circular imports
+        from netbox_zabbix.settings import get_ip_assignment_method
+
         primary_ip = self._get_primary_ip()
-        if setting.ip_assignment_method == 'primary' and primary_ip == self.ip_address:
+        if get_ip_assignment_method() == 'primary' and primary_ip == self.ip_address:
             primary_ip = self._get_primary_ip()
             return primary_ip.dns_name if primary_ip else None
         else:
@@ -2074,9 +2261,11 @@ class BaseInterface(NetBoxModel):
         Returns:
             IPAddress or None
         """
-        setting = Setting.objects.first()
+        # Prevent circular imports
+        from netbox_zabbix.settings import get_ip_assignment_method
+
         primary_ip = self._get_primary_ip()
-        if setting.ip_assignment_method == 'primary' and primary_ip == self.ip_address:
+        if get_ip_assignment_method() == 'primary' and primary_ip == self.ip_address:
             return self._get_primary_ip()
         else:
             return self.ip_address
@@ -2319,6 +2508,27 @@ class Maintenance(NetBoxModel):
         return qs
 
 
+    def refresh_membership(self):
+        """
+        Rebuild the MaintenanceMembership rows of this maintenance from
+        `get_matching_host_configs()`.
+
+        Returns:
+            int: Number of member HostConfigs.
+        """
+        pks = set( self.get_matching_host_configs().values_list( "pk", flat=True ) )
+        current = set( self.memberships.values_list( "host_config_id", flat=True ) )
+
+        if current - pks:
+            self.memberships.filter( host_config_id__in=current - pks ).delete()
+        if pks - current:
+            MaintenanceMembership.objects.bulk_create(
+                [ MaintenanceMembership( maintenance=self, host_config_id=pk ) for pk in pks - current ],
+                ignore_conflicts=True,
+            )
+        return len( pks )
+
+
     def _build_params(self):
         """
         Construct the parameters dict for Zabbix API create/update maintenance call.
@@ -2423,6 +2633,95 @@ class Maintenance(NetBoxModel):
         return None
 
 
+# ------------------------------------------------------------------------------
+# Maintenance Membership
+# ------------------------------------------------------------------------------
+
+
+class MaintenanceMembership(models.Model):
+    """
+    Precomputed membership of a HostConfig in a Maintenance.
+
+    The rows are derived from `Maintenance.get_matching_host_configs()` and
+    rebuilt by `Maintenance.refresh_membership()` when a maintenance or its
+    scope changes, by `refresh_host_config_memberships()` when a host changes,
+    and periodically by the maintenance cleanup system job.
+    They let `in_maintenance` be answered with a single join.
+    """
+
+    maintenance = models.ForeignKey( Maintenance, on_delete=models.CASCADE, related_name="memberships" )
+    host_config = models.ForeignKey( HostConfig, on_delete=models.CASCADE, related_name="maintenance_memberships" )
+
+    class Meta:
+        unique_together = ( "maintenance", "host_config" )
+
+
+    def __str__(self):
+        return f"{self.host_config_id} in {self.maintenance_id}"
+
+
+def in_maintenance_exists():
+    """
+    Return an expression that is True if the HostConfig of the outer query is
+    in an active maintenance.
+
+    Usage:
+        HostConfig.objects.annotate( maintenance_active=in_maintenance_exists() )
+
+    Returns:
+        Exists: Subquery expression over MaintenanceMembership.
+    """
+    return Exists(
+        MaintenanceMembership.objects.filter(
+            host_config=OuterRef( "pk" ),
+            maintenance__start_time__lte=Now(),
+            maintenance__end_time__gte=Now(),
+        )
+    )
+
+
+def refresh_host_config_memberships(host_config_pks):
+    """
+    Rebuild the MaintenanceMembership rows of some HostConfigs, e.g. after
+    their host groups, proxy, site or cluster changed.
+
+    Args:
+        host_config_pks (Iterable[int]): Primary keys of the HostConfigs.
+
+    Returns:
+        int: Number of memberships of the HostConfigs.
+    """
+    pks = set( host_config_pks )
+    if not pks:
+        return 0
+
+    rows = []
+    for maintenance in Maintenance.objects.filter( end_time__gte=timezone.now() ):
+        matching = maintenance.get_matching_host_configs().filter( pk__in=pks ).values_list( "pk", flat=True )
+        rows.extend( MaintenanceMembership( maintenance=maintenance, host_config_id=pk ) for pk in set( matching ) )
+
+    MaintenanceMembership.objects.filter( host_config_id__in=pks ).delete()
+    MaintenanceMembership.objects.bulk_create( rows, ignore_conflicts=True )
+    return len( rows )
+
+
+def refresh_maintenance_memberships():
+    """
+    Rebuild the MaintenanceMembership rows of all maintenances that have not
+    ended yet and drop the rows of ended maintenances.
+
+    Returns:
+        int: Number of refreshed maintenances.
+    """
+    now = timezone.now()
+    MaintenanceMembership.objects.filter( maintenance__end_time__lt=now ).delete()
+
+    maintenances = Maintenance.objects.filter( end_time__gte=now )
+    for maintenance in maintenances:
+        maintenance.refresh_membership()
+    return len( maintenances )
+
+
 # ------------------------------------------------------------------------------
 # Events
 # ------------------------------------------------------------------------------
@@ -10,6 +10,7 @@ Key functionality includes:
 - Comparing tags, templates, groups, and other configuration elements.
 - Supporting multiple comparison modes (overwrite vs. preserve).
 - Reporting differences between NetBox and Zabbix hosts.
+- Reducing an update payload to the top-level keys that differ from Zabbix.
 
 Intended for use in validation, synchronization, and auditing of
 NetBox-managed Zabbix hosts.
@@ -25,6 +26,67 @@ from netbox_zabbix.zabbix.api import get_host_by_id_with_templates
 # Private Helper Functions
 # ------------------------------------------------------------------------------
 
+
+# Lists with at most this many item pairs are diffed pairwise
+PAIRWISE_DIFF_LIMIT = 2500
+
+
+def _freeze(value):
+    """
+    Convert a JSON-compatible value into an equivalent hashable value.
+
+    Dicts become sorted tuples of (key, value) pairs and lists become tuples,
+    each tagged so they cannot collide with each other. Two values are equal
+    exactly when their frozen forms are equal.
+
+    Raises:
+        TypeError: If the value contains unhashable leaves.
+    """
+    if isinstance( value, dict ):
+        return ( "__dict__", tuple( sorted( ( ( k, _freeze( v ) ) for k, v in value.items() ), key=lambda kv: str( kv[0] ) ) ) )
+    if isinstance( value, list ):
+        return ( "__list__", tuple( _freeze( v ) for v in value ) )
+    hash( value )
+    return value
+
+
+def _list_difference_pairwise(obj_a, obj_b):
+    """
+    Return the items only in obj_a and the items only in obj_b by comparing
+    every pair of items. Quadratic; used for small lists and as fallback.
+    """
+    a_only = [item for item in obj_a if item not in obj_b]
+    b_only = [item for item in obj_b if item not in obj_a]
+
+    return ( a_only, b_only )
+
+
+def _list_difference(obj_a, obj_b):
+    """
+    Return the items only in obj_a and the items only in obj_b in linear time.
+
+    Both lists are frozen once into hashable values and diffed with sets.
+    Lists with at most PAIRWISE_DIFF_LIMIT item pairs are diffed pairwise.
+    The result is identical to `_list_difference_pairwise`: order and
+    duplicates of the input lists are preserved.
+    """
+    # Small lists are faster to compare pairwise
+    if len( obj_a ) * len( obj_b ) <= PAIRWISE_DIFF_LIMIT:
+        return _list_difference_pairwise( obj_a, obj_b )
+
+    try:
+        frozen_a = [ _freeze( item ) for item in obj_a ]
+        frozen_b = [ _freeze( item ) for item in obj_b ]
+    except TypeError:
+        return _list_difference_pairwise( obj_a, obj_b )
+
+    set_a, set_b = set( frozen_a ), set( frozen_b )
+    a_only = [ item for item, key in zip( obj_a, frozen_a ) if key not in set_b ]
+    b_only = [ item for item, key in zip( obj_b, frozen_b ) if key not in set_a ]
+
+    return ( a_only, b_only )
+
+
 def _compare_json(obj_a, obj_b):
     """
     Recursively compare two JSON-compatible objects.
@@ -90,10 +152,7 @@ def _compare_json(obj_a, obj_b):
             )
 
         # Normal lists (e.g., primitive values)
-        a_only = [item for item in obj_a if item not in obj_b]
-        b_only = [item for item in obj_b if item not in obj_a]
-
-        return ( a_only, b_only )
+        return _list_difference( obj_a, obj_b )
 
     # Case 3 primitive values
     if obj_a != obj_b:
@@ -162,16 +221,143 @@ def _prepare_host_for_comparison(host, template):
     return normalized
 
 
+def _diff_host(payload, zabbix_host):
+    """
+    Normalize a payload and a Zabbix host and compare them.
+
+    Args:
+        payload (dict): Host payload built from NetBox.
+        zabbix_host (dict): Zabbix host, empty if the host does not exist.
+
+    Returns:
+        tuple[dict, dict]: Differences on the NetBox side and on the Zabbix side.
+    """
+    payload_processed = _prepare_host_for_comparison( payload, payload )
+    zabbix_processed = _prepare_host_for_comparison( zabbix_host, payload )
+    return _compare_json( payload_processed, zabbix_processed )
+
+
+# ------------------------------------------------------------------------------
+# Update Delta
+# ------------------------------------------------------------------------------
+
+
+# Top-level payload keys that must be sent to host.update() together
+UPDATE_KEY_GROUPS = [
+    { "monitored_by", "proxyid", "proxy_groupid" },
+    { "inventory_mode", "inventory" },
+    { "tls_psk_identity", "tls_psk" },
+]
+
+
+def _interface_key(interface):
+    """
+    Return the key used to match an interface without interface ID.
+    """
+    return ( interface.get( "type" ), interface.get( "ip" ), interface.get( "dns" ), interface.get( "port" ) )
+
+
+def interfaces_changed(payload_interfaces, zabbix_interfaces):
+    """
+    Return True if the payload interfaces differ from the Zabbix interfaces.
+
+    Every payload interface is compared against its own keys, so the SNMP
+    `details` are compared even when the first interface is an Agent
+    interface. Interfaces are matched on interface ID, or on type, IP, DNS
+    and port if the payload interface has no ID.
+
+    Args:
+        payload_interfaces (list[dict]): Interfaces of the update payload.
+        zabbix_interfaces (list[dict]): Interfaces of the Zabbix host.
+
+    Returns:
+        bool: True if an interface was added, removed or changed.
+    """
+    if len( payload_interfaces ) != len( zabbix_interfaces ):
+        return True
+
+    by_id  = { str( iface.get( "interfaceid" ) ): iface for iface in zabbix_interfaces if iface.get( "interfaceid" ) }
+    by_key = { _interface_key( iface ): iface for iface in zabbix_interfaces }
+
+    for interface in payload_interfaces:
+        interfaceid = interface.get( "interfaceid" )
+        zabbix_interface = by_id.get( str( interfaceid ) ) if interfaceid else by_key.get( _interface_key( interface ) )
+        if zabbix_interface is None:
+            return True
+
+        payload_diff, zabbix_diff = _compare_json( interface, _normalize_zabbix_host( zabbix_interface, interface ) )
+        if payload_diff or zabbix_diff:
+            return True
+
+    return False
+
+
+def changed_host_keys(payload, zabbix_host):
+    """
+    Return the top-level payload keys whose value differs from the Zabbix host.
+
+    Keys that Zabbix expects together (see UPDATE_KEY_GROUPS) are added as a
+    group. Keys Zabbix never returns, such as 'tls_psk', always count as changed.
+    Interfaces are compared one by one, see `interfaces_changed`.
+
+    Args:
+        payload (dict): Update payload built from NetBox.
+        zabbix_host (dict): Current Zabbix host.
+
+    Returns:
+        set[str]: Changed top-level keys, without 'hostid'.
+    """
+    netbox_diff, zabbix_diff = _diff_host( payload, zabbix_host )
+    changed = ( set( netbox_diff ) | set( zabbix_diff ) ) & set( payload )
+
+    if "interfaces" in payload and interfaces_changed( payload["interfaces"], zabbix_host.get( "interfaces" ) or [] ):
+        changed.add( "interfaces" )
+
+    for group in UPDATE_KEY_GROUPS:
+        if changed & group:
+            changed |= group & set( payload )
+
+    changed.discard( "hostid" )
+    return changed
+
+
+def build_update_delta(payload, zabbix_host):
+    """
+    Reduce an update payload to the keys that differ from the Zabbix host.
+
+    List valued keys (tags, groups, templates, interfaces) replace the
+    current value in Zabbix and are therefore sent in full when changed.
+
+    Args:
+        payload (dict): Update payload built from NetBox, including 'hostid'.
+        zabbix_host (dict): Current Zabbix host.
+
+    Returns:
+        dict: 'hostid' and the changed top-level keys of the payload.
+    """
+    delta = { "hostid": payload["hostid"] }
+    for key in sorted( changed_host_keys( payload, zabbix_host ) ):
+        delta[key] = payload[key]
+    return delta
+
+
 # ------------------------------------------------------------------------------
 # Compare Zabbix Configuration and Zabbix Host 
 # ------------------------------------------------------------------------------
 
-def compare_host_configuration(host_config):
+def compare_host_configuration(host_config, zabbix_host=None, payload=None, use_fingerprint=False):
     """
     Compare a NetBox host configuration with its Zabbix counterpart.
 
     Args:
         host_config: HostConfig instance.
+        zabbix_host (dict, optional): Prefetched Zabbix host, e.g. from
+            `get_hosts_by_ids`. If omitted the host is fetched from Zabbix.
+        payload (dict, optional): Prebuilt update payload, e.g. from
+            `builders.build_payloads`. If omitted the payload is built here.
+        use_fingerprint (bool, optional): Report no differences without asking
+            Zabbix if the host is marked in sync and the payload fingerprint
+            matches the last payload pushed to Zabbix.
 
     Returns:
         dict:
@@ -182,19 +368,23 @@ def compare_host_configuration(host_config):
         }
     """
     retval = {"differ": False, "netbox": {}, "zabbix": {}}
-    payload = builders.payload( host_config, True )
+    if payload is None:
+        payload = builders.payload( host_config, True )
+
+    if use_fingerprint and zabbix_host is None and host_config.in_sync and host_config.payload_fingerprint:
+        if builders.payload_fingerprint( payload ) == host_config.payload_fingerprint:
+            return retval
 
     zabbix_host_raw = {}
-    if host_config.hostid:
+    if zabbix_host is not None:
+        zabbix_host_raw = zabbix_host
+    elif host_config.hostid:
         try:
             zabbix_host_raw = get_host_by_id_with_templates( host_config.hostid )
         except Exception:
             pass
 
-    payload_processed = _prepare_host_for_comparison( payload, payload )
-    zabbix_processed = _prepare_host_for_comparison( zabbix_host_raw, payload )
-
-    netbox_diff, zabbix_diff = _compare_json( payload_processed, zabbix_processed )
+    netbox_diff, zabbix_diff = _diff_host( payload, zabbix_host_raw )
 
     retval["differ"] = bool( netbox_diff or zabbix_diff )
     retval["netbox"] = netbox_diff
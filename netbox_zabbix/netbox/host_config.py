@@ -13,16 +13,126 @@ Key functionality:
 
 - `save_host_config(host_config)`: Validates and persists an existing HostConfig
   object, ensuring that plugin-related signals can be bypassed when needed.
+
+- `get_host_config(obj)`: Backs the cached `host_config` property of Device
+  and VirtualMachine, see `set_cached_host_config()` and
+  `invalidate_host_config()`.
+
+- `attach_host_configs(objects)`: Loads the HostConfigs of many Devices and
+  VirtualMachines in one query and caches them on the objects.
 """
 
 
 # Django imports
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
 
 # NetBox Zabbix plugin imports
 from netbox_zabbix import models
 from netbox_zabbix.netbox.utils import save_without_signals
 
+
+# Attribute holding the cached HostConfig of a Device or VirtualMachine
+HOST_CONFIG_CACHE_ATTR = "_host_config_cache"
+
+
+# ------------------------------------------------------------------------------
+# Cached host_config Accessor
+# ------------------------------------------------------------------------------
+
+
+def get_host_config( obj ):
+    """
+    Return the HostConfig of a Device or VirtualMachine.
+    
+    The result, including None, is cached on the object, so repeated
+    accesses of `obj.host_config` cost a single query.
+    
+    Args:
+        obj (Device | VirtualMachine): The object.
+    
+    Returns:
+        HostConfig | None: The HostConfig, or None if the object has none.
+    """
+    try:
+        return obj.__dict__[HOST_CONFIG_CACHE_ATTR]
+    except KeyError:
+        pass
+
+    content_type = ContentType.objects.get_for_model( obj )
+    host_config  = models.HostConfig.objects.filter( content_type=content_type, object_id=obj.pk ).first()
+    set_cached_host_config( obj, host_config )
+    return host_config
+
+
+def set_cached_host_config( obj, host_config ):
+    """
+    Cache the HostConfig of a Device or VirtualMachine.
+    
+    Args:
+        obj (Device | VirtualMachine): The object.
+        host_config (HostConfig | None): Its HostConfig.
+    """
+    obj.__dict__[HOST_CONFIG_CACHE_ATTR] = host_config
+
+
+def invalidate_host_config( obj ):
+    """
+    Drop the cached HostConfig of a Device or VirtualMachine, so the next
+    access of `obj.host_config` queries the database again.
+    
+    Args:
+        obj (Device | VirtualMachine): The object.
+    """
+    obj.__dict__.pop( HOST_CONFIG_CACHE_ATTR, None )
+
+
+def attach_host_configs( objects ):
+    """
+    Load the HostConfigs of many Devices and VirtualMachines in one query
+    and cache them on the objects.
+    
+    The HostConfigs get their assigned object attached as well, so
+    `obj.host_config.assigned_object` does not query the database.
+    
+    Args:
+        objects (Iterable[Device | VirtualMachine]): Objects, e.g. a queryset
+            or the records of a table page. Mixed models are allowed.
+    
+    Returns:
+        list[Device | VirtualMachine]: The objects.
+    """
+    objects = list( objects )
+    if not objects:
+        return objects
+
+    by_key  = {}
+    by_type = {}
+    for obj in objects:
+        content_type = ContentType.objects.get_for_model( obj )
+        by_key[( content_type.pk, obj.pk )] = obj
+        by_type.setdefault( content_type.pk, set() ).add( obj.pk )
+
+    query = Q()
+    for content_type_id, object_ids in by_type.items():
+        query |= Q( content_type_id=content_type_id, object_id__in=object_ids )
+
+    host_configs = { ( hc.content_type_id, hc.object_id ): hc for hc in models.HostConfig.objects.filter( query ) }
+
+    for key, obj in by_key.items():
+        host_config = host_configs.get( key )
+        if host_config is not None:
+            host_config.assigned_object = obj
+        set_cached_host_config( obj, host_config )
+
+    return objects
+
+
+# ------------------------------------------------------------------------------
+# Create and Save
+# ------------------------------------------------------------------------------
+
+
 def create_host_config( obj ):
     """
     Create a HostConfig object for a Device or VirtualMachine.
@@ -37,8 +147,7 @@ def create_host_config( obj ):
         Exception: If creation or validation fails.
     """
     try:
-        content_type = ContentType.objects.get_for_model( obj )
-        host_config = models.HostConfig( name=f"z-{obj.name}", content_type=content_type, object_id=obj.id )
+        host_config = models.HostConfig( name=f"z-{obj.name}", assigned_object=obj )
         host_config.full_clean()
 
         # Mark this instance to bypass signals for this save operation only
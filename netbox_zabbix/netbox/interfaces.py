@@ -17,14 +17,44 @@ Key functionality:
 - `is_interface_available(interface)`: Checks whether a Zabbix interface
   is currently available and responsive according to Zabbix.
 
+- `prefetch_interface_status(interfaces)`: Retrieves the availability and
+  removability of many interfaces in two API calls, cached for a short time.
+
 """
 
+# Django imports
+from django.conf import settings as plugin_settings
+from django.core.cache import cache
+
 # NetBox Zabbix plugin imports
 import netbox_zabbix.zabbix.api as zapi
 from netbox_zabbix import models
 from netbox_zabbix.netbox.changelog import log_creation_event
 from netbox_zabbix.logger import logger
 
+
+# Default when PLUGINS_CONFIG does not set 'interface_status_cache_ttl'
+DEFAULT_INTERFACE_STATUS_CACHE_TTL = 30
+
+# Cache key of an interface status, formatted with the hostid and interfaceid
+INTERFACE_STATUS_CACHE_KEY = "netbox_zabbix_interface_status_{}_{}"
+
+# Status used for interfaces that do not exist in Zabbix. This matches
+# the per interface checks: no items use it, and it is not available.
+MISSING_INTERFACE_STATUS = { "available": False, "removable": True }
+
+
+def get_interface_status_cache_ttl():
+    """
+    Return the number of seconds an interface status is cached.
+
+    Returns:
+        int: Value of 'interface_status_cache_ttl' in the plugin configuration.
+    """
+    config = plugin_settings.PLUGINS_CONFIG.get( "netbox_zabbix", {} )
+    return max( 0, int( config.get( "interface_status_cache_ttl", DEFAULT_INTERFACE_STATUS_CACHE_TTL ) ) )
+
+
 def create_zabbix_interface( obj, host_config, interface_model, interface_name_suffix, interface_kwargs_fn, user, request_id ):
     """
     Create and persist a Zabbix interface for a host in NetBox.
@@ -122,3 +152,43 @@ def is_interface_available(interface):
         return False
     return True
 
+
+def prefetch_interface_status(interfaces):
+    """
+    Retrieve the availability and removability of many interfaces.
+    
+    Cached statuses are reused. The rest are fetched with one
+    `hostinterface.get` and one `item.get` (see `zapi.get_interfaces_status`)
+    and cached for 'interface_status_cache_ttl' seconds.
+    
+    Args:
+        interfaces (Iterable): Host interface instances, e.g. the rows of a table page.
+    
+    Returns:
+        dict: Mapping of interface pk to {"available": bool, "removable": bool}.
+              Interfaces without a hostid or interfaceid, or whose status could
+              not be retrieved, are missing from the map.
+    """
+    ids = {}
+    for interface in interfaces:
+        try:
+            ids[interface.pk] = ( int( interface.host_config.hostid ), int( interface.interfaceid ) )
+        except ( TypeError, ValueError, AttributeError ):
+            continue
+
+    keys   = { pk: INTERFACE_STATUS_CACHE_KEY.format( *pair ) for pk, pair in ids.items() }
+    status = cache.get_many( keys.values() )
+
+    missing = { pk: pair for pk, pair in ids.items() if keys[pk] not in status }
+    if missing:
+        try:
+            fetched = zapi.get_interfaces_status( ( hostid for hostid, _ in missing.values() ), ( interfaceid for _, interfaceid in missing.values() ) )
+        except Exception as e:
+            # Default to not available/not removable if Zabbix isn't responding.
+            logger.warning( f"Failed to retrieve the status of {len( missing )} interfaces from Zabbix: {e}" )
+        else:
+            new = { keys[pk]: fetched.get( str( interfaceid ), MISSING_INTERFACE_STATUS ) for pk, ( _, interfaceid ) in missing.items() }
+            cache.set_many( new, get_interface_status_cache_ttl() )
+            status.update( new )
+
+    return { pk: status[key] for pk, key in keys.items() if key in status }
@@ -0,0 +1,168 @@
+"""
+NetBox Zabbix Plugin — Zabbix Problems Cache
+
+This module keeps the active Zabbix problems of all managed hosts in the
+Django cache, indexed by Zabbix hostid, so that problem badges and tabs can
+be rendered without calling Zabbix.
+
+Key functionality:
+
+- `refresh_problems(hostids)`: Fetches the problems of many hosts with one
+  bulk `problem.get` per chunk and stores them in the cache.
+
+- `refresh_all_problems()`: Refreshes the problems of every HostConfig with
+  a Zabbix hostid. Run periodically by `SystemJobRefreshProblems`.
+
+- `get_cached_problems(host_config)`: Returns the cached problems of a host
+  without calling Zabbix.
+
+- `get_host_problems(host_config)`: Returns the problems of a host, fetching
+  them on demand when the cached entry is missing or older than
+  'problems_cache_ttl' seconds.
+
+"""
+
+# Standard library imports
+import time
+
+# Django imports
+from django.conf import settings as plugin_settings
+from django.core.cache import cache
+
+# NetBox Zabbix plugin imports
+import netbox_zabbix.zabbix.api as zapi
+from netbox_zabbix import models, settings
+from netbox_zabbix.logger import logger
+
+
+# Default when PLUGINS_CONFIG does not set 'problems_cache_ttl'
+DEFAULT_PROBLEMS_CACHE_TTL = 60
+
+# Cache key of the problems of a host, formatted with the hostid
+PROBLEMS_CACHE_KEY = "netbox_zabbix_problems_{}"
+
+# Number of refresh intervals a cached entry is kept, so entries survive a
+# late or failed periodic refresh but do not outlive a stopped job for long
+PROBLEMS_CACHE_INTERVALS = 3
+
+
+def get_problems_cache_ttl():
+    """
+    Return the number of seconds cached problems are fresh enough to be
+    shown without an on-demand refresh.
+
+    Returns:
+        int: Value of 'problems_cache_ttl' in the plugin configuration.
+    """
+    config = plugin_settings.PLUGINS_CONFIG.get( "netbox_zabbix", {} )
+    return max( 0, int( config.get( "problems_cache_ttl", DEFAULT_PROBLEMS_CACHE_TTL ) ) )
+
+
+def _cache_timeout():
+    """
+    Return the number of seconds a cached entry is kept.
+
+    Returns:
+        int: PROBLEMS_CACHE_INTERVALS refresh intervals, at least the cache TTL.
+    """
+    interval = settings.get_problems_refresh_interval() or 0
+    return max( get_problems_cache_ttl(), int( interval ) * 60 * PROBLEMS_CACHE_INTERVALS, 1 )
+
+
+def refresh_problems(hostids):
+    """
+    Fetch the active problems of many hosts from Zabbix and cache them.
+
+    Args:
+        hostids (iterable): Zabbix hostids.
+
+    Returns:
+        dict: Mapping of hostid (str) to its list of problems.
+
+    Raises:
+        Exception: If the problems cannot be retrieved from Zabbix.
+    """
+    problems = zapi.get_problems_by_hostids( hostids )
+    fetched  = time.time()
+    cache.set_many(
+        { PROBLEMS_CACHE_KEY.format( hostid ): ( fetched, host_problems ) for hostid, host_problems in problems.items() },
+        _cache_timeout()
+    )
+    return problems
+
+
+def refresh_all_problems():
+    """
+    Refresh the cached problems of every HostConfig that exists in Zabbix.
+
+    Returns:
+        dict: Number of hosts refreshed and number of active problems.
+    """
+    hostids  = models.HostConfig.objects.exclude( hostid__isnull=True ).values_list( "hostid", flat=True )
+    problems = refresh_problems( hostids )
+    return {
+        "hosts":    len( problems ),
+        "problems": sum( len( host_problems ) for host_problems in problems.values() ),
+    }
+
+
+def get_cached_problems(host_config):
+    """
+    Return the cached problems of a host without calling Zabbix.
+
+    Args:
+        host_config (HostConfig | None): The host configuration.
+
+    Returns:
+        list | None: The cached problems, or None if nothing is cached.
+    """
+    if host_config is None or not host_config.hostid:
+        return None
+    entry = cache.get( PROBLEMS_CACHE_KEY.format( host_config.hostid ) )
+    return entry[1] if entry else None
+
+
+def get_problem_count(host_config):
+    """
+    Return the number of cached problems of a host, for tab badges.
+
+    Args:
+        host_config (HostConfig | None): The host configuration.
+
+    Returns:
+        int: Number of cached problems, 0 if nothing is cached.
+    """
+    return len( get_cached_problems( host_config ) or [] )
+
+
+def get_host_problems(host_config, refresh=True):
+    """
+    Return the problems of a host.
+
+    The cached problems are returned if they are younger than
+    'problems_cache_ttl' seconds. Otherwise, if `refresh` is True, the
+    problems of the host are fetched from Zabbix and cached. If Zabbix
+    cannot be reached the last cached problems are returned.
+
+    Args:
+        host_config (HostConfig | None): The host configuration.
+        refresh (bool, optional): Fetch missing or stale problems from Zabbix.
+
+    Returns:
+        list: The problems of the host, newest first.
+    """
+    if host_config is None or not host_config.hostid:
+        return []
+
+    hostid = str( host_config.hostid )
+    entry  = cache.get( PROBLEMS_CACHE_KEY.format( hostid ) )
+    if entry and ( not refresh or time.time() - entry[0] < get_problems_cache_ttl() ):
+        return entry[1]
+    if not refresh:
+        return []
+
+    try:
+        return refresh_problems( [ hostid ] ).get( hostid, [] )
+    except Exception as e:
+        logger.warning( f"Failed to refresh problems of host {hostid}: {e}" )
+        return entry[1] if entry else []
@@ -4,11 +4,26 @@ NetBox Zabbix Plugin — Configuration Utilities
 This module provides helpers for retrieving and managing the Zabbix
 Settings object stored in the database. It also defines related
 custom exceptions and provides safe accessors for plugin code.
+
+Getters read from an immutable settings snapshot that is cached per process
+and shared between threads. The snapshot carries a version stamp stored in
+the Django cache; `Setting.save()` bumps the stamp, which makes every process
+rebuild its snapshot on next use.
 """
 
+# Standard library imports
+import threading
+import time
+import uuid
+
+# Django imports
+from django.core.cache import cache
+from django.db import transaction
+
 # NetBox Zabbix plugin imports
 from netbox_zabbix.models import Setting
 from netbox_zabbix.models import (
+    IPAssignmentChoices,
     DeleteSettingChoices,
     UseIPChoices,
     MonitoredByChoices,
@@ -75,7 +90,120 @@ def get_settings_safe(default=None):
         return default
 
 
-def safe_setting(default=None):
+# ------------------------------------------------------------------------------
+# Settings Snapshot
+# ------------------------------------------------------------------------------
+
+
+# Cache key holding the current version of the settings
+SETTINGS_VERSION_KEY = "netbox_zabbix_settings_version"
+
+# Seconds between checks of the shared version stamp
+SETTINGS_VERSION_CHECK_INTERVAL = 5
+
+
+class SettingsSnapshot:
+    """
+    Immutable copy of the values of a Setting instance.
+    
+    Attributes are read like on the Setting model, including the decrypted
+    `token`. A snapshot is safe to share between threads.
+    """
+
+    def __init__(self, setting, version):
+        values = { field.attname: getattr( setting, field.attname ) for field in setting._meta.concrete_fields }
+        values["token"] = setting.token
+        object.__setattr__( self, "_values", values )
+        object.__setattr__( self, "version", version )
+
+
+    def __getattr__(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError( f"'SettingsSnapshot' has no attribute '{name}'" )
+
+
+    def __setattr__(self, name, value):
+        raise AttributeError( "SettingsSnapshot is immutable" )
+
+
+_snapshot_lock    = threading.Lock()
+_snapshot         = None
+_snapshot_version = None
+_snapshot_checked = 0.0
+_snapshot_valid   = False
+
+
+def get_settings_snapshot(default=None):
+    """
+    Return the cached settings snapshot, rebuilding it if the settings have
+    changed.
+    
+    The shared version stamp is checked at most every
+    SETTINGS_VERSION_CHECK_INTERVAL seconds, so changes made by other
+    processes become visible within that interval. Changes made by this
+    process are visible immediately.
+    
+    Args:
+        default (Any, optional): Value to return if no setting is found or if a database error occurs.
+    
+    Returns:
+        SettingsSnapshot | Any: The snapshot, or the default value if unavailable.
+    """
+    global _snapshot, _snapshot_version, _snapshot_checked, _snapshot_valid
+
+    now = time.monotonic()
+    with _snapshot_lock:
+        if _snapshot_valid and now - _snapshot_checked < SETTINGS_VERSION_CHECK_INTERVAL:
+            return _snapshot or default
+
+    version = cache.get( SETTINGS_VERSION_KEY )
+    with _snapshot_lock:
+        if _snapshot_valid and version == _snapshot_version:
+            _snapshot_checked = now
+            return _snapshot or default
+
+    try:
+        setting = Setting.objects.first()
+    except Exception:
+        logger.warning( "Failed to retrieve Zabbix Setting from database" )
+        return default
+
+    snapshot = SettingsSnapshot( setting, version ) if setting else None
+
+    with _snapshot_lock:
+        _snapshot         = snapshot
+        _snapshot_version = version
+        _snapshot_checked = now
+        _snapshot_valid   = True
+    return snapshot or default
+
+
+def _reset_settings_snapshot():
+    """Drop the snapshot of this process."""
+    global _snapshot_valid
+    with _snapshot_lock:
+        _snapshot_valid = False
+
+
+def invalidate_settings_snapshot():
+    """
+    Invalidate the settings snapshot in all processes.
+    
+    The snapshot of this process is dropped immediately. The shared version
+    stamp is bumped when the current transaction commits, so other processes
+    do not rebuild their snapshot from uncommitted data.
+    """
+    def bump():
+        cache.set( SETTINGS_VERSION_KEY, uuid.uuid4().hex, None )
+        _reset_settings_snapshot()
+
+    _reset_settings_snapshot()
+    transaction.on_commit( bump )
+
+
+def safe_setting(default=None, snapshot=True):
     """
     Decorator that ensures safe access to Zabbix settings functions.
     
@@ -84,6 +212,8 @@ def safe_setting(default=None):
     
     Args:
         default (Any, optional): Value returned when the Setting is missing.
+        snapshot (bool, optional): Pass the cached, read-only settings snapshot.
+            Set to False for functions that modify and save the Setting.
     
     Returns:
         function: A decorator that wraps the target function.
@@ -102,9 +232,10 @@ def safe_setting(default=None):
             """
             Wrapper function that executes the target function safely.
             
-            Retrieves the current Setting instance via `get_settings_safe()`. If no
-            Setting is available, returns the provided `default` value. Otherwise,
-            calls the original function with the Setting instance.
+            Retrieves the settings snapshot via `get_settings_snapshot()`, or the
+            current Setting instance via `get_settings_safe()` if `snapshot` is
+            False. If no Setting is available, returns the provided `default`
+            value. Otherwise, calls the original function with the Setting.
             
             Args:
                 *args: Positional arguments to pass to the wrapped function.
@@ -114,7 +245,7 @@ def safe_setting(default=None):
                 Any: The result of the wrapped function, or the `default` value if
                 Settings are missing.
             """
-            s = get_settings_safe()
+            s = get_settings_snapshot() if snapshot else get_settings_safe()
             if s is None:
                 return default
             return func( s, *args, **kwargs )
@@ -225,6 +356,58 @@ def get_cutoff_host_config_sync(s):
     return s.cutoff_host_config_sync
 
 
+@safe_setting(SystemJobIntervalChoices.INTERVAL_EVERY_15_MINUTES)
+def get_drift_detection_interval(s):
+    """
+    Retrieves the Drift Detection Interval from the configuration.
+    
+    Returns:
+        The Drift Detection Interval as specified in the configuration.
+    """
+    return s.drift_detection_interval
+
+
+@safe_setting(SystemJobIntervalChoices.INTERVAL_EVERY_5_MINUTES)
+def get_problems_refresh_interval(s):
+    """
+    Retrieves the Problems Refresh Interval from the configuration.
+    
+    Returns:
+        The Problems Refresh Interval as specified in the configuration.
+    """
+    return s.problems_refresh_interval
+
+
+@safe_setting( None, snapshot=False )
+def get_audit_log_watermark(s):
+    """
+    Retrieve the Zabbix clock of the last audit log entry processed by
+    drift detection.
+    
+    Returns:
+        int | None: Unix timestamp, or None if drift detection has not run.
+    """
+    return s.audit_log_watermark
+
+
+@safe_setting( None, snapshot=False )
+def set_audit_log_watermark(s, clock):
+    """
+    Persist the drift detection audit log watermark.
+    
+    The row is updated directly so that saving the watermark does not
+    reschedule the system jobs or invalidate the settings snapshot.
+    
+    Args:
+        s (Setting): The Zabbix Setting object.
+        clock (int): Unix timestamp of the last processed audit log entry.
+    
+    Returns:
+        None
+    """
+    type( s ).objects.filter( pk=s.pk ).update( audit_log_watermark=clock )
+
+
 @safe_setting(SystemJobIntervalChoices.INTERVAL_DAILY)
 def get_maintenance_cleanup_interval(s):
     """
@@ -274,7 +457,7 @@ def get_zabbix_token(s):
     return s.token
 
 
-@safe_setting( "" )
+@safe_setting( "", snapshot=False )
 def set_version( s, version ):
     """
     Update the stored Zabbix version in the configuration.
@@ -290,7 +473,7 @@ def set_version( s, version ):
     s.save()
 
 
-@safe_setting( False )
+@safe_setting( False, snapshot=False )
 def set_connection( s, status ):
     """
     Update the connection status in the configuration.
@@ -306,7 +489,7 @@ def set_connection( s, status ):
     s.save()
 
 
-@safe_setting( None )
+@safe_setting( None, snapshot=False )
 def set_last_checked( s, timestamp ):
     """
     Update the timestamp for the last successful configuration check.
@@ -395,6 +578,17 @@ def get_exclude_custom_field_enabled(s):
 # ------------------------------------------------------------------------------
 
 
+@safe_setting(IPAssignmentChoices.PRIMARY)
+def get_ip_assignment_method(s):
+    """
+    Retrieves the method used to assign IPs to host interfaces.
+    
+    Returns:
+        str: The IP assignment method.
+    """
+    return s.ip_assignment_method
+
+
 @safe_setting(UseIPChoices.IP)
 def get_useip(s):
     """
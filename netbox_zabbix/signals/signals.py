@@ -32,7 +32,13 @@ Several safeguards exist to prevent signals from firing when they should not:
      then the corresponding signal receiver will exit early and take no action.
      This is used internally to prevent infinite loops and redundant updates.
 
-  3. **Thread-Local Deletion Context**
+  3. **Batched Host Updates**
+     Host updates are not enqueued by the receivers themselves. They are
+     collected per transaction by `queue_host_update()` and enqueued once,
+     via `transaction.on_commit`, as a single (batched) update job. Nothing
+     is enqueued if the transaction is rolled back.
+
+  4. **Thread-Local Deletion Context**
      When a HostConfig is being deleted, its primary key is recorded in a
      thread-local set (`_deletion_context.configs_being_deleted`).  
      Any interface deletions triggered by the CASCADE relationship will see
@@ -44,10 +50,12 @@ Several safeguards exist to prevent signals from firing when they should not:
 
 # Standard library imports
 import threading
+import weakref
 import os
 
 # Django imports
-from django.db.models.signals import pre_delete, post_delete, pre_save, post_save
+from django.db import connection, transaction
+from django.db.models.signals import pre_delete, post_delete, pre_save, post_save, post_init, m2m_changed
 from django.dispatch import receiver
 from django.contrib import messages
 from django.http import HttpRequest
@@ -57,6 +65,7 @@ from core.models import ObjectChange
 from dcim.models import Device, Interface
 from virtualization.models  import VirtualMachine, VMInterface
 from ipam.models import IPAddress
+from extras.models import TaggedItem
 from netbox.context import current_request
 
 # NetBox Zabbix plugin imports
@@ -65,6 +74,7 @@ from netbox_zabbix.jobs.host import (
     CreateZabbixHost,
     UpdateZabbixHost
 )
+from netbox_zabbix.jobs.synchosts import UpdateZabbixHosts
 from netbox_zabbix.jobs.interface import (
     CreateZabbixInterface,
     UpdateZabbixInterface
@@ -75,7 +85,15 @@ from netbox_zabbix.models import (
     HostConfig,
     AgentInterface,
     SNMPInterface,
+    Template,
+    TagMapping,
+    InventoryMapping,
+    Maintenance,
+    refresh_maintenance_memberships,
+    refresh_host_config_memberships,
 )
+from netbox_zabbix.zabbix.template_graph import invalidate_template_graph
+from netbox_zabbix.mapping.plans import invalidate_mapping_plans
 from netbox_zabbix.logger import logger
 
 
@@ -83,6 +101,10 @@ from netbox_zabbix.logger import logger
 
 _deletion_context = threading.local()
 
+# Thread-local storage holding a weak reference to the HostUpdateBuffer of the current transaction
+
+_update_context = threading.local()
+
 # ------------------------------------------------------------------------------
 # Short identifiers for models
 # ------------------------------------------------------------------------------
@@ -167,6 +189,26 @@ def get_latest_change_user(pk: int):
     return change.user if change and change.user else None
 
 
+def get_current_user(pk: int = None):
+    """
+    Return the user who triggered the current change.
+    
+    The user is taken from the current request. Outside a request (e.g.
+    scripts or background jobs) it falls back to the latest ObjectChange
+    of the object.
+    
+    Args:
+        pk (int, optional): Primary key of the changed object.
+    
+    Returns:
+        User | None: The triggering user, or None if not found.
+    """
+    user = getattr( current_request.get(), "user", None )
+    if user is not None and user.is_authenticated:
+        return user
+    return get_latest_change_user( pk ) if pk is not None else None
+
+
 def needs_zabbix_ip_reassignment(interface: Interface | VMInterface):
     """
     Determine whether a Zabbix interface should be reassigned to the parent object's
@@ -330,6 +372,114 @@ def is_config_being_deleted(config_pk):
     return ( hasattr( _deletion_context, "configs_being_deleted" ) and config_pk in _deletion_context.configs_being_deleted )
 
 
+# ------------------------------------------------------------------------------
+# Batched Host Updates
+# ------------------------------------------------------------------------------
+
+
+class HostUpdateBuffer:
+    """
+    Collects the HostConfigs touched by a transaction and enqueues their
+    Zabbix updates once, when the transaction commits.
+
+    A single host is updated by `UpdateZabbixHost`, several hosts by one
+    `UpdateZabbixHosts` job. Both are debounced, see `update_debounce_seconds`.
+    If the transaction is rolled back nothing is enqueued.
+
+    Only the registered `flush` callback holds the buffer; the thread-local
+    keeps a weak reference. When Django drops the callback because the
+    transaction, or the savepoint it was registered in, is rolled back, the
+    buffer is released and the next update starts a new one. Hosts added in
+    a rolled back inner savepoint of a live buffer are still updated, which
+    only pushes their current state once more.
+    """
+
+    def __init__(self, request=None, user=None):
+        self.request    = request
+        self.user       = user
+        self.updates    = {}
+        self.signal_ids = []
+
+
+    def add(self, host_config, name=None, signal_id=None):
+        """
+        Add a HostConfig to the buffer. Repeated adds of the same host are merged.
+
+        Args:
+            host_config (HostConfig): Host to update.
+            name (str, optional): Job name used if only this host is updated.
+            signal_id (str, optional): Signal identifier for event correlation.
+        """
+        self.updates[host_config.pk] = ( host_config, name )
+        if signal_id and signal_id not in self.signal_ids:
+            self.signal_ids.append( signal_id )
+
+
+    def flush(self):
+        """
+        Enqueue the buffered host updates.
+        """
+        if current_host_update_buffer() is self:
+            _update_context.buffer = None
+
+        if not self.updates:
+            return
+
+        signal_id = ",".join( self.signal_ids ) or None
+        try:
+            if len( self.updates ) == 1:
+                host_config, name = next( iter( self.updates.values() ) )
+                UpdateZabbixHost.run_job_debounced( host_config=host_config, request=self.request, user=self.user, name=name, signal_id=signal_id )
+            else:
+                host_configs = [ host_config for host_config, _ in self.updates.values() ]
+                UpdateZabbixHosts.run_job( host_configs, request=self.request, user=self.user, signal_id=signal_id )
+            logger.info( "[%s] scheduled Zabbix update of %s hosts", signal_id, len( self.updates ) )
+
+        except Exception as e:
+            logger.error( "[%s] failed to schedule Zabbix update of %s hosts: %s", signal_id, len( self.updates ), str( e ), exc_info=True )
+        finally:
+            self.updates = {}
+
+
+def current_host_update_buffer():
+    """
+    Return the HostUpdateBuffer of the current transaction, if it is still
+    registered to be flushed on commit.
+
+    Returns:
+        HostUpdateBuffer | None: The live buffer, or None.
+    """
+    ref = getattr( _update_context, "buffer", None )
+    return ref() if ref is not None else None
+
+
+def queue_host_update(host_config, request=None, name=None, user=None, signal_id=None):
+    """
+    Queue a Zabbix host update to be enqueued when the current transaction commits.
+
+    All updates queued in the same transaction are collected in one
+    `HostUpdateBuffer` and flushed together. Outside a transaction the update
+    is enqueued immediately.
+
+    Args:
+        host_config (HostConfig): Host to update.
+        request (HttpRequest, optional): Triggering request.
+        name (str, optional): Job name.
+        user (User, optional): Triggering user, used if there is no request.
+        signal_id (str, optional): Signal identifier for event correlation.
+    """
+    buffer = current_host_update_buffer()
+    if buffer is not None:
+        buffer.add( host_config, name=name, signal_id=signal_id )
+        return
+
+    buffer = HostUpdateBuffer( request=request, user=user )
+    buffer.add( host_config, name=name, signal_id=signal_id )
+    if connection.in_atomic_block:
+        _update_context.buffer = weakref.ref( buffer )
+    transaction.on_commit( buffer.flush )
+
+
 # ------------------------------------------------------------------------------
 # Update Host Config
 # ------------------------------------------------------------------------------
@@ -359,7 +509,7 @@ def update_host_config(sender, instance, created: bool, **kwargs):
 
     
     # Find user who triggered change
-    user = get_latest_change_user( instance.pk )
+    user = get_current_user( instance.pk )
     if not user:
         logger.error( "[%s] no user found for Host Config %s. Cannot create/update Zabbix host.", signal_id, instance.pk )
         return
@@ -371,14 +521,13 @@ def update_host_config(sender, instance, created: bool, **kwargs):
 
 
     action = "update"
-    job_func = UpdateZabbixHost.run_job
 
     try:
         logger.info( "[%s] queuing %s Zabbix host for '%s'", action, signal_id, instance.name )
         
         name=f"{action.capitalize()} host in Zabbix for {instance.name}"
         request=get_current_request()
-        job_func( host_config=instance, request=request, name=name, signal_id=signal_id )
+        queue_host_update( instance, request=request, name=name, user=user, signal_id=signal_id )
 
         logger.info( "[%s] successfully scheduled %s Zabbix host for '%s'", action, signal_id, instance.name )
 
@@ -485,7 +634,7 @@ def create_or_update_zabbix_interface(sender, instance, created: bool, **kwargs)
         return
     
     # Find user who triggered change
-    user = get_latest_change_user(instance.pk)
+    user = get_current_user( instance.pk )
     if not user:
         logger.error( "[%s] cannot create/update Zabbix interface for pk=%s: missing latest change user", signal_id, instance.pk )
         return
@@ -586,7 +735,7 @@ def handle_interface_post_delete(sender, instance, **kwargs):
    # ------------------------------
    # Step 2: Schedule Zabbix host update
    # ------------------------------
-   user = get_latest_change_user( instance.pk )
+   user = get_current_user( instance.pk )
    if not user:
        logger.error( "[%s] cannot update Zabbix interface for instance pk=%s: missing latest change user", signal_id, instance.pk )
        return
@@ -597,7 +746,7 @@ def handle_interface_post_delete(sender, instance, **kwargs):
        request=get_current_request()
        name=f"Update Host in Zabbix for {host_config.name}"
 
-       UpdateZabbixHost.run_job( host_config=host_config, request=request, name=name, signal_id=signal_id )
+       queue_host_update( host_config, request=request, name=name, user=user, signal_id=signal_id )
 
        logger.info( "[%s] successfully scheduled Zabbix host update for '%s' due to %s interface deletion (interface pk=%s)", signal_id, host_config.name, instance.pk )
 
@@ -646,7 +795,7 @@ def create_or_update_ip_address(sender, instance, created, **kwargs):
    if host_config:
        
        # Get the user
-       user = get_latest_change_user( instance.pk )
+       user = get_current_user( instance.pk )
        if not user:
            logger.warning( "[%s] skipping Zabbix update: no user found for latest change on pk=%s.", signal_id, instance.pk )
            return
@@ -663,7 +812,7 @@ def create_or_update_ip_address(sender, instance, created, **kwargs):
            request = get_current_request()
            name=f"{action.capitalize()} IPAddress in Zabbix for Host Config {host_config.name}"
 
-           UpdateZabbixHost.run_job( host_config=host_config, request=request, name=name, user=user, signal_id=signal_id )
+           queue_host_update( host_config, request=request, name=name, user=user, signal_id=signal_id )
 
            logger.info( "[%s] successfully scheduled %s IPAddress in Zabbix for Host Config '%s'", signal_id, action, host_config.name )
 
@@ -749,7 +898,7 @@ def update_device_or_vm(sender, instance, **kwargs):
        return
 
    # Get the user
-   user = get_latest_change_user( instance.pk )
+   user = get_current_user( instance.pk )
    if not user:
        logger.warning( "[%s] failed to schedule Zabbix update, no user found for latest change on pk=%s.", signal_id, instance.pk )
        return
@@ -766,7 +915,7 @@ def update_device_or_vm(sender, instance, **kwargs):
 
            request=get_current_request()
            name=f"Update Host in Zabbix, name changed from {old_name} to {instance.name}"
-           UpdateZabbixHost.run_job( host_config=config, request=request, name=name, signal_id=signal_id )
+           queue_host_update( config, request=request, name=name, user=user, signal_id=signal_id )
            logger.info( "[%s] successfully scheduled Zabbix host update for '%s' due to name change from %s to %s", signal_id, instance.name, old_name, instance.name )
 
        except Exception as e:
@@ -794,7 +943,7 @@ def update_device_or_vm(sender, instance, **kwargs):
 
            request=get_current_request()
            name=f"Update Host in Zabbix, name changed from {old_name} to {instance.name}"
-           UpdateZabbixHost.run_job( host_config=config, request=request, name=name, signal_id=signal_id )
+           queue_host_update( config, request=request, name=name, user=user, signal_id=signal_id )
 
            logger.info( "[%s] successfully scheduled Zabbix host update for '%s' due to primary ip change to %s", signal_id, instance.name, instance.primary_ip4.address )
            
@@ -805,5 +954,233 @@ def update_device_or_vm(sender, instance, **kwargs):
        logger.warning( "[%s] primary IP assigned_object for name=%s is not an Interface or VMInterface, skipping Zabbix update.", signal_id, instance.name )
 
 
+# ------------------------------------------------------------------------------
+# Invalidate Template Graph
+# ------------------------------------------------------------------------------
+
+
+@receiver(post_save, sender=Template)
+@receiver(post_delete, sender=Template)
+@receiver(m2m_changed, sender=Template.parents.through)
+@receiver(m2m_changed, sender=Template.dependencies.through)
+def invalidate_template_graph_on_change(sender, **kwargs):
+    """
+    Invalidate the cached template graph when a Template, its parents or
+    its dependencies change.
+    
+    This receiver only maintains a cache and is therefore not affected by
+    DISABLE_NETBOX_ZABBIX_SIGNALS.
+    
+    Args:
+        sender (Model): Template model class or one of its through models.
+        **kwargs: Additional signal arguments.
+    """
+    if kwargs.get( "action", "post_" ).startswith( "post_" ):
+        invalidate_template_graph()
+
+
+@receiver(post_save, sender=TagMapping)
+@receiver(post_delete, sender=TagMapping)
+@receiver(post_save, sender=InventoryMapping)
+@receiver(post_delete, sender=InventoryMapping)
+@receiver(m2m_changed, sender=TaggedItem)
+def invalidate_mapping_plans_on_change(sender, instance, **kwargs):
+    """
+    Invalidate the compiled mapping plans when a TagMapping or
+    InventoryMapping, or the tags of a TagMapping, change.
+    
+    This receiver only maintains a cache and is therefore not affected by
+    DISABLE_NETBOX_ZABBIX_SIGNALS.
+    
+    Args:
+        sender (Model): Mapping model class or the TaggedItem through model.
+        instance (Model): The changed object.
+        **kwargs: Additional signal arguments.
+    """
+    if not isinstance( instance, ( TagMapping, InventoryMapping ) ):
+        return
+    if kwargs.get( "action", "post_" ).startswith( "post_" ):
+        invalidate_mapping_plans()
+
+
+# ------------------------------------------------------------------------------
+# Refresh Maintenance Membership
+# ------------------------------------------------------------------------------
+
+
+@receiver(post_save, sender=Maintenance)
+@receiver(m2m_changed, sender=Maintenance.host_configs.through)
+@receiver(m2m_changed, sender=Maintenance.sites.through)
+@receiver(m2m_changed, sender=Maintenance.host_groups.through)
+@receiver(m2m_changed, sender=Maintenance.proxies.through)
+@receiver(m2m_changed, sender=Maintenance.proxy_groups.through)
+@receiver(m2m_changed, sender=Maintenance.clusters.through)
+def refresh_maintenance_membership_on_change(sender, instance, **kwargs):
+    """
+    Rebuild the MaintenanceMembership rows of a Maintenance when it or its
+    scope changes. The rebuild runs when the transaction commits, after
+    all scope fields of the form have been saved.
+    
+    This receiver only maintains an index and is therefore not affected by
+    DISABLE_NETBOX_ZABBIX_SIGNALS.
+    
+    Args:
+        sender (Model): Maintenance model class or one of its through models.
+        instance (Model): The Maintenance, or the related object if the
+            relation was changed from the reverse side.
+        **kwargs: Additional signal arguments.
+    """
+    if not kwargs.get( "action", "post_" ).startswith( "post_" ):
+        return
+
+    if isinstance( instance, Maintenance ):
+        maintenance_pks = { instance.pk }
+    else:
+        maintenance_pks = kwargs.get( "pk_set" )
+
+    def refresh():
+        if maintenance_pks is None:
+            refresh_maintenance_memberships()
+            return
+        for maintenance in Maintenance.objects.filter( pk__in=maintenance_pks ):
+            maintenance.refresh_membership()
+
+    transaction.on_commit( refresh )
+
+
+# update_fields entries that may change the maintenance scope of a HostConfig
+MAINTENANCE_SCOPE_UPDATE_FIELDS = {
+    "monitored_by",
+    "proxy", "proxy_id",
+    "proxy_group", "proxy_group_id",
+    "content_type", "content_type_id",
+    "object_id",
+}
+
+
+@receiver(post_save, sender=HostConfig)
+def refresh_host_config_membership_on_save(sender, instance, created: bool, update_fields=None, **kwargs):
+    """
+    Rebuild the MaintenanceMembership rows of a HostConfig when it is created
+    or its monitored by, proxy, proxy group or assigned object changes.
+    
+    Saves that skip signals, such as the sync status and fingerprint updates
+    of the sync jobs, are ignored unless they create the HostConfig.
+    
+    This receiver only maintains an index and is therefore not affected by
+    DISABLE_NETBOX_ZABBIX_SIGNALS.
+    
+    Args:
+        sender (Model): HostConfig model class.
+        instance (HostConfig): Instance being saved.
+        created (bool): True if instance was newly created.
+        update_fields (frozenset | None): Fields passed to save().
+        **kwargs: Additional signal arguments.
+    """
+    if not created:
+        if getattr( instance, "_skip_signal", False ):
+            return
+        if update_fields is not None and not set( update_fields ) & MAINTENANCE_SCOPE_UPDATE_FIELDS:
+            return
+        if not instance.maintenance_scope_changed():
+            return
+
+    instance._loaded_maintenance_scope = instance.get_maintenance_scope()
+    pk = instance.pk
+    transaction.on_commit( lambda: refresh_host_config_memberships( { pk } ) )
+
+
+@receiver(m2m_changed, sender=HostConfig.host_groups.through)
+def refresh_host_config_membership_on_change(sender, instance, **kwargs):
+    """
+    Rebuild the MaintenanceMembership rows of HostConfigs when their host
+    groups change.
+    
+    This receiver only maintains an index and is therefore not affected by
+    DISABLE_NETBOX_ZABBIX_SIGNALS.
+    
+    Args:
+        sender (Model): The host_groups through model.
+        instance (Model): The HostConfig, or the HostGroup if the relation
+            was changed from the reverse side.
+        **kwargs: Additional signal arguments.
+    """
+    if not kwargs.get( "action", "post_" ).startswith( "post_" ):
+        return
+
+    if isinstance( instance, HostConfig ):
+        pks = { instance.pk }
+    elif kwargs.get( "pk_set" ) is not None:
+        pks = set( kwargs["pk_set"] )
+    else:
+        # Cleared from the HostGroup side
+        pks = set( HostConfig.objects.values_list( "pk", flat=True ) )
+
+    transaction.on_commit( lambda: refresh_host_config_memberships( pks ) )
+
+
+# Attribute holding the site and cluster a Device or VirtualMachine was loaded with
+LOADED_SITE_CLUSTER_ATTR = "_zabbix_loaded_site_cluster"
+
+
+def _get_site_cluster(instance):
+    """
+    Return the site and cluster IDs of a Device or VirtualMachine, or None if
+    either field is deferred.
+    """
+    if "site_id" not in instance.__dict__ or "cluster_id" not in instance.__dict__:
+        return None
+    return ( instance.__dict__["site_id"], instance.__dict__["cluster_id"] )
+
+
+@receiver(post_init, sender=Device)
+@receiver(post_init, sender=VirtualMachine)
+def track_device_or_vm_site_cluster(sender, instance, **kwargs):
+    """
+    Remember the site and cluster of a Device or VirtualMachine, so a move
+    can be detected on save without querying the database.
+    
+    Args:
+        sender (Model): Device or VirtualMachine class.
+        instance (Device | VirtualMachine): Initialized instance.
+        **kwargs: Additional signal arguments.
+    """
+    setattr( instance, LOADED_SITE_CLUSTER_ATTR, _get_site_cluster( instance ) )
+
+
+@receiver(pre_save, sender=Device)
+@receiver(pre_save, sender=VirtualMachine)
+def refresh_device_or_vm_membership_on_change(sender, instance, **kwargs):
+    """
+    Rebuild the MaintenanceMembership rows of the HostConfig of a Device or
+    VirtualMachine when it moves to another site or cluster.
+    
+    The site and cluster are compared with the values the instance was
+    loaded with, so saves that do not move the object cost no queries.
+    
+    This receiver only maintains an index and is therefore not affected by
+    DISABLE_NETBOX_ZABBIX_SIGNALS.
+    
+    Args:
+        sender (Model): Device or VirtualMachine class.
+        instance (Device | VirtualMachine): Instance being saved.
+        **kwargs: Additional signal arguments.
+    """
+    if not instance.pk:
+        return
+
+    loaded  = getattr( instance, LOADED_SITE_CLUSTER_ATTR, None )
+    current = _get_site_cluster( instance )
+    if loaded is None or current is None or loaded == current:
+        return
+    setattr( instance, LOADED_SITE_CLUSTER_ATTR, current )
+
+    config = getattr( instance, "host_config", None )
+    if not config:
+        return
+
+    pk = config.pk
+    transaction.on_commit( lambda: refresh_host_config_memberships( { pk } ) )
+
 
-# end
\ No newline at end of file
+# end
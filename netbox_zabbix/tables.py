@@ -45,10 +45,12 @@ from netbox_zabbix.models import (
     HostConfig,
     AgentInterface,
     SNMPInterface,
-    EventLog
+    EventLog,
+    in_maintenance_exists,
 )
-from netbox_zabbix.zabbix.validation import validate_quick_add
-from netbox_zabbix.netbox.interfaces import can_delete_interface, is_interface_available
+from netbox_zabbix.zabbix.validation import validate_quick_add, validate_zabbix_hosts
+from netbox_zabbix.netbox.interfaces import can_delete_interface, is_interface_available, prefetch_interface_status
+from netbox_zabbix.netbox.host_config import attach_host_configs
 from netbox_zabbix.netbox.permissions import has_any_model_permission
 from netbox_zabbix.logger import logger
 
@@ -164,6 +166,8 @@ class SettingTable(NetBoxTable):
             'zabbix_import_interval',
             'host_config_sync_interval',
             'cutoff_host_config_sync',
+            'drift_detection_interval',
+            'problems_refresh_interval',
             'maintenance_cleanup_interval',
             'version',
             'api_endpoint',
@@ -506,6 +510,13 @@ class BaseMatchingMappingTable(NetBoxTable):
         fields = ("name", "host_config", "site", "role", "platform")
         default_columns = ("name", "host_config", "site", "role", "platform")
 
+    def paginate(self, *args, **kwargs):
+        """
+        Paginate the table and load the HostConfigs of the page in one query.
+        """
+        super().paginate( *args, **kwargs )
+        attach_host_configs( row.record for row in self.page.object_list )
+
     def render_host_config(self, record):
         """
         Render the host configuration status for a record.
@@ -630,7 +641,9 @@ class HostConfigTable(NetBoxTable):
 
 
     def order_in_maintenance(self, queryset, is_descending):
-          return order_queryset_by_attr( queryset, 'in_maintenance', descending=is_descending )
+        if "maintenance_active" not in queryset.query.annotations:
+            queryset = queryset.annotate( maintenance_active=in_maintenance_exists() )
+        return ( queryset.order_by( f"{'-' if is_descending else ''}maintenance_active", "name" ), True )
 
 
     def order_assigned_object(self, queryset, is_descending):
@@ -682,18 +695,41 @@ class BaseInterfaceTable(NetBoxTable):
         default_columns = ("name", "host_config", "interface", "resolved_ip_address", "resolved_dns_name", "removable" )
 
 
+    # Status of the interfaces on the current page, see paginate()
+    interface_status = None
+
+
+    def paginate(self, *args, **kwargs):
+        """
+        Paginate the table and fetch the Zabbix status of the page's interfaces in bulk.
+        """
+        super().paginate( *args, **kwargs )
+        if { "removable", "available" } & set( self.columns.names() ):
+            self.interface_status = prefetch_interface_status( row.record for row in self.page.object_list )
+
+
+    def get_interface_status(self, record, key):
+        """
+        Return the prefetched status of an interface, or check it directly
+        if the table has not been paginated.
+        """
+        if self.interface_status is None:
+            return can_delete_interface( record ) if key == "removable" else is_interface_available( record )
+        return self.interface_status.get( record.pk, {} ).get( key, False )
+
+
     def render_removable(self, record):
         """
         Render a checkmark or cross depending on if an interface can be deleted without having to delete templates.
         """
-        return mark_safe( '<span style="color:green;">✔</span>' ) if can_delete_interface( record ) else mark_safe( '<span style="color:red;">✘</span>' )
+        return mark_safe( '<span style="color:green;">✔</span>' ) if self.get_interface_status( record, "removable" ) else mark_safe( '<span style="color:red;">✘</span>' )
 
 
     def render_available(self, record):
         """
         Render a checkmark or cross depending on the availability of the interface.
         """
-        return mark_safe( "✔" ) if is_interface_available( record ) else mark_safe( "✘" )
+        return mark_safe( "✔" ) if self.get_interface_status( record, "available" ) else mark_safe( "✘" )
 
 
 # ------------------------------------------------------------------------------
@@ -788,6 +824,16 @@ class ImportableHostsTable(NetBoxTable):
         """
         return mark_safe( f'<input class="form-check-input" type="checkbox" name="pk" value="{record.pk}:{record.content_type}">' )
 
+    def paginate(self, *args, **kwargs):
+        """
+        Paginate the table and validate all hosts of the page in one batch.
+        The results are kept in `self.reasons` for the lifetime of the table.
+        """
+        super().paginate( *args, **kwargs )
+        if settings.get_auto_validate_importables():
+            reasons = validate_zabbix_hosts( row.record for row in self.page.object_list )
+            self.reasons.update( { f"{pk}:{content_type_id}": reason for ( content_type_id, pk ), reason in reasons.items() } )
+
     def _validate_record(self, record):
         """
         Validate a HostConfig record.
@@ -808,7 +854,7 @@ class ImportableHostsTable(NetBoxTable):
         """
         Render validation status of a record.
         """
-        if settings.get_auto_validate_quick_add():
+        if settings.get_auto_validate_importables():
             return mark_safe( "✔" if self._validate_record( record ) is None else "✘" )
         return mark_safe( "-" )
     
@@ -816,7 +862,7 @@ class ImportableHostsTable(NetBoxTable):
         """
         Render the reason a record is invalid.
         """
-        if settings.get_auto_validate_quick_add():
+        if settings.get_auto_validate_importables():
             reason = self._validate_record( record )
             return reason or ""
         return ""
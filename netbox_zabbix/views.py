@@ -52,7 +52,7 @@ from netbox_zabbix import settings, filtersets, forms, tables
 from netbox_zabbix.jobs.host import UpdateZabbixHost
 from netbox_zabbix.jobs.imports import ImportZabbixSettings, ImportHost
 from netbox_zabbix.jobs.validate import ValidateHost
-from netbox_zabbix.jobs.synchosts import SyncHostsNow
+from netbox_zabbix.jobs.synchosts import SyncHostsNow, SyncHostsFanOut, get_sync_hosts_shards
 from netbox_zabbix.jobs.system import SystemJobHostConfigSyncRefresh
 from netbox_zabbix.jobs.provision import ProvisionAgent, ProvisionSNMP
 from netbox_zabbix.zabbix import api as zapi
@@ -73,9 +73,11 @@ from netbox_zabbix.models import (
     SNMPInterface,
     Maintenance,
     EventLog,
+    in_maintenance_exists,
 )
 from netbox_zabbix.zabbix.validation import validate_quick_add
 from netbox_zabbix.netbox.interfaces import can_delete_interface, is_interface_available
+from netbox_zabbix.netbox.problems import get_host_problems, get_problem_count
 from netbox_zabbix.netbox.permissions import has_any_model_permission
 from netbox_zabbix.logger import logger
 
@@ -2035,13 +2037,7 @@ class HostConfigView(generic.ObjectView):
         """
         super().get_extra_context( request, instance )
         web_address = settings.get_zabbix_web_address()
-        problems = []
-        table = None
-        try:
-            problems = zapi.get_problems( instance.assigned_object.name )
-        except:
-            pass
-        table = tables.ZabbixProblemTable( problems )
+        table = tables.ZabbixProblemTable( get_host_problems( instance ) )
         return { "web_address":  web_address, "table": table }
 
 
@@ -2049,7 +2045,7 @@ class HostConfigListView(generic.ObjectListView):
     """
     Display a list of HostConfig instances.
     """
-    queryset  = HostConfig.objects.all()
+    queryset  = HostConfig.objects.annotate( maintenance_active=in_maintenance_exists() )
     table     = tables.HostConfigTable
     filterset = filtersets.HostConfigFilterSet
 
@@ -2148,7 +2144,7 @@ class HostConfigBulkDeleteView(generic.BulkDeleteView):
     """
     Bulk delete multiple HostConfig instances.
     """
-    queryset = HostConfig.objects.all()
+    queryset = HostConfig.objects.annotate( maintenance_active=in_maintenance_exists() )
     table    = tables.HostConfigTable
 
     def get_return_url(self, request, obj=None):
@@ -2205,6 +2201,12 @@ def sync_all(request):
     redirect_url = request.GET.get( "return_url" ) or request.META.get( "HTTP_REFERER", "/" )
 
     try:
+        # Spread large syncs over several RQ workers
+        if get_sync_hosts_shards() > 1:
+            job = SyncHostsFanOut.run_job( request=request )
+            messages.success( request, mark_safe( f'Queued job <a href=/core/jobs/{job.id}/>#{job.id}</a> to sync all hosts' ) )
+            return redirect( redirect_url )
+
         # Pass result container to job via kwargs
         result = SyncHostsNow.run_now( user=request.user, name="Sync all hosts now"  )
         messages.success( request,  mark_safe( result ) )
@@ -2252,7 +2254,7 @@ class AgentInterfaceListView(generic.ObjectListView):
     """
     Display a list of all AgentInterface instances with table and filters.
     """
-    queryset      = AgentInterface.objects.all()
+    queryset      = AgentInterface.objects.select_related( "host_config" )
     table         = tables.AgentInterfaceTable
     filterset     = filtersets.AgentInterfaceFilterSet
     template_name = 'netbox_zabbix/agent_interface_list.html'
@@ -2348,7 +2350,7 @@ class SNMPInterfaceListView(generic.ObjectListView):
     """
     List all SNMPInterface instances with table and filters.
     """
-    queryset      = SNMPInterface.objects.all()
+    queryset      = SNMPInterface.objects.select_related( "host_config" )
     table         = tables.SNMPInterfaceTable
     filterset     = filtersets.SNMPInterfaceFilterSet
     template_name = 'netbox_zabbix/snmp_interface_list.html'
@@ -2630,7 +2632,7 @@ class MaintenanceHostConfigsView(generic.ObjectView):
         Returns:
             dict: Context containing the table of matching HostConfigs.
         """
-        queryset = instance.get_matching_host_configs()
+        queryset = instance.get_matching_host_configs().annotate( maintenance_active=in_maintenance_exists() )
         table    = tables.HostConfigTable( queryset )
         RequestConfig(
             request,
@@ -3242,7 +3244,7 @@ class HostConfigProblemsTabView(generic.ObjectView):
     Tab view to display Zabbix problems for a HostConfig.
     """
     queryset      = HostConfig.objects.all()
-    tab           = ViewTab( label="Zabbix Problems", badge=lambda instance: len( zapi.get_problems( instance.assigned_object.name ) ) )
+    tab           = ViewTab( label="Zabbix Problems", badge=lambda instance: get_problem_count( instance ) )
     template_name = 'netbox_zabbix/host_config_zabbix_problems_tab.html'
 
 
@@ -3262,12 +3264,7 @@ class HostConfigProblemsTabView(generic.ObjectView):
         jobs_table    = JobTable(jobs_queryset)
         
         # Zabbix problems table
-        problems = []
-        try:
-            problems = zapi.get_problems(instance.assigned_object.name)
-        except Exception:
-            pass
-        problems_table = tables.ZabbixProblemTable(problems)
+        problems_table = tables.ZabbixProblemTable( get_host_problems( instance ) )
         
         return {
             "jobs_table":     jobs_table,
@@ -3316,7 +3313,7 @@ class HostConfigDiffTabView(generic.ObjectView):
     Tab view to display configuration differences for a HostConfig.
     """
     queryset      = HostConfig.objects.all()
-    tab           = ViewTab( label="Difference", badge=lambda instance: int( instance.get_in_sync_status() ), hide_if_empty=True )
+    tab           = ViewTab( label="Difference", badge=lambda instance: int( instance.get_in_sync_status( use_fingerprint=True ) ), hide_if_empty=True )
     template_name = 'netbox_zabbix/host_config_difference_tab.html'
 
     def get_extra_context(self, request, instance):
@@ -3348,11 +3345,7 @@ class ZabbixDeviceTabView(generic.ObjectView):
     tab = ViewTab(
         label="Zabbix",
         hide_if_empty=True,
-        badge=lambda device: str( len( zapi.get_problems( device.name ) )
-        ) if HostConfig.objects.filter(
-            content_type=ContentType.objects.get_for_model( Device ),
-            object_id=device.pk
-        ).exists() else 0
+        badge=lambda obj: str( get_problem_count( obj.host_config ) ) if obj.host_config else 0
     )
 
 
@@ -3372,15 +3365,10 @@ class ZabbixDeviceTabView(generic.ObjectView):
             content_type=ContentType.objects.get_for_model( Device ),
             object_id=device.pk
         ).first()
-        problems = []
         table = None
 
         if config:
-            try:
-                problems = zapi.get_problems( device.name )
-            except:
-                problems = []
-            table = tables.ZabbixProblemTable( problems )
+            table = tables.ZabbixProblemTable( get_host_problems( config ) )
 
         return render(
             request,
@@ -3409,11 +3397,7 @@ class VMVirtualMachineTabView(generic.ObjectView):
     tab = ViewTab(
         label="Zabbix",
         hide_if_empty=True,
-        badge=lambda device: str( len( zapi.get_problems( device.name ) )
-        ) if HostConfig.objects.filter(
-            content_type=ContentType.objects.get_for_model( VirtualMachine ),
-            object_id=device.pk
-        ).exists() else 0
+        badge=lambda obj: str( get_problem_count( obj.host_config ) ) if obj.host_config else 0
     )
 
     def get(self, request, pk):
@@ -3432,15 +3416,10 @@ class VMVirtualMachineTabView(generic.ObjectView):
             content_type=ContentType.objects.get_for_model( VirtualMachine ),
             object_id=vm.pk
         ).first()
-        problems = []
         table = None
 
         if config:
-            try:
-                problems = zapi.get_problems( vm.name )
-            except:
-                problems = []
-            table = tables.ZabbixProblemTable( problems )
+            table = tables.ZabbixProblemTable( get_host_problems( config ) )
 
         return render(
             request,
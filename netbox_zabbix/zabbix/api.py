@@ -17,12 +17,18 @@ This wrapper relies on the `pyzabbix` library for all API calls and assumes that
 valid credentials and endpoint configuration are stored in the NetBox database.
 """
 
+# Standard library imports
+import threading
+import time
+
 # Django imports
 from django.utils import timezone
 from django.core.cache import cache
+from django.conf import settings as plugin_settings
 
 # Third-party imports
-from pyzabbix import ZabbixAPI
+from pyzabbix import ZabbixAPI, ZabbixAPIException
+from requests.exceptions import ConnectionError as RequestsConnectionError
 
 # NetBox imports
 from dcim.models import Device
@@ -40,6 +46,7 @@ from netbox_zabbix.zabbix.templates import (
     enrich_templates_with_interface_types,
     enrich_templates_with_dependencies
 )
+from netbox_zabbix.zabbix.template_graph import invalidate_template_graph
 from netbox_zabbix.logger import logger
 
 # ------------------------------------------------------------------------------
@@ -57,13 +64,158 @@ class ZabbixHostNotFound(Exception):
 # ------------------------------------------------------------------------------
 
 
+# Default used when PLUGINS_CONFIG does not set 'zabbix_client_max_age'.
+DEFAULT_CLIENT_MAX_AGE = 300
+
+# Substrings Zabbix uses in error messages when a session/token is no longer valid.
+SESSION_ERROR_MARKERS = ( "re-login", "not authorized", "not authorised", "session terminated" )
+
+
+def _get_client_max_age():
+    """
+    Return the client reuse window from the plugin configuration.
+    
+    Returns:
+        int: Number of seconds a client is reused before it is re-created.
+    """
+    config = plugin_settings.PLUGINS_CONFIG.get( "netbox_zabbix", {} )
+    return max( 0, int( config.get( "zabbix_client_max_age", DEFAULT_CLIENT_MAX_AGE ) ) )
+
+
+def _is_session_error(error):
+    """
+    Check whether an exception raised by a Zabbix API call indicates that
+    the session should be re-established.
+    
+    Args:
+        error (Exception): Exception raised by the API call.
+    
+    Returns:
+        bool: True if re-authenticating and retrying may succeed.
+    """
+    if isinstance( error, RequestsConnectionError ):
+        return True
+    if isinstance( error, ZabbixAPIException ):
+        message = str( error ).lower()
+        return any( marker in message for marker in SESSION_ERROR_MARKERS )
+    return False
+
+
+class PooledZabbixAPI(ZabbixAPI):
+    """
+    ZabbixAPI client that keeps its HTTP session alive between calls and
+    transparently re-authenticates once when Zabbix reports a session error.
+    """
+
+    def __init__(self, server, token, generation=0):
+        super().__init__( server )
+        self._api_token  = token
+        self._auth_lock  = threading.Lock()
+        self._auth_state = threading.local()
+        self.generation  = generation
+        self.created_at  = time.monotonic()
+        self.login( api_token=token )
+
+
+    def is_expired(self, max_age):
+        """
+        Return True if the client is older than the reuse window.
+        
+        Args:
+            max_age (int): Reuse window in seconds. 0 disables expiry.
+        """
+        return bool( max_age ) and ( time.monotonic() - self.created_at ) > max_age
+
+
+    def do_request(self, method, params=None):
+        """
+        Perform the API request, re-authenticating and retrying once if
+        the session has been terminated or the connection was dropped.
+        """
+        try:
+            return super().do_request( method, params )
+        except ( ZabbixAPIException, RequestsConnectionError ) as e:
+            # Requests made by login() itself are not retried
+            if getattr( self._auth_state, "active", False ) or not _is_session_error( e ):
+                raise
+            logger.info( f"Zabbix session error on '{method}', re-authenticating: {e}" )
+            with self._auth_lock:
+                self._auth_state.active = True
+                try:
+                    self.login( api_token=self._api_token )
+                finally:
+                    self._auth_state.active = False
+            return super().do_request( method, params )
+
+
+class ZabbixClientManager:
+    """
+    Process-wide manager of authenticated Zabbix API clients.
+    
+    Every thread owns one client, so an HTTP session is never shared between
+    threads. The client is bound to the configured endpoint and token and
+    reused across calls until the reuse window expires, the credentials
+    change or `reset()` is called. A thread's client is released with the
+    thread.
+    """
+
+    def __init__(self):
+        self._lock       = threading.Lock()
+        self._local      = threading.local()
+        self._generation = 0
+
+
+    def get_client(self):
+        """
+        Return the authenticated client of the calling thread.
+        
+        Returns:
+            ZabbixAPI: An authenticated Zabbix API client instance.
+        
+        Raises:
+            ZabbixSettingNotFound: If the configuration is missing.
+            Exception: If authentication fails.
+        """
+        endpoint = get_zabbix_api_endpoint()
+        token    = get_zabbix_token()
+        key      = ( endpoint, token )
+        max_age  = _get_client_max_age()
+
+        with self._lock:
+            generation = self._generation
+
+        client = getattr( self._local, "client", None )
+        if (
+            client is not None
+            and getattr( self._local, "key", None ) == key
+            and client.generation == generation
+            and not client.is_expired( max_age )
+        ):
+            return client
+
+        client = PooledZabbixAPI( endpoint, token, generation )
+        self._local.client = client
+        self._local.key    = key
+        return client
+
+
+    def reset(self):
+        """Drop all clients. The next call of every thread creates a new session."""
+        with self._lock:
+            self._generation += 1
+            self._local.client = None
+
+
+client_manager = ZabbixClientManager()
+
+
 def get_zabbix_client():
     """
-    Initializes and returns an authenticated Zabbix API client.
+    Returns an authenticated Zabbix API client.
     
-    Retrieves the Zabbix configuration from the database and uses it to 
-    instantiate and authenticate a ZabbixAPI client. If configuration is missing 
-    or authentication fails, an exception is raised.
+    Clients are taken from the process-wide `ZabbixClientManager`, which
+    keeps one logged in session per thread, bound to the configured endpoint
+    and token, instead of logging in on every call.
     
     Returns:
         ZabbixAPI: An authenticated Zabbix API client instance.
@@ -73,14 +225,39 @@ def get_zabbix_client():
         Exception: If authentication fails or any other error occurs.
     """
     try:
-        z = ZabbixAPI( get_zabbix_api_endpoint() )
-        z.login( api_token=get_zabbix_token() )
-        return z
+        return client_manager.get_client()
             
     except Exception as e:
         raise e
 
 
+def get_api_userid():
+    """
+    Return the Zabbix user ID the plugin's API token belongs to.
+    
+    The ID is looked up once per client.
+    
+    Returns:
+        str: Zabbix user ID.
+    
+    Raises:
+        ZabbixSettingNotFound: If the configuration is missing.
+        Exception: If the token cannot be checked.
+    """
+    z = get_zabbix_client()
+    userid = getattr( z, "userid", None )
+    if userid is None:
+        userid = z.userid = str( z.user.checkAuthentication( token=z._api_token )["userid"] )
+    return userid
+
+
+def reset_zabbix_clients():
+    """
+    Drop all Zabbix API clients held by this process.
+    """
+    client_manager.reset()
+
+
 def validate_zabbix_credentials(api_endpoint, token):
     """
     Validates the provided Zabbix API endpoint and API token.
@@ -197,6 +374,10 @@ def get_item_types(template_ids:list):
         raise e
 
 
+# Default number of template/trigger IDs requested per trigger.get call.
+DEFAULT_TRIGGER_CHUNK_SIZE = 200
+
+
 def get_triggers( template_ids:list):
     """
     Retrieve triggers for the given Zabbix templates.
@@ -246,6 +427,34 @@ def get_trigger( triggerid ):
         raise e
 
 
+def get_triggers_by_ids( triggerids:list, chunk_size=DEFAULT_TRIGGER_CHUNK_SIZE ):
+    """
+    Retrieve many triggers by ID in chunked calls.
+    
+    Connects to the Zabbix API and fetches the given triggers, including
+    their associated hosts, using one `trigger.get` call per chunk.
+    
+    Args:
+        triggerids (iterable): The IDs of the triggers to retrieve.
+        chunk_size (int, optional): Number of trigger IDs per API call.
+    
+    Returns:
+        list: A list of triggers with their ID and associated host information.
+    """
+    ids = sorted( { str( triggerid ) for triggerid in triggerids } )
+    triggers = []
+    try:
+        z = get_zabbix_client()
+        for start in range( 0, len( ids ), chunk_size ):
+            triggers.extend( z.trigger.get( triggerids=ids[start:start + chunk_size],
+                                            output=["triggerid"],
+                                            selectHosts=["hostid", "name"]
+                                          ) )
+        return triggers
+    except Exception as e:
+        raise e
+
+
 def get_proxies():
     """
     Retrieves all Zabbix proxies.
@@ -536,12 +745,146 @@ def get_host_by_id_with_templates(hostid):
         raise
 
 
+# Host fields used by the payload builder and the host comparison.
+HOST_COMPARE_OUTPUT = [
+    "hostid",
+    "host",
+    "name",
+    "status",
+    "monitored_by",
+    "proxyid",
+    "proxy_groupid",
+    "description",
+    "inventory_mode",
+    "tls_connect",
+    "tls_accept",
+    "tls_psk_identity",
+]
+
+# Interface fields used by the payload builder and the host comparison.
+INTERFACE_COMPARE_OUTPUT = [ "interfaceid", "type", "main", "useip", "ip", "dns", "port", "details" ]
+
+# Default number of hostids requested per host.get call.
+DEFAULT_HOST_CHUNK_SIZE = 500
+
+
+def get_hosts_by_ids(hostids, chunk_size=DEFAULT_HOST_CHUNK_SIZE, output=None, with_templates=True):
+    """
+    Retrieves many hosts from Zabbix in chunked `host.get` calls.
+    
+    Only the fields consumed by the payload builder and the host comparison
+    are requested, unless `output` is given. Hosts that do not exist in
+    Zabbix are simply missing from the returned map.
+    
+    Args:
+        hostids (iterable): Zabbix hostids to retrieve.
+        chunk_size (int, optional): Number of hostids per API call.
+        output (list, optional): Host fields to return. Defaults to HOST_COMPARE_OUTPUT.
+        with_templates (bool, optional): Rename 'parentTemplates' to 'templates'
+                                         as done by `get_host_by_id_with_templates`.
+    
+    Returns:
+        dict: Mapping of hostid (str) to host dictionary.
+    
+    Raises:
+        ZabbixSettingNotFound: If the Zabbix configuration is missing.
+        Exception: If an API error occurs.
+    """
+    ids = sorted( { str( hostid ) for hostid in hostids if hostid } )
+    if not ids:
+        return {}
+
+    chunk_size = max( 1, int( chunk_size ) )
+    hosts = {}
+
+    try:
+        z = get_zabbix_client()
+        for start in range( 0, len( ids ), chunk_size ):
+            chunk = ids[start:start + chunk_size]
+            result = z.host.get(
+                hostids=chunk,
+                output=output or HOST_COMPARE_OUTPUT,
+                selectInterfaces=INTERFACE_COMPARE_OUTPUT,
+                selectParentTemplates=[ "templateid", "name" ],
+                selectTags=[ "tag", "value" ],
+                selectGroups=[ "groupid", "name" ],
+                selectInventory="extend"
+            )
+            for host in result:
+                if with_templates:
+                    host["templates"] = host.pop( "parentTemplates", [] )
+                hosts[ str( host["hostid"] ) ] = host
+
+    except ZabbixSettingNotFound as e:
+        raise e
+
+    except Exception as e:
+        msg = f"Failed to retrieve {len( ids )} hosts by host id from Zabbix, error: {e}"
+        logger.error( msg )
+        raise Exception( msg )
+
+    return hosts
+
+
+# Interface fields used by the host validation.
+INTERFACE_VALIDATE_OUTPUT = [ "interfaceid", "type", "useip", "ip", "dns", "port" ]
+
+
+def get_hosts_by_names(hostnames, chunk_size=DEFAULT_HOST_CHUNK_SIZE):
+    """
+    Retrieves many hosts from Zabbix by hostname in chunked `host.get` calls.
+    
+    Only the fields used by `validate_zabbix_host` are requested: the
+    hostname, the interfaces and the parent templates.
+    
+    Args:
+        hostnames (iterable): Hostnames to retrieve.
+        chunk_size (int, optional): Number of hostnames per API call.
+    
+    Returns:
+        dict: Mapping of hostname to the list of matching host dictionaries.
+              Hostnames that do not exist in Zabbix are missing from the map.
+    
+    Raises:
+        ZabbixSettingNotFound: If the Zabbix configuration is missing.
+        Exception: If an API error occurs.
+    """
+    names = sorted( { name for name in hostnames if name } )
+    if not names:
+        return {}
+
+    chunk_size = max( 1, int( chunk_size ) )
+    hosts = {}
+
+    try:
+        z = get_zabbix_client()
+        for start in range( 0, len( names ), chunk_size ):
+            result = z.host.get(
+                filter={ "host": names[start:start + chunk_size] },
+                output=[ "hostid", "host" ],
+                selectInterfaces=INTERFACE_VALIDATE_OUTPUT,
+                selectParentTemplates=[ "templateid", "name" ],
+            )
+            for host in result:
+                hosts.setdefault( host["host"], [] ).append( host )
+
+    except ZabbixSettingNotFound as e:
+        raise e
+
+    except Exception as e:
+        msg = f"Failed to retrieve {len( names )} hosts by name from Zabbix, error: {e}"
+        logger.error( msg )
+        raise Exception( msg )
+
+    return hosts
+
+
 # ------------------------------------------------------------------------------
 # Import Settings
 # ------------------------------------------------------------------------------
 
 
-def import_items(*, fetch_remote, model, id_field, extra_fields=None, name="item", max_deletions=None ):
+def import_items(*, fetch_remote, model, id_field, extra_fields=None, name="item", max_deletions=None, bulk=True ):
     """
     Generic import function for syncing Zabbix items (templates, proxies, etc).
 
@@ -552,6 +895,10 @@ def import_items(*, fetch_remote, model, id_field, extra_fields=None, name="item
         extra_fields (list of str, optional): Extra fields to include in `update_or_create`.
         name (str): Friendly name for logging (e.g., "template", "proxy group").
         max_deletions (int, optional): Maximum allowed deletions.
+        bulk (bool, optional): Use bulk queries instead of one query per item.
+                               Bulk queries write no changelog entries.
+                               Set to False for models that rely on `save()`
+                               or when the changelog is required.
 
     Returns:
         tuple: (added_items, deleted_items)
@@ -566,6 +913,20 @@ def import_items(*, fetch_remote, model, id_field, extra_fields=None, name="item
         logger.error( f"Failed to fetch Zabbix {name}: {str( e )}" )
         raise
 
+    if max_deletions is None:
+        max_deletions = get_max_deletions()
+
+    if bulk:
+        return _import_items_bulk( items, model, id_field, extra_fields, name, max_deletions )
+    return _import_items_per_row( items, model, id_field, extra_fields, name, max_deletions )
+
+
+def _import_items_per_row(items, model, id_field, extra_fields, name, max_deletions):
+    """
+    Import remote items with one `update_or_create` per item.
+
+    See `import_items` for the arguments.
+    """
     remote_ids = {item[id_field] for item in items}
     current_qs = model.objects.all()
     current_ids = set( current_qs.values_list( id_field, flat=True ) )
@@ -601,9 +962,6 @@ def import_items(*, fetch_remote, model, id_field, extra_fields=None, name="item
     to_delete_ids = current_ids - remote_ids
     deleted = []
 
-    if max_deletions is None:
-        max_deletions = get_max_deletions()
-
     if len(to_delete_ids) >= max_deletions:
         logger.debug( f"{name}s to delete: {to_delete_ids}" )
         raise RuntimeError( f"Too many deletions ({len(to_delete_ids)}), max allowed is {max_deletions}" )
@@ -617,7 +975,112 @@ def import_items(*, fetch_remote, model, id_field, extra_fields=None, name="item
     return added, deleted
 
 
-def import_templates(max_deletions=None):
+def _import_items_bulk(items, model, id_field, extra_fields, name, max_deletions):
+    """
+    Import remote items with bulk queries.
+
+    Remote items are diffed against the local rows in memory. New rows are
+    created with `bulk_create`, only rows whose fields actually changed are
+    written with `bulk_update` (and get a new `last_synced` and
+    `last_updated`), the `parents` M2M is rebuilt through its through-table
+    and removed rows are deleted with a single filtered delete.
+
+    Bulk queries bypass `save()`, `delete()` and their signals, so no
+    changelog (ObjectChange) entries are recorded for created, updated or
+    deleted rows. The rows mirror Zabbix and are re-imported on every run,
+    so the import keeps its own record in the returned added/deleted lists.
+
+    See `import_items` for the arguments.
+    """
+    now   = timezone.now()
+    local = { str( getattr( obj, id_field ) ): obj for obj in model.objects.all() }
+    remote_ids = { str( item[id_field] ) for item in items }
+
+    to_delete_ids = set( local ) - remote_ids
+    if len( to_delete_ids ) >= max_deletions:
+        logger.debug( f"{name}s to delete: {to_delete_ids}" )
+        raise RuntimeError( f"Too many deletions ({len(to_delete_ids)}), max allowed is {max_deletions}" )
+
+    def remote_values(item):
+        values = { "name": item["name"] }
+        for field in extra_fields:
+            if field in item and item[field] != '':
+                values[field] = model._meta.get_field( field ).to_python( item[field] )
+        return values
+
+    added   = []
+    created = []
+    changed = []
+    changed_fields = set()
+
+    for item in items:
+        values = remote_values( item )
+        obj    = local.get( str( item[id_field] ) )
+
+        if obj is None:
+            obj = model( **{ id_field: item[id_field] }, last_synced=now, **values )
+            local[ str( item[id_field] ) ] = obj
+            created.append( obj )
+            added.append( item )
+            continue
+
+        diff = [ field for field, value in values.items() if getattr( obj, field ) != value ]
+        if diff:
+            for field in diff:
+                setattr( obj, field, values[field] )
+            obj.last_synced  = now
+            obj.last_updated = now
+            changed.append( obj )
+            changed_fields.update( diff )
+
+    # Placeholders for parent templates that are not (yet) known
+    parent_ids = { str( p["templateid"] ) for item in items for p in item.get( "parentTemplates", [] ) }
+    for pid in parent_ids - set( local ):
+        obj = model( templateid=pid, name=f"Placeholder-{pid}" )
+        local[pid] = obj
+        created.append( obj )
+
+    model.objects.bulk_create( created, batch_size=1000 )
+    if changed:
+        model.objects.bulk_update( changed, list( changed_fields | { "last_synced", "last_updated" } ), batch_size=1000 )
+
+    # Rebuild the parents M2M for items that report parent templates
+    with_parents = [ item for item in items if "parentTemplates" in item ]
+    if with_parents:
+        Through  = model.parents.through
+        from_pks = [ local[ str( item[id_field] ) ].pk for item in with_parents ]
+        desired  = {
+            ( local[ str( item[id_field] ) ].pk, local[ str( p["templateid"] ) ].pk )
+            for item in with_parents
+            for p in item["parentTemplates"]
+        }
+        existing = {
+            ( from_pk, to_pk ): pk
+            for pk, from_pk, to_pk in Through.objects.filter( from_template_id__in=from_pks )
+                                                     .values_list( "pk", "from_template_id", "to_template_id" )
+        }
+        stale = [ pk for pair, pk in existing.items() if pair not in desired ]
+        if stale:
+            Through.objects.filter( pk__in=stale ).delete()
+        Through.objects.bulk_create(
+            [ Through( from_template_id=f, to_template_id=t ) for f, t in desired - set( existing ) ],
+            batch_size=1000
+        )
+
+    # Rows removed from Zabbix no longer exist there, so there is nothing to
+    # delete remotely and a single filtered delete is sufficient.
+    deleted = []
+    if to_delete_ids:
+        for obj_id in sorted( to_delete_ids ):
+            obj = local[obj_id]
+            logger.debug( f"Deleted {name} {obj.name} ({getattr(obj, id_field)})" )
+            deleted.append( ( obj.name, getattr( obj, id_field ) ) )
+        model.objects.filter( pk__in=[ local[obj_id].pk for obj_id in to_delete_ids ] ).delete()
+
+    return added, deleted
+
+
+def import_templates(max_deletions=None, templates=None, item_types=None, dependencies=None):
     """
     Import templates from Zabbix into the local database.
     
@@ -626,11 +1089,14 @@ def import_templates(max_deletions=None):
     
     Args:
         max_deletions (int, optional): Maximum number of templates to delete. Uses default if not provided.
+        templates (list, optional): Prefetched result of `get_templates()`.
+        item_types (list, optional): Prefetched result of `get_item_types()` for all templates.
+        dependencies (dict, optional): Prefetched result of `get_templates_dependencies()`.
     
     Returns:
         tuple: A tuple of (added_templates, deleted_templates).
     """
-    added_templates, deleted_templates =  import_items( fetch_remote=get_templates, 
+    added_templates, deleted_templates =  import_items( fetch_remote=get_templates if templates is None else lambda: templates, 
                                                         model=models.Template, 
                                                         id_field="templateid", 
                                                         name="template", 
@@ -638,17 +1104,20 @@ def import_templates(max_deletions=None):
 
     # Calculate and store the interface type for each template
     try:
-        enrich_templates_with_interface_types()
+        enrich_templates_with_interface_types( all_items=item_types )
     except Exception as e:
         raise e
     
     # Populate the template with template dependencies.
-    enrich_templates_with_dependencies()
+    enrich_templates_with_dependencies( dependencies=dependencies )
+
+    # Templates, parents or dependencies may have changed
+    invalidate_template_graph()
 
     return added_templates, deleted_templates
 
 
-def import_proxies(max_deletions=None):
+def import_proxies(max_deletions=None, proxies=None):
     """
     Import proxies from Zabbix into the local database.
     
@@ -657,6 +1126,7 @@ def import_proxies(max_deletions=None):
     
     Args:
         max_deletions (int, optional): Maximum number of proxies to delete. Uses default if not provided.
+        proxies (list, optional): Prefetched result of `get_proxies()`.
     
     Returns:
         tuple: A tuple of (added_proxies, deleted_proxies).
@@ -665,7 +1135,7 @@ def import_proxies(max_deletions=None):
     # Since tls_psk_identity and tls_psk are write only, they are not in
     # the extra_fields.
     
-    return import_items( fetch_remote=get_proxies, 
+    return import_items( fetch_remote=get_proxies if proxies is None else lambda: proxies, 
                          model=models.Proxy, 
                          id_field="proxyid", 
                          extra_fields=[ 
@@ -692,10 +1162,11 @@ def import_proxies(max_deletions=None):
                             "timeout_script", 
                             "timeout_browser"
                         ], 
-                         name="proxy", max_deletions=max_deletions )
+                         name="proxy", max_deletions=max_deletions,
+                         bulk=False ) # Proxy.save() derives proxy_groupid
 
 
-def import_proxy_groups(max_deletions=None):
+def import_proxy_groups(max_deletions=None, proxy_groups=None):
     """
     Import proxy groups from Zabbix into the local database.
     
@@ -704,11 +1175,12 @@ def import_proxy_groups(max_deletions=None):
     
     Args:
         max_deletions (int, optional): Maximum number of proxy groups to delete. Uses default if not provided.
+        proxy_groups (list, optional): Prefetched result of `get_proxy_groups()`.
     
     Returns:
         tuple: A tuple of (added_proxy_groups, deleted_proxy_groups).
     """
-    return import_items( fetch_remote=get_proxy_groups, 
+    return import_items( fetch_remote=get_proxy_groups if proxy_groups is None else lambda: proxy_groups, 
                          model=models.ProxyGroup, 
                          id_field="proxy_groupid",
                          extra_fields=[ "failover_delay", "min_online", "description" ],
@@ -716,7 +1188,7 @@ def import_proxy_groups(max_deletions=None):
                          max_deletions=max_deletions )
 
 
-def import_host_groups(max_deletions=None):
+def import_host_groups(max_deletions=None, host_groups=None):
     """
     Import host groups from Zabbix into the local database.
     
@@ -725,11 +1197,12 @@ def import_host_groups(max_deletions=None):
     
     Args:
         max_deletions (int, optional): Maximum number of host groups to delete. Uses default if not provided.
+        host_groups (list, optional): Prefetched result of `get_host_groups()`.
     
     Returns:
         tuple: A tuple of (added_host_groups, deleted_host_groups).
     """
-    return import_items(fetch_remote=get_host_groups, 
+    return import_items(fetch_remote=get_host_groups if host_groups is None else lambda: host_groups, 
                         model=models.HostGroup, 
                         id_field="groupid", 
                         name="host group", 
@@ -1084,6 +1557,47 @@ def interface_availability(hostid, interfaceid):
         raise e
 
 
+def get_interfaces_status(hostids, interfaceids):
+    """
+    Retrieve the availability and removability of many host interfaces.
+    
+    Uses one `hostinterface.get` for the availability and one `item.get`
+    for the items that use the interfaces, instead of one call per
+    interface as `interface_availability` and `can_remove_interface` do.
+    
+    Args:
+        hostids (iterable): IDs of the hosts that own the interfaces.
+        interfaceids (iterable): IDs of the interfaces to check.
+    
+    Returns:
+        dict: Mapping of interfaceid (str) to {"available": bool, "removable": bool}.
+              Interfaces that do not exist in Zabbix are missing from the map.
+    
+    Raises:
+        Exception: If there is an error communicating with the Zabbix API.
+    """
+    hostids      = sorted( { str( hostid ) for hostid in hostids if hostid } )
+    interfaceids = sorted( { str( interfaceid ) for interfaceid in interfaceids if interfaceid } )
+    if not hostids or not interfaceids:
+        return {}
+
+    try:
+        z = get_zabbix_client()
+        interfaces = z.hostinterface.get( hostids=hostids, filter={ "interfaceid": interfaceids }, output=[ "interfaceid", "available" ] )
+        items      = z.item.get( hostids=hostids, filter={ "interfaceid": interfaceids }, output=[ "interfaceid" ] )
+    except Exception as e:
+        raise e
+
+    used = { str( item["interfaceid"] ) for item in items }
+    return {
+        str( iface["interfaceid"] ): {
+            "available": int( iface["available"] ) == 1,
+            "removable": str( iface["interfaceid"] ) not in used,
+        }
+        for iface in interfaces
+    }
+
+
 # ------------------------------------------------------------------------------
 # Maintenance
 # ------------------------------------------------------------------------------
@@ -1163,6 +1677,65 @@ def delete_maintenance(id):
         raise
 
 
+# ------------------------------------------------------------------------------
+# Audit Log
+# ------------------------------------------------------------------------------
+
+
+# Zabbix audit log resource type for hosts. Interface changes and template
+# linkage are recorded as changes of the host.
+AUDIT_RESOURCE_HOST = 4
+
+# Default number of audit log entries requested per auditlog.get call.
+DEFAULT_AUDIT_LOG_LIMIT = 10000
+
+
+def get_audit_log(time_from, resourcetypes=( AUDIT_RESOURCE_HOST, ), limit=DEFAULT_AUDIT_LOG_LIMIT, time_till=None):
+    """
+    Retrieve audit log entries recorded at or after a given time.
+    
+    Entries are returned oldest first. If `limit` entries are returned there
+    may be more; call again with the clock of the last entry.
+    
+    Args:
+        time_from (int): Unix timestamp of the oldest entry to return.
+        resourcetypes (Iterable[int], optional): Audit log resource types.
+        limit (int | None, optional): Maximum number of entries to return,
+            None for no limit.
+        time_till (int, optional): Unix timestamp of the newest entry to return.
+    
+    Returns:
+        list[dict]: Entries with 'auditid', 'userid', 'clock', 'action', 'resourcetype' and 'resourceid'.
+    
+    Raises:
+        ZabbixSettingNotFound: If the Zabbix configuration is missing.
+        Exception: If an API error occurs.
+    """
+    params = {
+        "output":    [ "auditid", "userid", "clock", "action", "resourcetype", "resourceid" ],
+        "filter":    { "resourcetype": [ str( t ) for t in resourcetypes ] },
+        "time_from": int( time_from ),
+        "sortfield": "clock",
+        "sortorder": "ASC",
+    }
+    if limit is not None:
+        params["limit"] = int( limit )
+    if time_till is not None:
+        params["time_till"] = int( time_till )
+
+    try:
+        z = get_zabbix_client()
+        return z.auditlog.get( **params )
+
+    except ZabbixSettingNotFound as e:
+        raise e
+
+    except Exception as e:
+        msg = f"Failed to retrieve the audit log from Zabbix, error: {e}"
+        logger.error( msg )
+        raise Exception( msg )
+
+
 # ------------------------------------------------------------------------------
 # Problems
 # ------------------------------------------------------------------------------
@@ -1207,4 +1780,71 @@ def get_problems(hostname):
         return []
 
 
+# Problem fields shown in the problem tables.
+PROBLEM_OUTPUT = [ "eventid", "severity", "acknowledged", "name", "clock" ]
+
+
+def get_problems_by_hostids(hostids, chunk_size=DEFAULT_HOST_CHUNK_SIZE):
+    """
+    Retrieves the active problems of many Zabbix hosts, indexed by hostid.
+    
+    Problems do not carry a hostid, so for every chunk of hosts one
+    `problem.get` is followed by one `trigger.get` that maps the triggers of
+    the problems to their hosts. Hosts without problems map to an empty list.
+    
+    Args:
+        hostids (iterable): Zabbix hostids to retrieve problems for.
+        chunk_size (int, optional): Number of hostids per API call.
+    
+    Returns:
+        dict: Mapping of hostid (str) to a list of problem dictionaries,
+              newest first.
+    
+    Raises:
+        ZabbixSettingNotFound: If the Zabbix configuration is missing.
+        Exception: If an API error occurs.
+    """
+    ids = sorted( { str( hostid ) for hostid in hostids if hostid } )
+    if not ids:
+        return {}
+
+    chunk_size = max( 1, int( chunk_size ) )
+    problems = { hostid: [] for hostid in ids }
+
+    try:
+        z = get_zabbix_client()
+        for start in range( 0, len( ids ), chunk_size ):
+            chunk = ids[start:start + chunk_size]
+            result = z.problem.get(
+                output=PROBLEM_OUTPUT + [ "objectid" ],
+                hostids=chunk,
+                sortfield="eventid",
+                sortorder="DESC"
+            )
+            if not result:
+                continue
+
+            triggers = z.trigger.get(
+                triggerids=list( { problem["objectid"] for problem in result } ),
+                output=[ "triggerid" ],
+                selectHosts=[ "hostid" ]
+            )
+            trigger_hosts = { trigger["triggerid"]: [ host["hostid"] for host in trigger.get( "hosts", [] ) ] for trigger in triggers }
+
+            for problem in result:
+                for hostid in trigger_hosts.get( problem.pop( "objectid" ), [] ):
+                    if hostid in problems:
+                        problems[hostid].append( problem )
+
+    except ZabbixSettingNotFound as e:
+        raise e
+
+    except Exception as e:
+        msg = f"Failed to retrieve problems of {len( ids )} hosts from Zabbix, error: {e}"
+        logger.error( msg )
+        raise Exception( msg )
+
+    return problems
+
+
 # end
\ No newline at end of file
@@ -12,12 +12,22 @@ Key functionality:
 - Generate Zabbix-compatible tags from object fields and NetBox tags
 - Resolve interface details and ensure existing interface IDs are preserved during updates
 - Handle monitored_by settings, proxies, TLS credentials, and inventory modes
+- Build the payloads of many HostConfigs at once with all related data prefetched
+- Compute a stable fingerprint of a payload to detect no-op updates
 """
 
+# Standard library imports
+import hashlib
+import json
+
+
+# Django imports
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Prefetch, prefetch_related_objects
 
 # NetBox Zabbix Imports
-from netbox_zabbix.zabbix.inventory_properties import inventory_properties
-from netbox_zabbix.helpers import resolve_attribute_path
+from netbox_zabbix.mapping.plans import get_inventory_plan, get_tag_plan, get_mapping_plans, get_object_lookups
+from netbox_zabbix.netbox.host_config import set_cached_host_config
 from netbox_zabbix import settings, models
 from netbox_zabbix.logger import logger
 
@@ -26,12 +36,14 @@ from netbox_zabbix.logger import logger
 # ------------------------------------------------------------------------------
 
 
-def generate_zabbix_inventory(obj):
+def generate_zabbix_inventory(obj, mappings=None):
     """
     Generate a Zabbix inventory dictionary for a Device or VirtualMachine.
     
     Args:
         obj: Device or VirtualMachine instance.
+        mappings (dict, optional): InventoryPlans keyed by object type. Defaults
+            to the cached plans.
     
     Returns:
         dict: Keys are inventory property names, values are string representations.
@@ -48,24 +60,13 @@ def generate_zabbix_inventory(obj):
 
     inventory = {}
 
-    try:
-        mapping = models.InventoryMapping.objects.get( object_type=object_type )
-    except models.InventoryMapping.DoesNotExist:
+    plan = mappings.get( object_type ) if mappings is not None else get_inventory_plan( object_type )
+    if plan is None:
         return inventory
 
-    for field in mapping.selection:
-        if not field.get( "enabled" ):
-            continue
-
-        invkey = str( field.get( "invkey" ) )
-        if invkey not in inventory_properties:
-            logger.error( f"{invkey} is not a legal inventory property" )
-            continue
-
-        paths = field.get( "paths" )
-
-        for path in paths:
-            value = resolve_attribute_path( obj, path )
+    for invkey, getters in plan.fields:
+        for getter in getters:
+            value = getter( obj )
             if value is None:
                 continue
             inventory[invkey] = str( value )
@@ -74,12 +75,14 @@ def generate_zabbix_inventory(obj):
     return inventory
 
 
-def generate_zabbix_tags(obj):
+def generate_zabbix_tags(obj, mappings=None):
     """
     Generate a list of Zabbix tag dictionaries for a Device or VirtualMachine.
     
     Args:
         obj: Device or VirtualMachine instance.
+        mappings (dict, optional): TagPlans keyed by object type. Defaults
+            to the cached plans.
     
     Returns:
         list[dict]: Each dict has "tag" and "value" keys.
@@ -104,23 +107,19 @@ def generate_zabbix_tags(obj):
     if default_tag_name:
         tags.append( { "tag": f"{tag_prefix}{default_tag_name}", "value": str( obj.pk ) } )
 
-    try:
-        mapping = models.TagMapping.objects.get( object_type=object_type )
-    except models.TagMapping.DoesNotExist:
+    plan = mappings.get( object_type ) if mappings is not None else get_tag_plan( object_type )
+    if plan is None:
         return tags
 
     # Add the tags that are the intersection between the mapping tags and the obj tags.
-    for tag in set( mapping.tags.all() & obj.tags.all() ):
-        tags.append({ "tag": f"{tag_prefix}{tag.name}", "value": tag.name })
+    # The intersection is done in memory so prefetched tags are used.
+    for tag in obj.tags.all():
+        if tag.pk in plan.tag_ids:
+            tags.append({ "tag": f"{tag_prefix}{tag.name}", "value": tag.name })
 
     # Field Selection
-    for field in mapping.selection:
-        if not field.get( "enabled" ):
-            continue
-
-        name = field.get( "name" )
-        path = field.get( "value" )
-        value = resolve_attribute_path( obj, path )
+    for name, getter in plan.fields:
+        value = getter( obj )
 
         if value is None:
             continue
@@ -147,7 +146,7 @@ def generate_zabbix_tags(obj):
 # ------------------------------------------------------------------------------
 
 
-def get_tags(obj, existing_tags=None):
+def get_tags(obj, existing_tags=None, mappings=None):
     """
     Generate Zabbix-compatible tags for a NetBox object.
     
@@ -157,6 +156,7 @@ def get_tags(obj, existing_tags=None):
     Args:
         obj (Device | VirtualMachine): NetBox object for which to generate tags.
         existing_tags (list, optional): Pre-existing tag dictionaries to include.
+        mappings (dict, optional): TagPlans keyed by object type.
     
     Returns:
         list[dict]: List of tag dictionaries with keys 'tag' and 'value'.
@@ -169,7 +169,7 @@ def get_tags(obj, existing_tags=None):
     result = []
 
     # Combine existing and dynamic tags, format and deduplicate in one loop
-    for tag in existing_tags + generate_zabbix_tags( obj ):
+    for tag in existing_tags + generate_zabbix_tags( obj, mappings ):
         name = tag['tag']
 
         if tag_name_formatting == models.TagNameFormattingChoices.LOWER:
@@ -185,7 +185,7 @@ def get_tags(obj, existing_tags=None):
     return result
 
 
-def payload(host_config, for_update=False, pre_data=None) -> dict:
+def payload(host_config, for_update=False, pre_data=None, mappings=None) -> dict:
     """
     Construct a Zabbix host payload from a HostConfig instance.
     
@@ -200,6 +200,7 @@ def payload(host_config, for_update=False, pre_data=None) -> dict:
         host_config (HostConfig): NetBox Zabbix configuration instance.
         for_update (bool, optional): Whether payload is for host.update() vs. host.create().
         pre_data (dict, optional): Existing Zabbix data to recover interface IDs.
+        mappings (dict, optional): Mapping plans, see `get_mapping_plans`.
     
     Returns:
         dict: Dictionary suitable for Zabbix API calls (host.create() or host.update()).
@@ -215,7 +216,7 @@ def payload(host_config, for_update=False, pre_data=None) -> dict:
         "proxyid":        "0",
         "proxy_groupid":  "0",
         "description":    str( host_config.description ) if host_config.description else "",
-        "tags":           get_tags( host_config.assigned_object ),
+        "tags":           get_tags( host_config.assigned_object, mappings=mappings["tags"] if mappings else None ),
         "groups":         [ {"groupid": g.groupid} for g in host_config.host_groups.all() ],
         "templates":      [ {"templateid": t.templateid} for t in host_config.templates.all() ],
         "inventory_mode": str( settings.get_inventory_mode() ),
@@ -237,20 +238,13 @@ def payload(host_config, for_update=False, pre_data=None) -> dict:
 
     # Inventory
     if payload["inventory_mode"] == str( models.InventoryModeChoices.MANUAL ):
-        payload["inventory"] = generate_zabbix_inventory( host_config.assigned_object )
+        payload["inventory"] = generate_zabbix_inventory( host_config.assigned_object, mappings["inventory"] if mappings else None )
 
     # TLS
     if settings.get_tls_connect() == models.TLSConnectChoices.PSK or settings.get_tls_accept() == models.TLSAcceptChoices.PSK:
         payload["tls_psk_identity"] = settings.get_tls_psk_identity()
         payload["tls_psk"] = settings.get_tls_psk()
 
-    # Build a map of existing Zabbix interfaces (only for updates)
-    existing_ifaces = {}
-    if for_update and pre_data and "interfaces" in pre_data:
-        for iface in pre_data["interfaces"]:
-            key = ( iface.get("ip"), iface.get( "dns" ), iface.get( "type" ), iface.get( "port" ) )
-            existing_ifaces[key] = iface.get( "interfaceid" )
-
     # Interfaces handling
     interfaces = []
     for iface in host_config.agent_interfaces.all():
@@ -294,14 +288,169 @@ def payload(host_config, for_update=False, pre_data=None) -> dict:
         if for_update:
             if iface.interfaceid:
                 entry["interfaceid"] = str( iface.interfaceid )
-            else:
-                key = ( entry["ip"], entry["dns"], entry["type"], entry["port"] )
-                if key in existing_ifaces:
-                    entry["interfaceid"] = existing_ifaces[key]
 
         interfaces.append( entry )
 
     payload["interfaces"] = interfaces
 
+    # Recover the IDs of existing Zabbix interfaces (only for updates)
+    if for_update and pre_data:
+        recover_interface_ids( payload, pre_data )
+
+    return payload
+
+
+def recover_interface_ids(payload, pre_data):
+    """
+    Add the IDs of existing Zabbix interfaces to SNMP interfaces in the
+    payload that have no interface ID in NetBox.
+    
+    Interfaces are matched on IP, DNS, type and port.
+    
+    Args:
+        payload (dict): Update payload, modified in place.
+        pre_data (dict): Existing Zabbix host with its interfaces.
+    
+    Returns:
+        dict: The payload.
+    """
+    existing_ifaces = {}
+    for iface in pre_data.get( "interfaces", [] ):
+        key = ( iface.get("ip"), iface.get( "dns" ), iface.get( "type" ), iface.get( "port" ) )
+        existing_ifaces[key] = iface.get( "interfaceid" )
+
+    for entry in payload.get( "interfaces", [] ):
+        if entry["type"] != "2" or "interfaceid" in entry:
+            continue
+        key = ( entry["ip"], entry["dns"], entry["type"], entry["port"] )
+        if key in existing_ifaces:
+            entry["interfaceid"] = existing_ifaces[key]
+
     return payload
 
+
+# ------------------------------------------------------------------------------
+# Payload Fingerprint
+# ------------------------------------------------------------------------------
+
+
+# Payload keys that do not describe the content of a host
+FINGERPRINT_IGNORED_KEYS = { "hostid", "templates_clear" }
+
+
+def payload_fingerprint(payload):
+    """
+    Return a stable content hash of a host payload.
+    
+    The hash only covers what is pushed to Zabbix. The host and interface
+    IDs are left out, so a create payload and the matching update payload
+    get the same fingerprint, and tags, groups and templates are sorted.
+    
+    Args:
+        payload (dict): Host payload from `payload()`.
+    
+    Returns:
+        str: Hex encoded SHA-256 digest.
+    """
+    content = { key: value for key, value in payload.items() if key not in FINGERPRINT_IGNORED_KEYS }
+
+    for key in ( "tags", "groups", "templates" ):
+        if key in content:
+            content[key] = sorted( content[key], key=lambda item: json.dumps( item, sort_keys=True ) )
+
+    if "interfaces" in content:
+        content["interfaces"] = [ { k: v for k, v in iface.items() if k != "interfaceid" } for iface in content["interfaces"] ]
+
+    encoded = json.dumps( content, sort_keys=True, default=str, separators=( ",", ":" ) )
+    return hashlib.sha256( encoded.encode() ).hexdigest()
+
+
+# ------------------------------------------------------------------------------
+# Batch Payload Functions
+# ------------------------------------------------------------------------------
+
+
+def _prefetch_assigned_objects(host_configs, plans):
+    """
+    Load the Devices and VirtualMachines assigned to the HostConfigs per
+    content type and attach them to the HostConfigs. The relations used by
+    the mapping plans are loaded with them.
+    
+    Args:
+        host_configs (list[HostConfig]): HostConfigs to update in place.
+        plans (dict): Mapping plans, see `get_mapping_plans`.
+    """
+    assigned_object = models.HostConfig._meta.get_field( "assigned_object" )
+
+    by_content_type = {}
+    for host_config in host_configs:
+        if not assigned_object.is_cached( host_config ):
+            by_content_type.setdefault( host_config.content_type_id, [] ).append( host_config )
+
+    for content_type_id, members in by_content_type.items():
+        model   = ContentType.objects.get_for_id( content_type_id ).model_class()
+        select, prefetch = get_object_lookups( model._meta.model_name, plans )
+        objects = model.objects.select_related( "primary_ip4", *select ).prefetch_related( *prefetch ).in_bulk( { hc.object_id for hc in members } )
+
+        for host_config in members:
+            obj = objects.get( host_config.object_id )
+            if obj is not None:
+                host_config.assigned_object = obj
+                set_cached_host_config( obj, host_config )
+
+
+def prefetch_host_configs(host_configs, plans=None):
+    """
+    Load all related data needed to build the payloads of many HostConfigs.
+    
+    The number of queries does not depend on the number of HostConfigs:
+    proxies, proxy groups, host groups, templates and interfaces (with their
+    IP addresses) are prefetched, and the assigned Devices and VirtualMachines
+    are loaded per content type with their tags and mapped relations.
+    
+    Args:
+        host_configs (Iterable[HostConfig]): HostConfig instances or a queryset.
+        plans (dict, optional): Mapping plans. Defaults to the cached plans.
+    
+    Returns:
+        list[HostConfig]: The HostConfigs with all related data cached.
+    """
+    host_configs = list( host_configs )
+    prefetch_related_objects(
+        host_configs,
+        "proxy",
+        "proxy_group",
+        "host_groups",
+        "templates",
+        Prefetch( "agent_interfaces", queryset=models.AgentInterface.objects.select_related( "ip_address" ) ),
+        Prefetch( "snmp_interfaces",  queryset=models.SNMPInterface.objects.select_related( "ip_address" ) ),
+    )
+    _prefetch_assigned_objects( host_configs, plans or get_mapping_plans() )
+    return host_configs
+
+
+def build_payloads(host_configs, for_update=False, pre_data=None):
+    """
+    Build the payloads of many HostConfigs with a fixed number of queries.
+    
+    Args:
+        host_configs (Iterable[HostConfig]): HostConfig instances or a queryset.
+        for_update (bool, optional): Whether payloads are for host.update() vs. host.create().
+        pre_data (dict, optional): Existing Zabbix hosts keyed by hostid, e.g.
+            from `get_hosts_by_ids`, used to recover interface IDs.
+    
+    Returns:
+        dict[int, dict]: Payloads keyed by HostConfig pk. HostConfigs whose
+            payload cannot be built are logged and left out.
+    """
+    mappings     = get_mapping_plans()
+    host_configs = prefetch_host_configs( host_configs, mappings )
+
+    payloads = {}
+    for host_config in host_configs:
+        host_pre_data = pre_data.get( str( host_config.hostid ) ) if pre_data and host_config.hostid else None
+        try:
+            payloads[host_config.pk] = payload( host_config, for_update, host_pre_data, mappings )
+        except Exception as e:
+            logger.warning( f"Failed to build payload for HostConfig {host_config.pk}: {e}" )
+    return payloads
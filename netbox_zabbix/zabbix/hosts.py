@@ -6,6 +6,7 @@ hosts as managed through NetBox. It provides:
 
 - Host creation using NetBox HostConfig definitions
 - Full update logic respecting host synchronization modes
+- Diff-based updates that only send the changed top-level keys
 - Hard deletion (permanent removal) in Zabbix
 - Soft deletion workflows including archival renaming and reassignment to a
   graveyard host group
@@ -15,11 +16,34 @@ and integrate with NetBox’s changelog and job-tracking mechanisms.
 """
 
 
+# Django imports
+from django.conf import settings as plugin_settings
+
+# NetBox Zabbix Imports
 from netbox_zabbix import settings, models
 from netbox_zabbix.zabbix import builders
+from netbox_zabbix.netbox.compare import build_update_delta
 from netbox_zabbix.zabbix import api as zapi
 from netbox_zabbix.exceptions import ExceptionWithData
 from netbox_zabbix.netbox.changelog import log_update_event
+from netbox_zabbix.netbox.utils import save_without_signals
+from netbox_zabbix.helpers import QueryCounter
+from netbox_zabbix.logger import logger
+
+
+# Default when PLUGINS_CONFIG does not set 'diff_host_updates'
+DEFAULT_DIFF_HOST_UPDATES = True
+
+
+def get_diff_host_updates():
+    """
+    Return whether host updates only send the changed top-level keys.
+
+    Returns:
+        bool: Value of 'diff_host_updates' in the plugin configuration.
+    """
+    config = plugin_settings.PLUGINS_CONFIG.get( "netbox_zabbix", {} )
+    return bool( config.get( "diff_host_updates", DEFAULT_DIFF_HOST_UPDATES ) )
 
 
 def create_zabbix_host( host_config ):
@@ -48,13 +72,18 @@ def create_zabbix_host( host_config ):
     return int( hostid ), payload
 
 
-def update_zabbix_host(host_config, user, request_id):
+def update_zabbix_host(host_config, user, request_id, pre_data=None, payload=None, diff=None, force=False):
     """
     Update an existing Zabbix host based on its HostConfig.
 
     Performs:
-        - Fetching current host state from Zabbix
-        - Determining templates/groups/tags to remove/add.
+        - Building the update payload once
+        - Skipping the update if the payload fingerprint matches the last
+          payload pushed to Zabbix
+        - Fetching current host state from Zabbix and using it to recover
+          the IDs of existing interfaces
+        - Determining templates to remove from the payload
+        - Reducing the payload to the keys that differ from Zabbix (diff mode)
         - Sending host.update() payload to Zabbix
         - Logging changelog entry in NetBox
 
@@ -62,9 +91,19 @@ def update_zabbix_host(host_config, user, request_id):
         host_config (HostConfig): Configuration object representing the host.
         user (User): NetBox user performing the update.
         request_id (str): Request ID for changelog tracking.
+        pre_data (dict, optional): Prefetched Zabbix host, e.g. from
+            `get_hosts_by_ids`. If omitted the host is fetched from Zabbix.
+        payload (dict, optional): Prebuilt update payload, e.g. from
+            `builders.build_payloads`. If omitted the payload is built here.
+        diff (bool, optional): Only send the changed top-level keys. Defaults
+            to 'diff_host_updates' in the plugin configuration.
+        force (bool, optional): Update the host even if its payload
+            fingerprint has not changed.
 
     Returns:
-        dict: Message and pre/post payload data.
+        dict: Message, pre/post payload data and the number of database
+              queries used to build the payload. In diff mode pre/post data
+              only hold the changed keys.
 
     Raises:
         ExceptionWithData: If update fails.
@@ -72,51 +111,86 @@ def update_zabbix_host(host_config, user, request_id):
     if not isinstance( host_config, models.HostConfig ):
         raise ValueError( "host_config must be an instance of HostConfig" )
 
-    # Fetch current state of the host in Zabbix
-    try:
-        pre_data = zapi.get_host_by_id_with_templates( host_config.hostid )
-
-    except Exception as e:
-        raise Exception( f"Failed to get host by id from Zabbix: {str(e)}" )
+    # Build payload for update
+    with QueryCounter() as queries:
+        if payload is None:
+            payload = builders.payload( host_config, for_update=True )
+        else:
+            payload = dict( payload )
+    logger.debug( f"Built update payload for {host_config.name} with {queries.count} queries" )
+
+    # Nothing to do if the payload equals the last payload pushed to Zabbix
+    fingerprint = builders.payload_fingerprint( payload )
+    if not force and host_config.payload_fingerprint == fingerprint:
+        return {
+            "message": f"Zabbix host {host_config.hostid} is unchanged since the last update",
+            "pre_data": {},
+            "post_data": {},
+            "queries": queries.count,
+        }
 
-    # Build base payload
-    payload = builders.payload( host_config, for_update=True )
+    # Fetch current state of the host in Zabbix
+    if pre_data is None:
+        try:
+            pre_data = zapi.get_host_by_id_with_templates( host_config.hostid )
     
+        except Exception as e:
+            raise Exception( f"Failed to get host by id from Zabbix: {str(e)}" )
+
+    # Recover the IDs of existing interfaces
+    payload["interfaces"] = [ dict( iface ) for iface in payload.get( "interfaces", [] ) ]
+    builders.recover_interface_ids( payload, pre_data )
 
     # Current template IDs in Zabbix (directly assigned to host)
     current_template_ids = set( t["templateid"] for t in pre_data.get( "templates", [] ) )
         
     # Templates currently assigned in NetBox
-    new_template_ids = set( str( tid ) for tid in host_config.templates.values_list( "templateid", flat=True ) )
+    new_template_ids = set( str( t["templateid"] ) for t in payload.get( "templates", [] ) )
         
     # Only remove templates that are no longer assigned
     removed_template_ids = current_template_ids - new_template_ids
     templates_clear = [ {"templateid": tid} for tid in removed_template_ids ]
         
-    # Build payload for update
-    payload = builders.payload( host_config, for_update=True )
+    if diff is None:
+        diff = get_diff_host_updates()
+    diff = diff and "hostid" in payload
+
+    # Only send what differs from the current state in Zabbix
+    if diff:
+        payload  = build_update_delta( payload, pre_data )
+        pre_data = { key: pre_data.get( key ) for key in payload if key in pre_data }
+
     if templates_clear:
         payload[ "templates_clear" ] = templates_clear
 
     # Update the host in Zabbix
-    try:
-        zapi.update_host( **payload )
-    except Exception as e:
-        if isinstance( e, ExceptionWithData ):
-            raise
-        raise ExceptionWithData(
-            f"Failed to update Zabbix host {host_config.name}: {e}",
-            pre_data=pre_data,
-            post_data=payload,
-        )
+    if diff and set( payload ) == { "hostid" }:
+        message = f"Zabbix host {host_config.hostid} is already up to date"
+    else:
+        try:
+            zapi.update_host( **payload )
+        except Exception as e:
+            if isinstance( e, ExceptionWithData ):
+                raise
+            raise ExceptionWithData(
+                f"Failed to update Zabbix host {host_config.name}: {e}",
+                pre_data=pre_data,
+                post_data=payload,
+            )
+        message = f"Updated Zabbix host {host_config.hostid}"
+
+    # Remember what Zabbix now looks like
+    host_config.payload_fingerprint = fingerprint
+    save_without_signals( host_config, update_fields=["payload_fingerprint"] )
 
     # Document the update in NetBox
     log_update_event( host_config, user, request_id )
 
     return {
-        "message": f"Updated Zabbix host {host_config.hostid}",
+        "message": message,
         "pre_data": pre_data,
         "post_data": payload,
+        "queries": queries.count,
     }
 
 
@@ -104,7 +104,7 @@ def import_zabbix_host(ctx: ImportHostContext):
         raise Exception( f"Host config for '{ctx.obj_instance.name}' already exists" )
 
     # Create config instance
-    config              = models.HostConfig( name=f"z-{ctx.obj_instance.name}", content_type=ctx.content_type, object_id=ctx.obj_instance.pk )
+    config              = models.HostConfig( name=f"z-{ctx.obj_instance.name}", assigned_object=ctx.obj_instance )
     config.hostid       = int( ctx.zabbix_host["hostid"] )
     config.status       = models.StatusChoices.DISABLED if int( ctx.zabbix_host.get( "status", 0 ) ) else models.StatusChoices.ENABLED
     config.monitored_by = int( ctx.zabbix_host.get( "monitored_by" ) )
@@ -0,0 +1,238 @@
+"""
+NetBox Zabbix Plugin — Template Graph Index
+
+This module provides an in-memory index of the imported Zabbix templates and
+their parent and dependency relationships.
+
+The index is built from `Template` and the `parents` and `dependencies`
+through-tables in three queries. For every template it precomputes:
+
+- The transitive closure of its parent templates (ancestors)
+- The transitive closure of its trigger dependencies
+- The interface types required by the template, its ancestors and its
+  dependencies, and the resulting effective interface type
+
+The index is cached per process and shared between threads. A version stamp
+stored in the Django cache is bumped by `invalidate_template_graph()` when
+templates are imported or edited and the transaction commits, which makes
+every process rebuild its index on next use.
+"""
+
+# Standard library imports
+import threading
+import uuid
+from dataclasses import dataclass
+
+# Django imports
+from django.core.cache import cache
+from django.db import transaction
+
+# NetBox Zabbix Imports
+from netbox_zabbix import models
+
+
+# Cache key holding the current version of the template graph
+TEMPLATE_GRAPH_VERSION_KEY = "netbox_zabbix_template_graph_version"
+
+
+# ------------------------------------------------------------------------------
+# Graph Index
+# ------------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class TemplateNode:
+    """
+    A template in the graph index with its precomputed closures.
+
+    Attributes:
+        id (int): Primary key of the Template.
+        templateid (str): Zabbix template ID.
+        name (str): Template name.
+        interface_type (int): Interface type of the template itself.
+        ancestors (frozenset[int]): Primary keys of all (transitive) parents.
+        dependencies (frozenset[int]): Primary keys of all (transitive) dependencies.
+        required_interface_types (frozenset[int]): Non-Any interface types required
+            by the template, its ancestors and its dependencies.
+    """
+    id:                       int
+    templateid:               str
+    name:                     str
+    interface_type:           int
+    ancestors:                frozenset
+    dependencies:             frozenset
+    required_interface_types: frozenset
+
+
+    @property
+    def effective_interface_type(self):
+        """
+        The interface type a host needs for this template.
+
+        Returns:
+            InterfaceTypeChoices: Agent or SNMP if exactly one is required, otherwise Any.
+        """
+        if len( self.required_interface_types ) == 1:
+            return next( iter( self.required_interface_types ) )
+        return models.InterfaceTypeChoices.Any
+
+
+def _closure(edges, start):
+    """
+    Collect all nodes reachable from `start`, excluding `start` itself
+    unless it is part of a cycle.
+
+    Args:
+        edges (dict[int, set[int]]): Adjacency map.
+        start (int): Start node.
+
+    Returns:
+        set[int]: Reachable nodes.
+    """
+    seen  = set()
+    stack = list( edges.get( start, () ) )
+    while stack:
+        node = stack.pop()
+        if node in seen:
+            continue
+        seen.add( node )
+        stack.extend( edges.get( node, () ) )
+    return seen
+
+
+class TemplateGraph:
+    """
+    Immutable index of all templates and their relationships.
+    """
+
+    def __init__(self, nodes):
+        self.nodes         = nodes
+        self.by_templateid = { node.templateid: node for node in nodes.values() }
+
+
+    @classmethod
+    def build(cls):
+        """
+        Build the index from the database in three queries.
+
+        Returns:
+            TemplateGraph: The new index.
+        """
+        rows = list( models.Template.objects.order_by( "pk" ).values_list( "pk", "templateid", "name", "interface_type" ) )
+
+        parents = {}
+        for from_id, to_id in models.Template.parents.through.objects.values_list( "from_template_id", "to_template_id" ):
+            parents.setdefault( from_id, set() ).add( to_id )
+
+        dependencies = {}
+        for from_id, to_id in models.Template.dependencies.through.objects.values_list( "from_template_id", "to_template_id" ):
+            dependencies.setdefault( from_id, set() ).add( to_id )
+
+        interface_types = { pk: interface_type for pk, _, _, interface_type in rows }
+        ancestors       = { pk: _closure( parents, pk ) - { pk } for pk, *_ in rows }
+        all_deps        = { pk: _closure( dependencies, pk ) - { pk } for pk, *_ in rows }
+
+        nodes = {}
+        for pk, templateid, name, interface_type in rows:
+            related  = { pk } | ancestors[pk] | all_deps[pk]
+            required = { interface_types[r] for r in related if r in interface_types } - { models.InterfaceTypeChoices.Any }
+            nodes[pk] = TemplateNode(
+                id=pk,
+                templateid=str( templateid ),
+                name=name,
+                interface_type=interface_type,
+                ancestors=frozenset( ancestors[pk] ),
+                dependencies=frozenset( all_deps[pk] ),
+                required_interface_types=frozenset( required ),
+            )
+
+        return cls( nodes )
+
+
+    def get_nodes(self, templateids):
+        """
+        Return the nodes for the given Zabbix template IDs, ordered by primary key.
+        Unknown template IDs are ignored.
+
+        Args:
+            templateids (iterable): Zabbix template IDs.
+
+        Returns:
+            list[TemplateNode]: Matching nodes.
+        """
+        wanted = { str( tid ) for tid in templateids }
+        return sorted( ( self.by_templateid[tid] for tid in wanted if tid in self.by_templateid ), key=lambda n: n.id )
+
+
+    def related(self, node):
+        """
+        Return the node, its ancestors and its dependencies as nodes.
+
+        Args:
+            node (TemplateNode): The template node.
+
+        Returns:
+            list[TemplateNode]: Related nodes, ordered by primary key.
+        """
+        return [ self.nodes[pk] for pk in sorted( { node.id } | node.ancestors | node.dependencies ) if pk in self.nodes ]
+
+
+# ------------------------------------------------------------------------------
+# Process-wide Cache
+# ------------------------------------------------------------------------------
+
+
+_lock    = threading.Lock()
+_graph   = None
+_version = None
+
+
+def get_template_graph():
+    """
+    Return the cached template graph, rebuilding it if it has been invalidated.
+
+    Returns:
+        TemplateGraph: The current index.
+    """
+    global _graph, _version
+
+    version = cache.get( TEMPLATE_GRAPH_VERSION_KEY )
+    with _lock:
+        if _graph is not None and version == _version:
+            return _graph
+
+    graph = TemplateGraph.build()
+
+    with _lock:
+        _graph   = graph
+        _version = version
+    return graph
+
+
+def _reset_template_graph():
+    """
+    Drop the template graph of this process.
+    """
+    global _graph
+
+    with _lock:
+        _graph = None
+
+
+def invalidate_template_graph():
+    """
+    Invalidate the template graph in all processes.
+    
+    The graph of this process is dropped immediately. The shared version
+    stamp is bumped when the current transaction commits, so other processes
+    do not rebuild their graph from uncommitted rows.
+    """
+    def bump():
+        cache.set( TEMPLATE_GRAPH_VERSION_KEY, uuid.uuid4().hex, None )
+        _reset_template_graph()
+
+    _reset_template_graph()
+    transaction.on_commit( bump )
+
+
+# end
@@ -20,9 +20,13 @@ operations across the plugin, ensuring template sets are internally consistent
 and compatible with the host’s interface types.
 """
 
+# Django imports
+from django.db import transaction
+
 # NetBox Zabbix Imports
 from netbox_zabbix import models
 from netbox_zabbix.zabbix import api as zapi
+from netbox_zabbix.zabbix.template_graph import TemplateGraph, get_template_graph
 from netbox_zabbix.logger import logger
 
 
@@ -102,45 +106,28 @@ def get_template_dependencies(templateid):
         list[int]: List of dependent template IDs, excluding the input template.
     """
 
-    # Fetch triggers for the template, including their dependencies
-    try:
-        triggers = zapi.get_triggers( [ templateid ] )
-    except:
-        raise
-
-    deps = []
-    for trig in triggers:
-        for dep in trig.get( "dependencies", [] ):
-            dep_triggerid = dep["triggerid"]
-
-            try:
-                dep_trigger = zapi.get_trigger( dep_triggerid )[0]
-            except:
-                raise
+    return sorted( get_templates_dependencies( [ templateid ] ).get( int( templateid ), set() ) )
 
-            for host in dep_trigger.get("hosts", []):
-                dep_templateid = host["hostid"]
-                if int( dep_templateid ) != int( templateid ):  # exclude the original template
-                    deps.append( int( dep_templateid ) )
 
-    return deps
-
-
-def enrich_templates_with_interface_types():
+def enrich_templates_with_interface_types(all_items=None):
     """
     Populate all Template objects with their computed interface type
     based on associated Zabbix items.
+    
+    Args:
+        all_items (list, optional): Prefetched items of all templates. Fetched from Zabbix if omitted.
     """
     # This function is called by import template to add the interface type for
     # each template in the database.
     
     # Fetch ALL items for ALL templates in one call
-    all_template_ids = list( models.Template.objects.values_list( "templateid", flat=True ) )
+    if all_items is None:
+        all_template_ids = list( models.Template.objects.values_list( "templateid", flat=True ) )
 
-    try:
-        all_items = zapi.get_item_types( all_template_ids )
-    except:
-        raise
+        try:
+            all_items = zapi.get_item_types( all_template_ids )
+        except:
+            raise
 
     # Group items by templateid
     items_by_template = {}
@@ -149,9 +136,13 @@ def enrich_templates_with_interface_types():
         items_by_template.setdefault( tid, [] ).append( item )
 
 
-    # Calculate and store the interface type for each template
-    for template in models.Template.objects.all():
-        all_ids = collect_template_ids( template )
+    # Calculate and store the interface type for each template. The graph is
+    # built fresh since the parents have just been imported.
+    graph = TemplateGraph.build()
+    templates = list( models.Template.objects.all() )
+    for template in templates:
+        node = graph.nodes[template.pk]
+        all_ids = { node.templateid } | { graph.nodes[pk].templateid for pk in node.ancestors }
 
         # Collect items for this template and all its parents
         items = []
@@ -159,30 +150,92 @@ def enrich_templates_with_interface_types():
             items.extend( items_by_template.get( tid, [] ) )
 
         template.interface_type = determine_interface_type( items )
-        template.save()
 
+    models.Template.objects.bulk_update( templates, [ "interface_type" ], batch_size=1000 )
 
-def enrich_templates_with_dependencies():
+
+def get_templates_dependencies(templateids, chunk_size=None):
+    """
+    Retrieve the Zabbix template IDs that each of the given templates depends on.
+    
+    Triggers (with their dependencies) are fetched for all templates in a few
+    chunked calls, the hosts of all dependent triggers are resolved in one more
+    chunked call, and the dependency graph is built in memory.
+    
+    Args:
+        templateids (iterable): Zabbix template IDs.
+        chunk_size (int, optional): Number of IDs per API call.
+                                    Defaults to `DEFAULT_TRIGGER_CHUNK_SIZE` in the api module.
+    
+    Returns:
+        dict[int, set[int]]: Template ID → IDs of the templates it depends on,
+                             excluding the template itself.
+    """
+    chunk_size  = chunk_size or zapi.DEFAULT_TRIGGER_CHUNK_SIZE
+    templateids = sorted( { int( tid ) for tid in templateids } )
+    wanted      = set( templateids )
+    dependencies = { tid: set() for tid in templateids }
+
+    # Fetch triggers for all templates, including their dependencies
+    triggers = []
+    for start in range( 0, len( templateids ), chunk_size ):
+        triggers.extend( zapi.get_triggers( templateids[start:start + chunk_size] ) )
+
+    # Template ID(s) owning each dependent trigger
+    dep_triggerids = { dep["triggerid"] for trig in triggers for dep in trig.get( "dependencies", [] ) }
+    dep_trigger_hosts = {}
+    if dep_triggerids:
+        for dep_trigger in zapi.get_triggers_by_ids( dep_triggerids, chunk_size=chunk_size ):
+            dep_trigger_hosts[dep_trigger["triggerid"]] = { int( h["hostid"] ) for h in dep_trigger.get( "hosts", [] ) }
+
+    for trig in triggers:
+        owners = { int( h["hostid"] ) for h in trig.get( "hosts", [] ) } & wanted
+        for dep in trig.get( "dependencies", [] ):
+            dep_templateids = dep_trigger_hosts.get( dep["triggerid"], set() )
+            for owner in owners:
+                dependencies[owner] |= dep_templateids - { owner } # exclude the original template
+
+    return dependencies
+
+
+def enrich_templates_with_dependencies(dependencies=None):
     """
     Populate all Template objects with dependencies based on triggers
     retrieved from Zabbix.
+    
+    The dependency graph is resolved in bulk and the M2M rows are replaced
+    through the through-table in a single transaction.
+    
+    Args:
+        dependencies (dict, optional): Prefetched result of `get_templates_dependencies()`.
+                                       Fetched from Zabbix if omitted.
     """
     # This function is called by import template to add dependencies for
     # each template in the database.
-    
-    for template in models.Template.objects.all():
+
+    templates = { int( t.templateid ): t.pk for t in models.Template.objects.only( "pk", "templateid" ) }
+
+    if dependencies is None:
         try:
             # Get dependent template IDs from triggers
-            dependent_template_ids = get_template_dependencies(template.templateid)
-
-            # Resolve Template objects (exclude missing templates)
-            dependent_templates = models.Template.objects.filter(templateid__in=dependent_template_ids)
+            dependencies = get_templates_dependencies( templates.keys() )
+        except Exception as e:
+            logger.error( f"Failed to populate template dependencies: {e}" )
+            return
 
-            # Set the dependencies for this template
-            template.dependencies.set(dependent_templates)
+    # Resolve Template objects (exclude missing templates)
+    Through = models.Template.dependencies.through
+    rows = [
+        Through( from_template_id=templates[tid], to_template_id=templates[dep_tid] )
+        for tid, dep_tids in dependencies.items()
+        for dep_tid in dep_tids
+        if tid in templates and dep_tid in templates
+    ]
 
-        except Exception as e:
-            logger.error(f"Failed to populate dependencies for template {template.name} ({template.templateid}): {e}")
+    # Replace the dependencies for all templates
+    with transaction.atomic():
+        Through.objects.all().delete()
+        Through.objects.bulk_create( rows, batch_size=1000 )
 
 
 # ------------------------------------------------------------------------------
@@ -195,6 +248,9 @@ def validate_templates(templateids: list):
     Validate that selected templates can be combined without conflicts
     and all dependencies are included.
     
+    Uses the cached template graph index, so no queries are issued once
+    the index has been built.
+    
     Args:
         templateids (list[int]): List of template IDs to validate.
     
@@ -202,50 +258,25 @@ def validate_templates(templateids: list):
         bool: True if valid, raises Exception otherwise.
     """
 
-    seen = {}
-    template_objects = models.Template.objects.filter( templateid__in=templateids )
-
-    def get_all_parents(template, visited=None):
-        """Recursively collect all parents of a template."""
-        if visited is None:
-            visited = set()
-        if template.id in visited:
-            return set()
-        visited.add( template.id )
-
-        parents = set(template.parents.all())
-        for parent in template.parents.all():
-            parents |= get_all_parents( parent, visited )
-        return parents
-
-    def get_all_dependencies(template, visited=None):
-        """Recursively collect all dependencies of a template."""
-        if visited is None:
-            visited = set()
-        if template.id in visited:
-            return set()
-        visited.add( template.id )
-
-        deps = set( template.dependencies.all() )
-        for dep in template.dependencies.all():
-            deps |= get_all_dependencies( dep, visited )
-        return deps
-
-    for template in template_objects:
+    seen  = {}
+    graph = get_template_graph()
+    selected = { str( tid ) for tid in templateids }
+
+    for template in graph.get_nodes( templateids ):
         # Check for conflicts through parent inheritance
-        inherited_templates = {template} | get_all_parents( template )
-        for inherited_template in inherited_templates:
-            if inherited_template.id in seen:
+        for inherited_id in sorted( { template.id } | template.ancestors ):
+            if inherited_id in seen:
                 raise Exception(
                     f"Conflict: '{template.name}' and "
-                    f"'{seen[inherited_template.id].name}' both include "
-                    f"'{inherited_template.name}'"
+                    f"'{seen[inherited_id].name}' both include "
+                    f"'{graph.nodes[inherited_id].name}'"
                 )
-            seen[inherited_template.id] = template
+            seen[inherited_id] = template
 
         # Check for missing dependencies (recursive)
-        for dependent_template in get_all_dependencies( template ):
-            if dependent_template.templateid not in templateids:
+        for dependent_id in sorted( template.dependencies ):
+            dependent_template = graph.nodes[dependent_id]
+            if dependent_template.templateid not in selected:
                 raise Exception(
                     f"Missing dependency: '{template.name}' depends on "
                     f"'{dependent_template.name}', which is not included."
@@ -258,6 +289,9 @@ def validate_template_interface(templateids: list, interface_type):
     """
     Validate that templates are compatible with a specified interface type.
     
+    Uses the precomputed required interface types of the cached template
+    graph index.
+    
     Args:
         templateids (list[int]): List of template IDs.
         interface_type (InterfaceTypeChoices): Interface type to validate.
@@ -266,53 +300,18 @@ def validate_template_interface(templateids: list, interface_type):
         bool: True if all templates are compatible, raises Exception otherwise.
     """
 
-    template_objects = models.Template.objects.filter( templateid__in=templateids )
-
-    def get_all_parents(template, visited=None):
-        """Recursively collect all parents of a template."""
-        if visited is None:
-            visited = set()
-        if template.id in visited:
-            return set()
-        visited.add( template.id )
-
-        parents = set( template.parents.all() )
-        for parent in template.parents.all():
-            parents |= get_all_parents( parent, visited )
-        return parents
-
-    def get_all_dependencies(template, visited=None):
-        """Recursively collect all dependencies of a template."""
-        
-        if visited is None:
-            visited = set()
-        
-        if template.id in visited:
-            return set()
-        
-        visited.add( template.id )
-
-        deps = set( template.dependencies.all() )
-        for dep in template.dependencies.all():
-            deps |= get_all_dependencies( dep, visited )
-        
-        return deps
-
-    def is_interface_compatible(template_iftype, target_iftype):
-        """Check if a template interface type is compatible with target type."""
-        
-        if target_iftype == models.InterfaceTypeChoices.Any:
-            return True
-        
-        if template_iftype == models.InterfaceTypeChoices.Any:
-            return True
-        
-        return template_iftype == target_iftype
-
-    for template in template_objects:
-        all_related = {template} | get_all_parents(template) | get_all_dependencies(template)
-        for related_template in all_related:
-            if not is_interface_compatible( related_template.interface_type, interface_type ):
+    if interface_type == models.InterfaceTypeChoices.Any:
+        return True
+
+    graph = get_template_graph()
+
+    for template in graph.get_nodes( templateids ):
+        if not ( template.required_interface_types - { interface_type } ):
+            continue
+
+        # Find the template that causes the mismatch for the error message
+        for related_template in graph.related( template ):
+            if related_template.interface_type not in ( models.InterfaceTypeChoices.Any, interface_type ):
                 raise Exception(
                     f"Interface type mismatch: '{related_template.name}' "
                     f"requires {models.InterfaceTypeChoices(related_template.interface_type).label}, "
@@ -12,6 +12,8 @@ It includes:
 - Interface-level validation, including IP/DNS resolution, type checks,
   duplication detection, and NetBox interface mapping
 - Lightweight validations used by streamlined workflows such as Quick Add
+- Batch validation of many hosts, e.g. a page of importable hosts, with
+  one chunked `host.get` and prefetched NetBox IPs and templates
 
 These checks ensure data integrity and prevent invalid or inconsistent Zabbix
 configurations from being imported into NetBox.
@@ -24,6 +26,10 @@ from typing import Union
 # Third-party imports
 import netaddr
 
+# Django imports
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import F
+
 # NetBox imports
 from dcim.models import Device
 from virtualization.models import VirtualMachine
@@ -31,9 +37,70 @@ from ipam.models import IPAddress
 
 # NetBox Zabbix Imports
 from netbox_zabbix import models
+from netbox_zabbix.netbox.host_config import attach_host_configs
+from netbox_zabbix.zabbix import api as zapi
+
+
+def _index_addresses(ips):
+    """
+    Index IP addresses by address and by DNS name.
+
+    Args:
+        ips (Iterable[IPAddress]): IP addresses.
+
+    Returns:
+        tuple[dict, dict]: IPs keyed by address string and by lowercase DNS name.
+    """
+    netbox_ips = {}
+    netbox_dns = {}
+    for ip in ips:
+        if ip.address:
+            netbox_ips[str( netaddr.IPAddress( ip.address.ip ) )] = ip
+        if ip.dns_name:
+            netbox_dns[ip.dns_name.lower()] = ip
+    return netbox_ips, netbox_dns
+
+
+def get_netbox_addresses(host: Union[Device, VirtualMachine]):
+    """
+    Return the IP addresses assigned to the interfaces of a host.
+
+    Args:
+        host (Device | VirtualMachine): The host.
 
+    Returns:
+        tuple[dict, dict]: IPs keyed by address string and by lowercase DNS name.
+    """
+    # Determine the correct IPAddress foreign key field based on host type
+    ip_field = "interface__device" if isinstance( host, Device ) else "vminterface__virtual_machine"
+    return _index_addresses( IPAddress.objects.filter( **{ip_field: host} ) )
 
-def validate_zabbix_host(zabbix_host: dict, host: Union[Device, VirtualMachine]) -> bool:
+
+def prefetch_netbox_addresses(hosts):
+    """
+    Return the IP addresses of many hosts, with one query per host type.
+
+    Args:
+        hosts (Iterable[Device | VirtualMachine]): The hosts.
+
+    Returns:
+        dict: Mapping of (model, pk) to the result of `get_netbox_addresses`.
+    """
+    device_ids = { host.pk for host in hosts if isinstance( host, Device ) }
+    vm_ids     = { host.pk for host in hosts if isinstance( host, VirtualMachine ) }
+
+    grouped = {}
+    if device_ids:
+        for ip in IPAddress.objects.filter( interface__device_id__in=device_ids ).annotate( owner_id=F( "interface__device_id" ) ):
+            grouped.setdefault( ( Device, ip.owner_id ), [] ).append( ip )
+    if vm_ids:
+        for ip in IPAddress.objects.filter( vminterface__virtual_machine_id__in=vm_ids ).annotate( owner_id=F( "vminterface__virtual_machine_id" ) ):
+            grouped.setdefault( ( VirtualMachine, ip.owner_id ), [] ).append( ip )
+
+    return { key: _index_addresses( ips ) for key, ips in grouped.items() }
+
+
+def validate_zabbix_host(zabbix_host: dict, host: Union[Device, VirtualMachine], templateids=None, addresses=None) -> bool:
     """
     Validate a Zabbix host definition against the corresponding NetBox host.
     
@@ -49,6 +116,10 @@ def validate_zabbix_host(zabbix_host: dict, host: Union[Device, VirtualMachine])
     Args:
         zabbix_host (dict): Zabbix host data from API.
         host (Device | VirtualMachine): Corresponding NetBox object.
+        templateids (set[str], optional): Zabbix IDs of the templates in NetBox.
+            Queried per template if not given.
+        addresses (tuple[dict, dict], optional): Prefetched NetBox IPs of the
+            host, see `get_netbox_addresses`.
     
     Returns:
         dict: Validation result message and optional data.
@@ -78,28 +149,17 @@ def validate_zabbix_host(zabbix_host: dict, host: Union[Device, VirtualMachine])
     for tmpl in zabbix_templates:
         template_id = tmpl.get( "templateid" )
         template_name = tmpl.get( "name" )
-        if not models.Template.objects.filter( templateid=template_id ).exists():
+        if templateids is not None:
+            exists = str( template_id ) in templateids
+        else:
+            exists = models.Template.objects.filter( templateid=template_id ).exists()
+        if not exists:
             raise Exception( f"Template '{template_name}' (ID {template_id}) not found in NetBox" )
 
     # Validate interfaces
     valid_interface_types = {1, 2}  # 1 = Agent, 2 = SNMP
 
-    # Determine the correct IPAddress foreign key field based on host type
-    ip_field = "interface" if isinstance( host, Device ) else "vminterface"
-    
-
-    netbox_ips = {
-        str( netaddr.IPAddress( ip.address.ip ) ): ip
-        for iface in host.interfaces.all()
-        for ip in IPAddress.objects.filter( **{ip_field: iface} )
-        if ip.address
-    }
-    netbox_dns = {
-        ip.dns_name.lower(): ip
-        for iface in host.interfaces.all()
-        for ip in IPAddress.objects.filter( **{ip_field: iface} )
-        if ip.dns_name
-    }
+    netbox_ips, netbox_dns = addresses if addresses is not None else get_netbox_addresses( host )
 
     interfaces = zabbix_host.get( "interfaces", [] )
 
@@ -184,6 +244,59 @@ def validate_zabbix_host(zabbix_host: dict, host: Union[Device, VirtualMachine])
     return { "message": f"'{host.name}' is valid", "data": {} }
 
 
+def validate_zabbix_hosts(hosts):
+    """
+    Validate many NetBox hosts against Zabbix in bulk.
+    
+    The Zabbix hosts are fetched with chunked `host.get` calls, and the
+    NetBox templates, IP addresses and HostConfigs of all hosts are loaded
+    up front. Each host is then checked with `validate_zabbix_host`. Nothing
+    is written to the EventLog.
+    
+    Args:
+        hosts (Iterable[Device | VirtualMachine]): Hosts to validate.
+    
+    Returns:
+        dict: Mapping of (content type id, pk) to the validation error, or
+              None if the host is valid.
+    """
+    hosts = attach_host_configs( hosts )
+    if not hosts:
+        return {}
+
+    keys = { id( host ): ( ContentType.objects.get_for_model( host ).pk, host.pk ) for host in hosts }
+
+    try:
+        zabbix_hosts = zapi.get_hosts_by_names( host.name for host in hosts )
+    except Exception as e:
+        return { key: e for key in keys.values() }
+
+    templateids = {
+        str( tmpl.get( "templateid" ) )
+        for matches in zabbix_hosts.values()
+        for zabbix_host in matches
+        for tmpl in zabbix_host.get( "parentTemplates", [] )
+    }
+    templateids = set( models.Template.objects.filter( templateid__in=templateids ).values_list( "templateid", flat=True ) )
+    addresses   = prefetch_netbox_addresses( hosts )
+
+    reasons = {}
+    for host in hosts:
+        matches = zabbix_hosts.get( host.name, [] )
+        try:
+            if not matches:
+                raise Exception( f"No host named '{host.name}' found in Zabbix" )
+            if len( matches ) > 1:
+                raise Exception( f"Multiple hosts named '{host.name}' found in Zabbix" )
+
+            validate_zabbix_host( matches[0], host, templateids=templateids, addresses=addresses.get( ( Device if isinstance( host, Device ) else VirtualMachine, host.pk ), ( {}, {} ) ) )
+            reasons[keys[id( host )]] = None
+        except Exception as e:
+            reasons[keys[id( host )]] = e
+
+    return reasons
+
+
 def validate_quick_add( host ):
     """
     Validate a host before performing a Quick Add operation.
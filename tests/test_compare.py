@@ -0,0 +1,59 @@
+"""Tests for the list diffing of `netbox_zabbix.netbox.compare`."""
+
+from django.test import SimpleTestCase
+
+from netbox_zabbix.netbox.compare import (
+    PAIRWISE_DIFF_LIMIT,
+    _list_difference,
+    _list_difference_pairwise,
+)
+
+
+def interfaces(start, stop):
+    return [ { "type": "1", "ip": f"10.0.{i // 256}.{i % 256}", "port": "10050" } for i in range( start, stop ) ]
+
+
+class ListDifferenceTestCase(SimpleTestCase):
+    """
+    `_list_difference` must return exactly what `_list_difference_pairwise` returns.
+    """
+
+    def assertSameAsPairwise(self, obj_a, obj_b):
+        self.assertEqual( _list_difference( obj_a, obj_b ), _list_difference_pairwise( obj_a, obj_b ) )
+
+    def test_large_lists_use_set_based_path(self):
+        obj_a, obj_b = interfaces( 0, 100 ), interfaces( 50, 150 )
+        self.assertGreater( len( obj_a ) * len( obj_b ), PAIRWISE_DIFF_LIMIT )
+        self.assertSameAsPairwise( obj_a, obj_b )
+
+    def test_small_lists(self):
+        self.assertSameAsPairwise( interfaces( 0, 5 ), interfaces( 3, 8 ) )
+
+    def test_empty_lists(self):
+        self.assertSameAsPairwise( [], interfaces( 0, 100 ) )
+        self.assertSameAsPairwise( interfaces( 0, 100 ), [] )
+
+    def test_duplicates_and_order_are_preserved(self):
+        obj_a = interfaces( 0, 60 ) * 2
+        obj_b = list( reversed( interfaces( 30, 90 ) ) ) * 2
+        self.assertSameAsPairwise( obj_a, obj_b )
+
+    def test_nested_values(self):
+        obj_a = [ { "details": { "version": "3", "bulk": "1" }, "tags": [ "a", i ] } for i in range( 80 ) ]
+        obj_b = [ { "tags": [ "a", i ], "details": { "bulk": "1", "version": "3" } } for i in range( 40, 120 ) ]
+        self.assertSameAsPairwise( obj_a, obj_b )
+
+    def test_dict_and_list_do_not_collide(self):
+        obj_a = [ { "a": 1 } ] * 60
+        obj_b = [ [ [ "a", 1 ] ] ] * 60
+        self.assertSameAsPairwise( obj_a, obj_b )
+
+    def test_equal_numbers_of_different_types(self):
+        obj_a = [ 1, 2.0, True ] * 30
+        obj_b = [ 1.0, 2, 0 ] * 30
+        self.assertSameAsPairwise( obj_a, obj_b )
+
+    def test_unhashable_values_fall_back_to_pairwise(self):
+        obj_a = [ { "ip": f"10.0.0.{i}", "ports": { i } } for i in range( 60 ) ]
+        obj_b = [ { "ip": f"10.0.0.{i}", "ports": { i } } for i in range( 30, 90 ) ]
+        self.assertSameAsPairwise( obj_a, obj_b )
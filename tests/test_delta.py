@@ -0,0 +1,128 @@
+"""Tests for the update delta of `netbox_zabbix.netbox.compare`."""
+
+from django.test import SimpleTestCase
+
+from netbox_zabbix.netbox.compare import (
+    build_update_delta,
+    changed_host_keys,
+    interfaces_changed,
+)
+
+
+def agent_interface(**kwargs):
+    interface = { "interfaceid": "11", "type": "1", "main": "1", "useip": "1", "ip": "10.0.0.1", "dns": "", "port": "10050" }
+    interface.update( kwargs )
+    return interface
+
+
+def snmp_interface(**kwargs):
+    interface = {
+        "interfaceid": "12", "type": "2", "main": "1", "useip": "1", "ip": "10.0.0.1", "dns": "", "port": "161",
+        "details": { "version": "2", "bulk": "1", "community": "public" },
+    }
+    interface.update( kwargs )
+    return interface
+
+
+def zabbix_host(**kwargs):
+    host = {
+        "hostid":         "101",
+        "host":           "web01",
+        "name":           "web01",
+        "status":         "0",
+        "monitored_by":   "0",
+        "proxyid":        "0",
+        "proxy_groupid":  "0",
+        "inventory_mode": "-1",
+        "description":    "",
+        "tags":           [ { "tag": "site", "value": "dc1" }, { "tag": "role", "value": "web" } ],
+        "groups":         [ { "groupid": "2" }, { "groupid": "5" } ],
+        "templates":      [ { "templateid": "10001" } ],
+        "interfaces":     [ agent_interface(), snmp_interface() ],
+    }
+    host.update( kwargs )
+    return host
+
+
+def payload(**kwargs):
+    host = zabbix_host()
+    host.update( {
+        "tags":      [ { "tag": "role", "value": "web" }, { "tag": "site", "value": "dc1" } ],
+        "groups":    [ { "groupid": "5" }, { "groupid": "2" } ],
+    } )
+    host.update( kwargs )
+    return host
+
+
+class InterfacesChangedTestCase(SimpleTestCase):
+
+    def test_same_interfaces(self):
+        self.assertFalse( interfaces_changed( [ agent_interface(), snmp_interface() ], [ agent_interface(), snmp_interface() ] ) )
+
+    def test_added_interface(self):
+        self.assertTrue( interfaces_changed( [ agent_interface(), snmp_interface() ], [ agent_interface() ] ) )
+
+    def test_changed_port(self):
+        self.assertTrue( interfaces_changed( [ agent_interface( port="10051" ) ], [ agent_interface() ] ) )
+
+    def test_snmp_details_after_agent_interface(self):
+        changed = snmp_interface( details={ "version": "2", "bulk": "1", "community": "secret" } )
+        self.assertTrue( interfaces_changed( [ agent_interface(), changed ], [ agent_interface(), snmp_interface() ] ) )
+
+    def test_unknown_interfaceid(self):
+        self.assertTrue( interfaces_changed( [ agent_interface( interfaceid="99" ) ], [ agent_interface() ] ) )
+
+    def test_match_without_interfaceid(self):
+        new = agent_interface()
+        del new["interfaceid"]
+        self.assertFalse( interfaces_changed( [ new ], [ agent_interface() ] ) )
+        self.assertTrue( interfaces_changed( [ dict( new, ip="10.0.0.2" ) ], [ agent_interface() ] ) )
+
+    def test_extra_zabbix_fields_are_ignored(self):
+        self.assertFalse( interfaces_changed( [ agent_interface() ], [ agent_interface( available="1", error="" ) ] ) )
+
+
+class ChangedHostKeysTestCase(SimpleTestCase):
+
+    def test_unchanged_host(self):
+        self.assertEqual( changed_host_keys( payload(), zabbix_host() ), set() )
+
+    def test_changed_scalar(self):
+        self.assertEqual( changed_host_keys( payload( status="1" ), zabbix_host() ), { "status" } )
+
+    def test_changed_tag_value(self):
+        tags = [ { "tag": "role", "value": "db" }, { "tag": "site", "value": "dc1" } ]
+        self.assertEqual( changed_host_keys( payload( tags=tags ), zabbix_host() ), { "tags" } )
+
+    def test_removed_template(self):
+        self.assertEqual( changed_host_keys( payload( templates=[] ), zabbix_host() ), { "templates" } )
+
+    def test_changed_interface(self):
+        interfaces = [ agent_interface( ip="10.0.0.2" ), snmp_interface() ]
+        self.assertEqual( changed_host_keys( payload( interfaces=interfaces ), zabbix_host() ), { "interfaces" } )
+
+    def test_key_group_is_sent_together(self):
+        changed = changed_host_keys( payload( monitored_by="1", proxyid="7" ), zabbix_host() )
+        self.assertEqual( changed, { "monitored_by", "proxyid", "proxy_groupid" } )
+
+    def test_key_group_only_includes_payload_keys(self):
+        host = payload( inventory_mode="0" )
+        self.assertEqual( changed_host_keys( host, zabbix_host() ), { "inventory_mode" } )
+
+    def test_key_missing_in_zabbix_is_changed(self):
+        host = payload( tls_psk_identity="psk01", tls_psk="0123" )
+        self.assertEqual( changed_host_keys( host, zabbix_host( tls_psk_identity="psk01" ) ), { "tls_psk_identity", "tls_psk" } )
+
+    def test_zabbix_only_keys_are_ignored(self):
+        self.assertEqual( changed_host_keys( payload(), zabbix_host( maintenance_status="1" ) ), set() )
+
+
+class BuildUpdateDeltaTestCase(SimpleTestCase):
+
+    def test_unchanged_host_only_has_hostid(self):
+        self.assertEqual( build_update_delta( payload(), zabbix_host() ), { "hostid": "101" } )
+
+    def test_changed_keys_are_sent_in_full(self):
+        groups = [ { "groupid": "2" }, { "groupid": "5" }, { "groupid": "8" } ]
+        delta  = build_update_delta( payload( groups=groups, description="web server" ), zabbix_host() )
+        self.assertEqual( delta, { "hostid": "101", "description": "web server", "groups": groups } )
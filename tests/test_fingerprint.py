@@ -0,0 +1,61 @@
+"""Tests for the payload fingerprint of `netbox_zabbix.zabbix.builders`."""
+
+from django.test import SimpleTestCase
+
+from netbox_zabbix.zabbix.builders import payload_fingerprint
+
+
+def payload(**kwargs):
+    host = {
+        "host":       "web01",
+        "name":       "web01",
+        "status":     0,
+        "tags":       [ { "tag": "site", "value": "dc1" }, { "tag": "role", "value": "web" } ],
+        "groups":     [ { "groupid": 2 }, { "groupid": 5 } ],
+        "templates":  [ { "templateid": 10001 }, { "templateid": 10002 } ],
+        "interfaces": [ { "type": 1, "main": 1, "useip": 1, "ip": "10.0.0.1", "dns": "", "port": "10050" } ],
+    }
+    host.update( kwargs )
+    return host
+
+
+class PayloadFingerprintTestCase(SimpleTestCase):
+
+    def test_same_payload(self):
+        self.assertEqual( payload_fingerprint( payload() ), payload_fingerprint( payload() ) )
+
+    def test_key_order_is_ignored(self):
+        reordered = dict( reversed( list( payload().items() ) ) )
+        self.assertEqual( payload_fingerprint( reordered ), payload_fingerprint( payload() ) )
+
+    def test_tag_group_and_template_order_is_ignored(self):
+        reordered = payload(
+            tags=[ { "value": "web", "tag": "role" }, { "tag": "site", "value": "dc1" } ],
+            groups=[ { "groupid": 5 }, { "groupid": 2 } ],
+            templates=[ { "templateid": 10002 }, { "templateid": 10001 } ],
+        )
+        self.assertEqual( payload_fingerprint( reordered ), payload_fingerprint( payload() ) )
+
+    def test_create_and_update_payload_match(self):
+        interfaces = [ dict( payload()["interfaces"][0], interfaceid="11" ) ]
+        update     = payload( hostid="101", templates_clear=[], interfaces=interfaces )
+        self.assertEqual( payload_fingerprint( update ), payload_fingerprint( payload() ) )
+
+    def test_changed_value(self):
+        self.assertNotEqual( payload_fingerprint( payload( status=1 ) ), payload_fingerprint( payload() ) )
+
+    def test_changed_tag_value(self):
+        tags = [ { "tag": "site", "value": "dc2" }, { "tag": "role", "value": "web" } ]
+        self.assertNotEqual( payload_fingerprint( payload( tags=tags ) ), payload_fingerprint( payload() ) )
+
+    def test_changed_interface_details(self):
+        snmp = { "type": 2, "main": 1, "useip": 1, "ip": "10.0.0.1", "dns": "", "port": "161", "details": { "community": "public" } }
+        changed = dict( snmp, details={ "community": "secret" } )
+        self.assertNotEqual( payload_fingerprint( payload( interfaces=[ snmp ] ) ), payload_fingerprint( payload( interfaces=[ changed ] ) ) )
+
+    def test_payload_is_not_modified(self):
+        host = payload( hostid="101", interfaces=[ dict( payload()["interfaces"][0], interfaceid="11" ) ] )
+        expected = dict( host )
+        payload_fingerprint( host )
+        self.assertEqual( host, expected )
+        self.assertEqual( host["interfaces"][0]["interfaceid"], "11" )
@@ -0,0 +1,69 @@
+"""Tests for the bulk host fetch of `netbox_zabbix.zabbix.api`."""
+
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from netbox_zabbix.zabbix.api import HOST_COMPARE_OUTPUT, get_hosts_by_ids
+
+
+def fake_client(missing=()):
+    client = mock.Mock()
+
+    def host_get(hostids, **kwargs):
+        return [ { "hostid": hostid, "parentTemplates": [ { "templateid": "1" } ] } for hostid in hostids if hostid not in missing ]
+
+    client.host.get.side_effect = host_get
+    return client
+
+
+class GetHostsByIdsTestCase(SimpleTestCase):
+
+    def get_hosts(self, client, *args, **kwargs):
+        with mock.patch( "netbox_zabbix.zabbix.api.get_zabbix_client", return_value=client ):
+            return get_hosts_by_ids( *args, **kwargs )
+
+    def test_hosts_are_fetched_in_chunks(self):
+        client = fake_client()
+        hosts  = self.get_hosts( client, [ 5, 1, 4, 2, 3 ], chunk_size=2 )
+
+        self.assertEqual( [ c.kwargs["hostids"] for c in client.host.get.call_args_list ], [ [ "1", "2" ], [ "3", "4" ], [ "5" ] ] )
+        self.assertEqual( sorted( hosts ), [ "1", "2", "3", "4", "5" ] )
+
+    def test_duplicate_and_empty_ids_are_dropped(self):
+        client = fake_client()
+        self.get_hosts( client, [ "7", 7, None, "", 0 ] )
+
+        client.host.get.assert_called_once()
+        self.assertEqual( client.host.get.call_args.kwargs["hostids"], [ "7" ] )
+
+    def test_no_ids_skip_the_api(self):
+        client = fake_client()
+        self.assertEqual( self.get_hosts( client, [] ), {} )
+        client.host.get.assert_not_called()
+
+    def test_missing_hosts_are_left_out(self):
+        hosts = self.get_hosts( fake_client( missing={ "2" } ), [ 1, 2, 3 ] )
+        self.assertEqual( sorted( hosts ), [ "1", "3" ] )
+
+    def test_fields_are_projected(self):
+        client = fake_client()
+        self.get_hosts( client, [ 1 ] )
+        self.assertEqual( client.host.get.call_args.kwargs["output"], HOST_COMPARE_OUTPUT )
+
+        self.get_hosts( client, [ 1 ], output=[ "hostid", "host" ] )
+        self.assertEqual( client.host.get.call_args.kwargs["output"], [ "hostid", "host" ] )
+
+    def test_parent_templates_are_renamed(self):
+        host = self.get_hosts( fake_client(), [ 1 ] )["1"]
+        self.assertEqual( host["templates"], [ { "templateid": "1" } ] )
+        self.assertNotIn( "parentTemplates", host )
+
+        host = self.get_hosts( fake_client(), [ 1 ], with_templates=False )["1"]
+        self.assertIn( "parentTemplates", host )
+
+    def test_api_errors_are_raised(self):
+        client = fake_client()
+        client.host.get.side_effect = RuntimeError( "timeout" )
+        with self.assertRaises( Exception ):
+            self.get_hosts( client, [ 1 ] )
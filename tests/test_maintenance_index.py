@@ -0,0 +1,122 @@
+"""Tests for the change detection of the maintenance membership index."""
+
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from dcim.models import Device
+
+from netbox_zabbix.models import HostConfig
+from netbox_zabbix.signals.signals import (
+    refresh_device_or_vm_membership_on_change,
+    refresh_host_config_membership_on_save,
+)
+
+
+def loaded_host_config(**kwargs):
+    host_config = HostConfig( pk=1, monitored_by=0, content_type_id=5, object_id=10, **kwargs )
+    host_config._loaded_maintenance_scope = host_config.get_maintenance_scope()
+    return host_config
+
+
+class MaintenanceScopeTestCase(SimpleTestCase):
+
+    def test_unsaved_instance_has_changed(self):
+        self.assertTrue( HostConfig( monitored_by=0 ).maintenance_scope_changed() )
+
+    def test_loaded_instance_is_unchanged(self):
+        self.assertFalse( loaded_host_config().maintenance_scope_changed() )
+
+    def test_changed_proxy(self):
+        host_config = loaded_host_config()
+        host_config.proxy_id = 3
+        self.assertTrue( host_config.maintenance_scope_changed() )
+
+    def test_changed_assigned_object(self):
+        host_config = loaded_host_config()
+        host_config.object_id = 11
+        self.assertTrue( host_config.maintenance_scope_changed() )
+
+    def test_other_fields_are_ignored(self):
+        host_config = loaded_host_config()
+        host_config.description = "changed"
+        self.assertFalse( host_config.maintenance_scope_changed() )
+
+
+@mock.patch( "netbox_zabbix.signals.signals.transaction" )
+class HostConfigSaveTestCase(SimpleTestCase):
+
+    def save(self, host_config, created=False, update_fields=None):
+        refresh_host_config_membership_on_save( HostConfig, host_config, created, update_fields=update_fields )
+
+    def test_created_is_rebuilt(self, transaction):
+        host_config = loaded_host_config()
+        host_config._skip_signal = True
+        self.save( host_config, created=True )
+        transaction.on_commit.assert_called_once()
+
+    def test_unchanged_scope_is_skipped(self, transaction):
+        self.save( loaded_host_config() )
+        transaction.on_commit.assert_not_called()
+
+    def test_changed_scope_is_rebuilt_once(self, transaction):
+        host_config = loaded_host_config()
+        host_config.monitored_by = 1
+        self.save( host_config )
+        self.save( host_config )
+        transaction.on_commit.assert_called_once()
+
+    def test_skip_signal_is_skipped(self, transaction):
+        host_config = loaded_host_config()
+        host_config.monitored_by = 1
+        host_config._skip_signal = True
+        self.save( host_config )
+        transaction.on_commit.assert_not_called()
+
+    def test_update_fields_outside_scope_are_skipped(self, transaction):
+        host_config = loaded_host_config()
+        host_config.monitored_by = 1
+        self.save( host_config, update_fields=frozenset( { "last_sync_update" } ) )
+        transaction.on_commit.assert_not_called()
+
+    def test_update_fields_in_scope_are_rebuilt(self, transaction):
+        host_config = loaded_host_config()
+        host_config.proxy_id = 3
+        self.save( host_config, update_fields=frozenset( { "proxy" } ) )
+        transaction.on_commit.assert_called_once()
+
+
+@mock.patch( "netbox_zabbix.signals.signals.transaction" )
+class DeviceMoveTestCase(SimpleTestCase):
+
+    def device(self):
+        device = Device( pk=1, site_id=1, cluster_id=None )
+        device.host_config = SimpleNamespace( pk=7 )
+        return device
+
+    def test_unmoved_device_is_skipped(self, transaction):
+        device = self.device()
+        device.name = "renamed"
+        refresh_device_or_vm_membership_on_change( Device, device )
+        transaction.on_commit.assert_not_called()
+
+    def test_moved_device_is_rebuilt_once(self, transaction):
+        device = self.device()
+        device.site_id = 2
+        refresh_device_or_vm_membership_on_change( Device, device )
+        refresh_device_or_vm_membership_on_change( Device, device )
+        transaction.on_commit.assert_called_once()
+
+    def test_moved_device_without_host_config(self, transaction):
+        device = self.device()
+        device.host_config = None
+        device.cluster_id = 4
+        refresh_device_or_vm_membership_on_change( Device, device )
+        transaction.on_commit.assert_not_called()
+
+    def test_new_device_is_skipped(self, transaction):
+        device = Device( site_id=1 )
+        device.site_id = 2
+        refresh_device_or_vm_membership_on_change( Device, device )
+        transaction.on_commit.assert_not_called()
@@ -0,0 +1,63 @@
+"""Tests for the path compilation of `netbox_zabbix.mapping.plans`."""
+
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+
+from dcim.models import Device
+
+from netbox_zabbix.mapping.plans import compile_path, path_lookups
+
+
+class Manager:
+
+    def __init__(self, items):
+        self.items = items
+
+    def all(self):
+        return iter( self.items )
+
+
+class CompilePathTestCase(SimpleTestCase):
+
+    def test_nested_attribute(self):
+        obj = SimpleNamespace( site=SimpleNamespace( name="dc1" ) )
+        self.assertEqual( compile_path( "site.name" )( obj ), "dc1" )
+
+    def test_missing_attribute(self):
+        obj = SimpleNamespace( site=SimpleNamespace( name="dc1" ) )
+        self.assertIsNone( compile_path( "site.region.name" )( obj ) )
+
+    def test_none_in_path(self):
+        obj = SimpleNamespace( location=None )
+        self.assertIsNone( compile_path( "location.site.name" )( obj ) )
+
+    def test_manager_is_listed(self):
+        obj = SimpleNamespace( tags=Manager( [ "web", "prod" ] ) )
+        self.assertEqual( compile_path( "tags" )( obj ), [ "web", "prod" ] )
+
+    def test_getter_is_reusable(self):
+        getter = compile_path( "site.name" )
+        self.assertEqual( getter( SimpleNamespace( site=SimpleNamespace( name="dc1" ) ) ), "dc1" )
+        self.assertEqual( getter( SimpleNamespace( site=SimpleNamespace( name="dc2" ) ) ), "dc2" )
+
+
+class PathLookupsTestCase(SimpleTestCase):
+
+    def test_local_field(self):
+        self.assertEqual( path_lookups( Device, "name" ), ( None, None ) )
+
+    def test_forward_foreign_key(self):
+        self.assertEqual( path_lookups( Device, "site.name" ), ( "site", None ) )
+
+    def test_nested_foreign_keys(self):
+        self.assertEqual( path_lookups( Device, "location.site.latitude" ), ( "location__site", None ) )
+
+    def test_many_to_many(self):
+        self.assertEqual( path_lookups( Device, "tags" ), ( None, "tags" ) )
+
+    def test_many_to_many_below_foreign_key(self):
+        self.assertEqual( path_lookups( Device, "site.tags" ), ( "site", "site__tags" ) )
+
+    def test_unknown_field(self):
+        self.assertEqual( path_lookups( Device, "no_such_field.name" ), ( None, None ) )
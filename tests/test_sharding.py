@@ -0,0 +1,33 @@
+"""Tests for the host sharding of `netbox_zabbix.jobs.synchosts`."""
+
+from django.test import SimpleTestCase
+
+from netbox_zabbix.jobs.synchosts import shard_pk_ranges
+
+
+class ShardPkRangesTestCase(SimpleTestCase):
+
+    def test_even_split(self):
+        self.assertEqual( shard_pk_ranges( [ 1, 2, 3, 4, 5, 6 ], 3 ), [ ( 1, 2 ), ( 3, 4 ), ( 5, 6 ) ] )
+
+    def test_remainder_goes_to_the_first_ranges(self):
+        self.assertEqual( shard_pk_ranges( [ 1, 2, 3, 4, 5, 6, 7 ], 3 ), [ ( 1, 3 ), ( 4, 5 ), ( 6, 7 ) ] )
+
+    def test_gaps_in_pks(self):
+        self.assertEqual( shard_pk_ranges( [ 3, 10, 11, 40, 41, 90 ], 2 ), [ ( 3, 11 ), ( 40, 90 ) ] )
+
+    def test_more_shards_than_pks(self):
+        self.assertEqual( shard_pk_ranges( [ 5, 8 ], 4 ), [ ( 5, 5 ), ( 8, 8 ) ] )
+
+    def test_single_shard(self):
+        self.assertEqual( shard_pk_ranges( [ 1, 2, 3 ], 1 ), [ ( 1, 3 ) ] )
+        self.assertEqual( shard_pk_ranges( [ 1, 2, 3 ], 0 ), [ ( 1, 3 ) ] )
+
+    def test_no_pks(self):
+        self.assertEqual( shard_pk_ranges( [], 4 ), [] )
+
+    def test_ranges_cover_every_pk_once(self):
+        pks    = list( range( 1, 1000, 7 ) )
+        ranges = shard_pk_ranges( pks, 6 )
+        covered = [ pk for pk in pks for pk_min, pk_max in ranges if pk_min <= pk <= pk_max ]
+        self.assertEqual( covered, pks )
@@ -0,0 +1,60 @@
+"""Tests for the trigger dependency resolution of `netbox_zabbix.zabbix.templates`."""
+
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from netbox_zabbix.zabbix.templates import get_templates_dependencies
+
+
+# Trigger ID → (owning template IDs, IDs of the triggers it depends on)
+TRIGGERS = {
+    "t1": ( [ "10" ], [ "t3" ] ),
+    "t2": ( [ "11" ], [ "t3", "t4" ] ),
+    "t3": ( [ "12" ], [] ),
+    "t4": ( [ "13", "14" ], [] ),
+    "t5": ( [ "10" ], [ "t6" ] ),
+    "t6": ( [ "10" ], [] ),
+}
+
+
+def trigger(triggerid):
+    hostids, dependencies = TRIGGERS[triggerid]
+    return {
+        "triggerid":    triggerid,
+        "hosts":        [ { "hostid": hostid } for hostid in hostids ],
+        "dependencies": [ { "triggerid": dep } for dep in dependencies ],
+    }
+
+
+def get_triggers(templateids):
+    return [ trigger( tid ) for tid, ( hostids, _ ) in TRIGGERS.items() if set( hostids ) & { str( t ) for t in templateids } ]
+
+
+def get_triggers_by_ids(triggerids, chunk_size=None):
+    return [ trigger( tid ) for tid in sorted( triggerids ) ]
+
+
+@mock.patch( "netbox_zabbix.zabbix.templates.zapi.get_triggers_by_ids", side_effect=get_triggers_by_ids )
+@mock.patch( "netbox_zabbix.zabbix.templates.zapi.get_triggers", side_effect=get_triggers )
+class GetTemplatesDependenciesTestCase(SimpleTestCase):
+
+    def test_dependencies_are_resolved(self, triggers, triggers_by_ids):
+        dependencies = get_templates_dependencies( [ 10, 11, 12, 13 ] )
+        self.assertEqual( dependencies, { 10: { 12 }, 11: { 12, 13, 14 }, 12: set(), 13: set() } )
+
+    def test_self_dependency_is_excluded(self, triggers, triggers_by_ids):
+        self.assertEqual( get_templates_dependencies( [ 10 ] ), { 10: { 12 } } )
+
+    def test_dependent_triggers_are_fetched_once(self, triggers, triggers_by_ids):
+        get_templates_dependencies( [ 10, 11, 12, 13 ] )
+        triggers_by_ids.assert_called_once()
+        self.assertEqual( set( triggers_by_ids.call_args.args[0] ), { "t3", "t4", "t6" } )
+
+    def test_triggers_are_fetched_in_chunks(self, triggers, triggers_by_ids):
+        get_templates_dependencies( [ "13", 12, 11, 10, 10 ], chunk_size=3 )
+        self.assertEqual( [ c.args[0] for c in triggers.call_args_list ], [ [ 10, 11, 12 ], [ 13 ] ] )
+
+    def test_no_dependencies_skip_the_lookup(self, triggers, triggers_by_ids):
+        self.assertEqual( get_templates_dependencies( [ 12, 13 ] ), { 12: set(), 13: set() } )
+        triggers_by_ids.assert_not_called()
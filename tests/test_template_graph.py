@@ -0,0 +1,60 @@
+"""Tests for the template graph index of `netbox_zabbix.zabbix.template_graph`."""
+
+from django.test import SimpleTestCase
+
+from netbox_zabbix.models import InterfaceTypeChoices
+from netbox_zabbix.zabbix.template_graph import TemplateGraph, TemplateNode, _closure
+
+
+def node(pk, interface_type=InterfaceTypeChoices.Any, ancestors=(), dependencies=(), required=()):
+    return TemplateNode(
+        id=pk,
+        templateid=str( 1000 + pk ),
+        name=f"Template {pk}",
+        interface_type=interface_type,
+        ancestors=frozenset( ancestors ),
+        dependencies=frozenset( dependencies ),
+        required_interface_types=frozenset( required ),
+    )
+
+
+class ClosureTestCase(SimpleTestCase):
+
+    def test_transitive_nodes(self):
+        edges = { 1: { 2 }, 2: { 3, 4 }, 4: { 5 } }
+        self.assertEqual( _closure( edges, 1 ), { 2, 3, 4, 5 } )
+
+    def test_node_without_edges(self):
+        self.assertEqual( _closure( { 1: { 2 } }, 3 ), set() )
+
+    def test_shared_nodes_are_visited_once(self):
+        edges = { 1: { 2, 3 }, 2: { 4 }, 3: { 4 } }
+        self.assertEqual( _closure( edges, 1 ), { 2, 3, 4 } )
+
+    def test_cycle_includes_start(self):
+        edges = { 1: { 2 }, 2: { 3 }, 3: { 1 } }
+        self.assertEqual( _closure( edges, 1 ), { 1, 2, 3 } )
+
+
+class TemplateGraphTestCase(SimpleTestCase):
+
+    def setUp(self):
+        self.graph = TemplateGraph( {
+            1: node( 1, ancestors={ 2 }, dependencies={ 3 } ),
+            2: node( 2, InterfaceTypeChoices.Agent ),
+            3: node( 3, InterfaceTypeChoices.SNMP ),
+        } )
+
+    def test_get_nodes(self):
+        nodes = self.graph.get_nodes( [ 1003, "1001", 9999 ] )
+        self.assertEqual( [ n.id for n in nodes ], [ 1, 3 ] )
+
+    def test_related(self):
+        self.assertEqual( [ n.id for n in self.graph.related( self.graph.nodes[1] ) ], [ 1, 2, 3 ] )
+        self.assertEqual( [ n.id for n in self.graph.related( self.graph.nodes[2] ) ], [ 2 ] )
+
+    def test_effective_interface_type(self):
+        self.assertEqual( node( 1, required={ InterfaceTypeChoices.SNMP } ).effective_interface_type, InterfaceTypeChoices.SNMP )
+        self.assertEqual( node( 1 ).effective_interface_type, InterfaceTypeChoices.Any )
+        both = { InterfaceTypeChoices.Agent, InterfaceTypeChoices.SNMP }
+        self.assertEqual( node( 1, required=both ).effective_interface_type, InterfaceTypeChoices.Any )
@@ -0,0 +1,69 @@
+"""Tests for the batched host updates of `netbox_zabbix.signals.signals`."""
+
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import TestCase
+
+from netbox_zabbix.signals.signals import HostUpdateBuffer, current_host_update_buffer, queue_host_update
+
+
+def host(pk):
+    return SimpleNamespace( pk=pk )
+
+
+@mock.patch( "netbox_zabbix.signals.signals.UpdateZabbixHosts" )
+@mock.patch( "netbox_zabbix.signals.signals.UpdateZabbixHost" )
+class HostUpdateBufferTestCase(TestCase):
+
+    def test_repeated_adds_are_merged(self, update_host, update_hosts):
+        buffer = HostUpdateBuffer()
+        buffer.add( host( 1 ), name="first", signal_id="a" )
+        buffer.add( host( 1 ), name="second", signal_id="b" )
+        buffer.add( host( 1 ), signal_id="a" )
+        buffer.flush()
+
+        update_host.run_job_debounced.assert_called_once()
+        update_hosts.run_job.assert_not_called()
+        kwargs = update_host.run_job_debounced.call_args.kwargs
+        self.assertEqual( kwargs["host_config"].pk, 1 )
+        self.assertEqual( kwargs["signal_id"], "a,b" )
+
+    def test_several_hosts_are_one_job(self, update_host, update_hosts):
+        buffer = HostUpdateBuffer()
+        for pk in ( 1, 2, 3, 2 ):
+            buffer.add( host( pk ) )
+        buffer.flush()
+
+        update_host.run_job_debounced.assert_not_called()
+        update_hosts.run_job.assert_called_once()
+        self.assertEqual( [ hc.pk for hc in update_hosts.run_job.call_args.args[0] ], [ 1, 2, 3 ] )
+
+    def test_flush_empties_the_buffer(self, update_host, update_hosts):
+        buffer = HostUpdateBuffer()
+        buffer.add( host( 1 ) )
+        buffer.flush()
+        buffer.flush()
+
+        update_host.run_job_debounced.assert_called_once()
+
+    def test_enqueue_failure_is_not_raised(self, update_host, update_hosts):
+        update_host.run_job_debounced.side_effect = RuntimeError( "queue unavailable" )
+        buffer = HostUpdateBuffer()
+        buffer.add( host( 1 ) )
+        buffer.flush()
+
+        self.assertEqual( buffer.updates, {} )
+
+    def test_transaction_is_flushed_once_on_commit(self, update_host, update_hosts):
+        with self.captureOnCommitCallbacks( execute=True ) as callbacks:
+            queue_host_update( host( 1 ), signal_id="a" )
+            queue_host_update( host( 2 ), signal_id="b" )
+            queue_host_update( host( 1 ), signal_id="c" )
+            update_hosts.run_job.assert_not_called()
+
+        self.assertEqual( len( callbacks ), 1 )
+        update_hosts.run_job.assert_called_once()
+        self.assertEqual( [ hc.pk for hc in update_hosts.run_job.call_args.args[0] ], [ 1, 2 ] )
+        self.assertEqual( update_hosts.run_job.call_args.kwargs["signal_id"], "a,b,c" )
+        self.assertIsNone( current_host_update_buffer() )